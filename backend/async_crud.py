@@ -0,0 +1,315 @@
+'''
+Async versions of the CRUD steps in crud.py, used by the async routers when
+DB_MODE=async. Queries and side effects (task counters) are the same as the
+sync ones; relationships are always loaded eagerly because lazy loads are not
+possible on an AsyncSession.
+
+The async routers run the other steps of crud.py (bulk writes, lookups, search,
+changes, stats) on their AsyncSession through run_sync, so that DB_MODE=async
+needs no sync engine.
+'''
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from backend.models.user_model import UserModel
+from backend.models.project_model import ProjectModel
+from backend.models.task_model import TaskModel
+from backend.schemas.user_schema import UserCreate, UserUpdate, UserResponse
+from backend.schemas.project_schema import ProjectCreate, ProjectUpdate, ProjectResponse
+from backend.schemas.task_schema import TaskCreate, TaskUpdate, TaskResponse
+from backend.cache import cached_async, invalidate
+from backend.table_versions import bump_version_async
+from backend.events import publish_task_event
+from backend.counters import counter_statements, count_deltas, task_counter_key, CounterKey
+from backend.crud import filter_tasks, task_export_statement, to_cache_value, tombstone_statements, DEFAULT_PAGE_SIZE
+from backend.serializers import user_rows, project_rows, task_rows
+
+
+async def _paginate(db: AsyncSession, query, key_column, limit: int, after: Optional[int], scalars: bool = True):
+    '''
+    Keyset pagination on the primary key, same contract as crud._paginate.
+    With scalars=False the rows are returned as tuples (column SELECTs).
+    '''
+    if after is not None:
+        query = query.where(key_column > after)
+    query = query.order_by(key_column).limit(limit + 1)
+    if scalars:
+        rows = (await db.scalars(query)).unique().all()
+    else:
+        rows = (await db.execute(query)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = getattr(rows[-1], key_column.key)
+    return rows, next_cursor
+
+
+async def _apply_counter_deltas(db: AsyncSession, deltas: Dict[CounterKey, int]) -> None:
+    for statement in counter_statements(db.bind.dialect.name, deltas):
+        await db.execute(statement)
+
+
+#--------------------------USER--------------------------#
+
+async def create_user(db: AsyncSession, user: UserCreate) -> UserModel:
+    db_user = UserModel(name=user.name, email=user.email, area=user.area)
+    await bump_version_async(db, "user_table")
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+
+async def get_user(db: AsyncSession, user_id: int) -> Optional[UserModel]:
+    return await db.get(UserModel, user_id)
+
+
+async def get_user_cached(db: AsyncSession, user_id: int, versions: Dict[str, int]) -> Optional[dict]:
+    async def load():
+        return to_cache_value(UserResponse, await get_user(db, user_id))
+    return await cached_async("user", user_id, load, versions)
+
+
+async def get_all_users(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+) -> Tuple[List[UserModel], Optional[int]]:
+    return await _paginate(db, select(UserModel), UserModel.user_id, limit, after)
+
+
+async def get_all_user_rows(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+) -> Tuple[List[dict], Optional[int]]:
+    rows, next_cursor = await _paginate(db, user_rows.statement(), UserModel.user_id, limit, after, scalars=False)
+    return user_rows.to_dicts(rows), next_cursor
+
+
+async def update_user(db: AsyncSession, user_id: int, user: UserUpdate) -> Optional[UserModel]:
+    db_user = await get_user(db, user_id)
+    if not db_user:
+        return None
+    await bump_version_async(db, "user_table")
+    update_data = user.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_user, key, value)
+    await db.commit()
+    await db.refresh(db_user)
+    invalidate("user", user_id)
+    invalidate("task")
+    return db_user
+
+
+async def delete_user(db: AsyncSession, user_id: int) -> Optional[UserModel]:
+    db_user = await get_user(db, user_id)
+    if db_user is None:
+        return None
+    await bump_version_async(db, "user_table")
+    await db.delete(db_user)
+    await db.commit()
+    invalidate("user", user_id)
+    invalidate("task")
+    return db_user
+
+
+# -------------------- PROJECTS -------------------- #
+async def create_project(db: AsyncSession, project: ProjectCreate) -> ProjectModel:
+    db_project = ProjectModel(project_name=project.project_name, project_description=project.project_description)
+    await bump_version_async(db, "project_table")
+    db.add(db_project)
+    await db.commit()
+    await db.refresh(db_project)
+    return db_project
+
+
+async def get_project(db: AsyncSession, project_id: int) -> Optional[ProjectModel]:
+    return await db.get(ProjectModel, project_id)
+
+
+async def get_project_cached(db: AsyncSession, project_id: int, versions: Dict[str, int]) -> Optional[dict]:
+    async def load():
+        return to_cache_value(ProjectResponse, await get_project(db, project_id))
+    return await cached_async("project", project_id, load, versions)
+
+
+async def get_all_projects(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+) -> Tuple[List[ProjectModel], Optional[int]]:
+    return await _paginate(db, select(ProjectModel), ProjectModel.project_id, limit, after)
+
+
+async def get_all_project_rows(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+) -> Tuple[List[dict], Optional[int]]:
+    rows, next_cursor = await _paginate(db, project_rows.statement(), ProjectModel.project_id, limit, after, scalars=False)
+    return project_rows.to_dicts(rows), next_cursor
+
+
+async def update_project(db: AsyncSession, project_id: int, project: ProjectUpdate) -> Optional[ProjectModel]:
+    db_project = await get_project(db, project_id)
+    if not db_project:
+        return None
+    await bump_version_async(db, "project_table")
+    update_data = project.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_project, key, value)
+    await db.commit()
+    await db.refresh(db_project)
+    invalidate("project", project_id)
+    invalidate("task")
+    return db_project
+
+
+async def delete_project(db: AsyncSession, project_id: int) -> Optional[ProjectModel]:
+    db_project = await get_project(db, project_id)
+    if db_project is None:
+        return None
+    await bump_version_async(db, "project_table")
+    await db.delete(db_project)
+    await db.commit()
+    invalidate("project", project_id)
+    invalidate("task")
+    return db_project
+
+
+# -------------------- TASKS -------------------- #
+def _task_query():
+    return select(TaskModel).options(
+        joinedload(TaskModel.project),
+        joinedload(TaskModel.responsible)
+    )
+
+
+async def get_task(db: AsyncSession, task_id: int) -> Optional[TaskModel]:
+    # populate_existing reloads the relationships of a task already in the
+    # session, e.g. right after its user or project was changed
+    return (
+        await db.scalars(
+            _task_query()
+            .where(TaskModel.task_id == task_id)
+            .execution_options(populate_existing=True)
+        )
+    ).first()
+
+
+async def get_task_cached(db: AsyncSession, task_id: int, versions: Dict[str, int]) -> Optional[dict]:
+    async def load():
+        return to_cache_value(TaskResponse, await get_task(db, task_id))
+    return await cached_async("task", task_id, load, versions)
+
+
+async def get_all_tasks(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+    status: Optional[str] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+) -> Tuple[List[TaskModel], Optional[int]]:
+    query = filter_tasks(
+        _task_query(),
+        status=status,
+        user_id=user_id,
+        project_id=project_id,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+    )
+    return await _paginate(db, query, TaskModel.task_id, limit, after)
+
+
+async def get_all_task_rows(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+    status: Optional[str] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+) -> Tuple[List[dict], Optional[int]]:
+    query = filter_tasks(
+        task_rows.statement(),
+        status=status,
+        user_id=user_id,
+        project_id=project_id,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+    )
+    rows, next_cursor = await _paginate(db, query, TaskModel.task_id, limit, after, scalars=False)
+    return task_rows.to_dicts(rows), next_cursor
+
+
+async def create_task(db: AsyncSession, task: TaskCreate) -> TaskModel:
+    db_task = TaskModel(
+        task_name=task.task_name,
+        task_description=task.task_description,
+        status=task.status,
+        deadline=task.deadline,
+        project_id=task.project_id,
+        user_id=task.user_id
+    )
+    db_task.change_seq = await bump_version_async(db, "task_table")
+    db.add(db_task)
+    await _apply_counter_deltas(db, count_deltas(added=[task_counter_key(db_task)]))
+    await db.commit()
+    db_task = await get_task(db, db_task.task_id)
+    publish_task_event("created", db_task.task_id, db_task.change_seq, db_task)
+    return db_task
+
+
+async def update_task(db: AsyncSession, task_id: int, task: TaskUpdate) -> Optional[TaskModel]:
+    db_task = await get_task(db, task_id)
+    if not db_task:
+        return None
+    old_counter_key = task_counter_key(db_task)
+    # table_version first, then the task and its counters (see bump_version)
+    change_seq = await bump_version_async(db, "task_table")
+    update_data = task.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_task, key, value)
+    db_task.change_seq = change_seq
+    await _apply_counter_deltas(db, count_deltas(added=[task_counter_key(db_task)], removed=[old_counter_key]))
+    await db.commit()
+    invalidate("task", task_id)
+    db_task = await get_task(db, task_id)
+    publish_task_event("updated", task_id, db_task.change_seq, db_task)
+    return db_task
+
+
+async def delete_task(db: AsyncSession, task_id: int) -> Optional[TaskModel]:
+    db_task = await db.get(TaskModel, task_id)
+    if db_task is None:
+        return None
+    try:
+        # table_version first, then the task and its counters (see bump_version)
+        change_seq = await bump_version_async(db, "task_table")
+        await db.delete(db_task)
+        await _apply_counter_deltas(db, count_deltas(removed=[task_counter_key(db_task)]))
+        for statement in tombstone_statements([task_id], change_seq):
+            await db.execute(statement)
+        await db.commit()
+        invalidate("task", task_id)
+        publish_task_event("deleted", task_id, change_seq)
+        return db_task
+    except Exception:
+        await db.rollback()
+        raise
+
+
+async def iter_task_export_rows(db: AsyncSession, chunk_size: int = 1000, **filters):
+    '''
+    Same chunks as crud.iter_task_export_rows, streamed from a server-side cursor
+    '''
+    result = await db.stream(task_export_statement(**filters).execution_options(yield_per=chunk_size))
+    async for partition in result.partitions():
+        yield partition
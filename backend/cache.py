@@ -0,0 +1,190 @@
+'''
+Read-through cache for single-entity lookups (GET /api/<entity>/{id}).
+
+Values are the serialized response dicts, keyed by (namespace, id) and stored
+with the change counters (table_version) they were read at. The store behind it
+is pluggable: the default is a bounded in-process LRU with TTL; a shared store
+(e.g. Redis) only needs to implement CacheBackend, and tests can install a local
+stand-in with configure_cache().
+
+Each worker process (and replica) has its own in-process cache, and the
+invalidations in crud.py only reach the process that made the write. The other
+workers stay correct through the counters, which live in the database and are
+bumped in the transaction of every write: a lookup made at other counters than
+the entry's is a miss, so a write is seen by every worker on its next read.
+That costs the one counter query the routes already run for their ETag.
+CACHE_TTL_SECONDS only bounds how long entries nobody reads keep memory.
+'''
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+MISSING = object()
+
+
+class CacheBackend:
+    '''
+    Interface of a cache store. get returns MISSING when the key is absent.
+    '''
+    def get(self, namespace: str, key: Hashable) -> Any:
+        raise NotImplementedError
+
+    def set(self, namespace: str, key: Hashable, value: Any) -> None:
+        raise NotImplementedError
+
+    def delete(self, namespace: str, key: Hashable) -> None:
+        raise NotImplementedError
+
+    def clear_namespace(self, namespace: str) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {}
+
+
+class NullCache(CacheBackend):
+    '''
+    Caching disabled: every lookup is a miss
+    '''
+    def get(self, namespace, key):
+        return MISSING
+
+    def set(self, namespace, key, value):
+        pass
+
+    def delete(self, namespace, key):
+        pass
+
+    def clear_namespace(self, namespace):
+        pass
+
+
+class LRUTTLCache(CacheBackend):
+    '''
+    In-process cache bounded to max_entries (least recently used evicted first),
+    each entry expiring ttl_seconds after it was stored.
+    '''
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, namespace, key):
+        full_key = (namespace, key)
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[full_key]
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(full_key)
+            self.hits += 1
+            return value
+
+    def set(self, namespace, key, value):
+        full_key = (namespace, key)
+        with self._lock:
+            self._entries[full_key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, namespace, key):
+        with self._lock:
+            if self._entries.pop((namespace, key), None) is not None:
+                self.invalidations += 1
+
+    def clear_namespace(self, namespace):
+        with self._lock:
+            stale_keys = [full_key for full_key in self._entries if full_key[0] == namespace]
+            for full_key in stale_keys:
+                del self._entries[full_key]
+            self.invalidations += len(stale_keys)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+def _backend_from_env() -> CacheBackend:
+    if os.getenv("CACHE_BACKEND", "memory").strip().lower() == "none":
+        return NullCache()
+    return LRUTTLCache(
+        max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "10000")),
+        ttl_seconds=float(os.getenv("CACHE_TTL_SECONDS", "30")),
+    )
+
+
+_backend: CacheBackend = _backend_from_env()
+
+
+def configure_cache(backend: CacheBackend) -> None:
+    global _backend
+    _backend = backend
+
+
+def cache_backend() -> CacheBackend:
+    return _backend
+
+
+def cached(namespace: str, key: Hashable, loader: Callable[[], Optional[Any]], version: Any) -> Optional[Any]:
+    '''
+    Return the value cached at version or call loader and store what it returns.
+    version is read before loader runs, so the stored value is never older than it.
+    None (not found) is never cached.
+    '''
+    entry = _backend.get(namespace, key)
+    if entry is not MISSING and entry[0] == version:
+        return entry[1]
+    value = loader()
+    if value is not None:
+        _backend.set(namespace, key, (version, value))
+    return value
+
+
+async def cached_async(namespace: str, key: Hashable, loader: Callable[[], Awaitable[Optional[Any]]], version: Any) -> Optional[Any]:
+    '''
+    cached() for the async data layer
+    '''
+    entry = _backend.get(namespace, key)
+    if entry is not MISSING and entry[0] == version:
+        return entry[1]
+    value = await loader()
+    if value is not None:
+        _backend.set(namespace, key, (version, value))
+    return value
+
+
+def invalidate(namespace: str, key: Optional[Hashable] = None) -> None:
+    '''
+    Drop one entry, or the whole namespace when key is None
+    '''
+    if key is None:
+        _backend.clear_namespace(namespace)
+    else:
+        _backend.delete(namespace, key)
@@ -0,0 +1,58 @@
+'''
+ETag / If-None-Match support for the read routes. The ETag is derived from the
+change counters of the tables a response depends on plus the request URL, so
+it changes whenever one of those tables is written and differs per page/filter.
+'''
+import hashlib
+from typing import Dict, Iterable, Optional
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.table_versions import get_versions, get_versions_async
+
+
+USER_TABLES = ("user_table",)
+PROJECT_TABLES = ("project_table",)
+# Task responses embed the project and the responsible user
+TASK_TABLES = ("task_table", "user_table", "project_table")
+
+
+def make_etag(versions: Dict[str, int], request: Request) -> str:
+    fingerprint = ";".join(f"{name}={versions[name]}" for name in sorted(versions))
+    fingerprint += f";{request.url.path}?{request.url.query}"
+    return f'W/"{hashlib.sha1(fingerprint.encode()).hexdigest()[:20]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    # Weak comparison: W/"x" and "x" are the same validator
+    return "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates
+
+
+def _conditional(request: Request, response: Response, etag: str) -> Optional[Response]:
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
+
+
+def not_modified_since(request: Request, response: Response, versions: Dict[str, int]) -> Optional[Response]:
+    '''
+    not_modified with table versions the route already read (and passes on to the entity cache)
+    '''
+    return _conditional(request, response, make_etag(versions, request))
+
+
+def not_modified(db: Session, request: Request, response: Response, tables: Iterable[str]) -> Optional[Response]:
+    '''
+    Returns a 304 response when the client's copy is current; otherwise sets the
+    ETag on the response about to be built and returns None
+    '''
+    return _conditional(request, response, make_etag(get_versions(db, tables), request))
+
+
+async def not_modified_async(db: AsyncSession, request: Request, response: Response, tables: Iterable[str]) -> Optional[Response]:
+    return _conditional(request, response, make_etag(await get_versions_async(db, tables), request))
@@ -0,0 +1,160 @@
+'''
+Task counters: number of tasks per user_id x project_id x status.
+
+The counters are kept in sync by the task write paths in crud.py, inside the same
+transaction as the write, so the dashboard metrics read a handful of rows instead
+of scanning task_table. If they ever drift (manual SQL, restored backups), rebuild
+them from the tasks:
+
+    python -m backend.counters verify
+    python -m backend.counters rebuild
+'''
+import sys
+from collections import Counter
+from typing import Dict, Iterable, Tuple
+from sqlalchemy import select, delete, insert, func, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from backend.models.task_model import TaskModel
+from backend.models.task_counter_model import TaskCounterModel
+
+
+CounterKey = Tuple[int, int, str]
+
+
+def task_counter_key(task) -> CounterKey:
+    '''
+    Counter bucket of a task (ORM object, row or anything with the three attributes)
+    '''
+    return (task.user_id, task.project_id, task.status)
+
+
+def counter_upsert_statement(dialect_name: str, deltas: Dict[CounterKey, int]):
+    '''
+    Build one INSERT ... ON CONFLICT DO UPDATE adding each delta to its bucket.
+    Rows are sorted so concurrent writers lock buckets in the same order.
+    '''
+    rows = [
+        {"user_id": user_id, "project_id": project_id, "status": status, "task_count": delta}
+        for (user_id, project_id, status), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return None
+
+    dialect_insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    statement = dialect_insert(TaskCounterModel).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=["user_id", "project_id", "status"],
+        set_={"task_count": TaskCounterModel.task_count + statement.excluded.task_count}
+    )
+
+
+def empty_counters_statement(deltas: Dict[CounterKey, int]):
+    '''
+    Delete the decremented buckets that dropped to zero. An empty bucket would
+    still reference its user and project and block their deletion.
+    '''
+    keys = sorted(key for key, delta in deltas.items() if delta < 0)
+    if not keys:
+        return None
+    bucket = tuple_(TaskCounterModel.user_id, TaskCounterModel.project_id, TaskCounterModel.status)
+    return delete(TaskCounterModel).where(bucket.in_(keys), TaskCounterModel.task_count <= 0)
+
+
+def counter_statements(dialect_name: str, deltas: Dict[CounterKey, int]) -> list:
+    '''
+    The upsert of the deltas, then the cleanup of the buckets they emptied
+    '''
+    statements = [counter_upsert_statement(dialect_name, deltas), empty_counters_statement(deltas)]
+    return [statement for statement in statements if statement is not None]
+
+
+def apply_counter_deltas(db: Session, deltas: Dict[CounterKey, int]) -> None:
+    '''
+    Add the deltas to the counters in the session's current transaction. Call it
+    after bump_version (see the lock order there).
+    '''
+    for statement in counter_statements(db.get_bind().dialect.name, deltas):
+        db.execute(statement)
+
+
+def count_deltas(added: Iterable[CounterKey] = (), removed: Iterable[CounterKey] = ()) -> Dict[CounterKey, int]:
+    deltas = Counter(added)
+    deltas.subtract(Counter(removed))
+    return dict(deltas)
+
+
+def _actual_counts_query():
+    return (
+        select(TaskModel.user_id, TaskModel.project_id, TaskModel.status, func.count().label("task_count"))
+        .group_by(TaskModel.user_id, TaskModel.project_id, TaskModel.status)
+    )
+
+
+def rebuild_counters(db: Session) -> int:
+    '''
+    Recompute every counter from task_table in a single transaction
+    '''
+    try:
+        db.execute(delete(TaskCounterModel))
+        result = db.execute(
+            insert(TaskCounterModel).from_select(
+                ["user_id", "project_id", "status", "task_count"],
+                _actual_counts_query()
+            )
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return result.rowcount
+
+
+def verify_counters(db: Session) -> Dict[CounterKey, Tuple[int, int]]:
+    '''
+    Compare the counters with task_table. Returns {bucket: (stored, actual)} for every mismatch.
+    '''
+    actual = {
+        (user_id, project_id, status): task_count
+        for user_id, project_id, status, task_count in db.execute(_actual_counts_query())
+    }
+    stored = {
+        task_counter_key(row): row.task_count
+        for row in db.scalars(select(TaskCounterModel))
+    }
+    return {
+        key: (stored.get(key, 0), actual.get(key, 0))
+        for key in set(actual) | set(stored)
+        if stored.get(key, 0) != actual.get(key, 0)
+    }
+
+
+def main(argv=None) -> int:
+    from backend.database import create_sync_engine
+    # TaskModel's relationships need the models they point to registered
+    from backend.models import user_model, project_model  # noqa: F401
+
+    argv = sys.argv[1:] if argv is None else argv
+    if argv not in (["rebuild"], ["verify"]):
+        print("usage: python -m backend.counters {rebuild|verify}")
+        return 2
+
+    db = Session(create_sync_engine())
+    try:
+        if argv == ["rebuild"]:
+            buckets = rebuild_counters(db)
+            print(f"Rebuilt task counters ({buckets} buckets)")
+            return 0
+
+        mismatches = verify_counters(db)
+        for (user_id, project_id, status), (stored, actual) in sorted(mismatches.items()):
+            print(f"user={user_id} project={project_id} status={status}: stored={stored} actual={actual}")
+        print("Task counters are in sync" if not mismatches else f"{len(mismatches)} bucket(s) out of sync")
+        return 1 if mismatches else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,74 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from backend.models.user_model import UserModel
 from backend.models.project_model import ProjectModel
 from backend.models.task_model import TaskModel
-from backend.schemas.user_schema import UserCreate, UserUpdate
-from backend.schemas.project_schema import ProjectCreate, ProjectUpdate
-from backend.schemas.task_schema import TaskCreate, TaskUpdate
+from backend.models.task_counter_model import TaskCounterModel
+from backend.models.task_tombstone_model import TaskTombstoneModel
+from backend.counters import apply_counter_deltas, count_deltas, task_counter_key
+from backend.schemas.user_schema import UserCreate, UserUpdate, UserResponse
+from backend.schemas.project_schema import ProjectCreate, ProjectUpdate, ProjectResponse
+from backend.schemas.task_schema import TaskCreate, TaskUpdate, TaskBulkUpdate, TaskResponse
+from backend.cache import cached, invalidate
+from backend.table_versions import bump_version, get_versions
+from backend.events import publish_task_event, publish_task_changes
+from backend.serializers import user_rows, project_rows, task_rows
+from backend.search import search_statement
+from backend.lookup import name_key, prefix_range
+from datetime import datetime, timezone
+import os
+import re
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+DEFAULT_LOOKUP_LIMIT = 20
+MAX_LOOKUP_LIMIT = 100
+
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", "1000"))
+MAX_BULK_BATCH_SIZE = 10000
+
+
+def _paginate(query, key_column, limit: int, after: Optional[int]):
+    '''
+    Keyset pagination on the primary key: rows are returned in key order,
+    starting right after the "after" cursor. One extra row is fetched to know
+    whether there is a next page, and the cursor for it is returned alongside.
+    '''
+    if after is not None:
+        query = query.filter(key_column > after)
+    rows = query.order_by(key_column).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = getattr(rows[-1], key_column.key)
+    return rows, next_cursor
+
+
+def _paginate_rows(db: Session, statement, key_column, limit: int, after: Optional[int]):
+    '''
+    _paginate for a column SELECT, returning plain row tuples
+    '''
+    if after is not None:
+        statement = statement.where(key_column > after)
+    rows = db.execute(statement.order_by(key_column).limit(limit + 1)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = getattr(rows[-1], key_column.key)
+    return rows, next_cursor
+
+
+def to_cache_value(schema, obj) -> Optional[dict]:
+    '''
+    Serialized response of an ORM object, the form stored in the entity cache
+    '''
+    if obj is None:
+        return None
+    return schema.model_validate(obj).model_dump()
 
 
 #--------------------------USER--------------------------#
@@ -16,6 +78,7 @@ def create_user(db: Session, user: UserCreate) -> UserModel:
     CRUD step to receive the command to create the user in the database
     '''
     db_user = UserModel(name=user.name, email=user.email, area=user.area)
+    bump_version(db, "user_table")
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
@@ -28,12 +91,35 @@ def get_user(db: Session, user_id: int) -> Optional[UserModel]:
     '''
     return db.query(UserModel).filter(UserModel.user_id == user_id).first()
 
-def get_all_users(db: Session) -> List[UserModel]:
+
+def get_user_cached(db: Session, user_id: int, versions: Dict[str, int]) -> Optional[dict]:
     '''
-    CRUD step to receive all registered users
+    get_user through the entity cache, returning the serialized user. versions are
+    the change counters of the tables the response depends on, read beforehand.
     '''
+    return cached("user", user_id, lambda: to_cache_value(UserResponse, get_user(db, user_id)), versions)
 
-    return db.query(UserModel).all()
+def get_all_users(
+    db: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+) -> Tuple[List[UserModel], Optional[int]]:
+    '''
+    CRUD step to receive one page of registered users and the cursor of the next page
+    '''
+    return _paginate(db.query(UserModel), UserModel.user_id, limit, after)
+
+
+def get_all_user_rows(
+    db: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+) -> Tuple[List[dict], Optional[int]]:
+    '''
+    Same page as get_all_users, as UserResponse dicts built straight from the rows
+    '''
+    rows, next_cursor = _paginate_rows(db, user_rows.statement(), UserModel.user_id, limit, after)
+    return user_rows.to_dicts(rows), next_cursor
 
 
 def update_user(db: Session, user_id: int, user: UserUpdate) -> Optional[UserModel]:
@@ -43,11 +129,15 @@ def update_user(db: Session, user_id: int, user: UserUpdate) -> Optional[UserMod
     db_user = get_user(db, user_id)
     if not db_user:
         return None
-    update_data = user.dict(exclude_unset=True)
+    bump_version(db, "user_table")
+    update_data = user.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_user, key, value)
     db.commit()
     db.refresh(db_user)
+    invalidate("user", user_id)
+    # Cached tasks embed their responsible user
+    invalidate("task")
     return db_user
 
 
@@ -56,8 +146,11 @@ def delete_user(db: Session, user_id: int) -> bool:
     Delete a user given an id.
     '''
     db_user = db.query(UserModel).filter(UserModel.user_id == user_id).first()
+    bump_version(db, "user_table")
     db.delete(db_user)
     db.commit()
+    invalidate("user", user_id)
+    invalidate("task")
     return db_user
 
 
@@ -68,6 +161,7 @@ def create_project(db: Session, project: ProjectCreate) -> ProjectModel:
     CRUD step to receive the command to create the project in the database
     '''
     db_project = ProjectModel(project_name=project.project_name, project_description=project.project_description)
+    bump_version(db, "project_table")
     db.add(db_project)
     db.commit()
     db.refresh(db_project)
@@ -81,11 +175,35 @@ def get_project(db: Session, project_id: int) -> Optional[ProjectModel]:
     return db.query(ProjectModel).filter(ProjectModel.project_id == project_id).first()
 
 
-def get_all_projects(db: Session) -> List[ProjectModel]:
+def get_project_cached(db: Session, project_id: int, versions: Dict[str, int]) -> Optional[dict]:
+    '''
+    get_project through the entity cache, returning the serialized project. versions are
+    the change counters of the tables the response depends on, read beforehand.
+    '''
+    return cached("project", project_id, lambda: to_cache_value(ProjectResponse, get_project(db, project_id)), versions)
+
+
+def get_all_projects(
+    db: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+) -> Tuple[List[ProjectModel], Optional[int]]:
     '''
-    CRUD step to receive all registered projects
+    CRUD step to receive one page of registered projects and the cursor of the next page
     '''
-    return db.query(ProjectModel).all()
+    return _paginate(db.query(ProjectModel), ProjectModel.project_id, limit, after)
+
+
+def get_all_project_rows(
+    db: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+) -> Tuple[List[dict], Optional[int]]:
+    '''
+    Same page as get_all_projects, as ProjectResponse dicts built straight from the rows
+    '''
+    rows, next_cursor = _paginate_rows(db, project_rows.statement(), ProjectModel.project_id, limit, after)
+    return project_rows.to_dicts(rows), next_cursor
 
 
 def update_project(db: Session, project_id: int, project: ProjectUpdate) -> Optional[ProjectModel]:
@@ -95,11 +213,15 @@ def update_project(db: Session, project_id: int, project: ProjectUpdate) -> Opti
     db_project = get_project(db, project_id)
     if not db_project:
         return None
-    update_data = project.dict(exclude_unset=True)
+    bump_version(db, "project_table")
+    update_data = project.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_project, key, value)
     db.commit()
     db.refresh(db_project)
+    invalidate("project", project_id)
+    # Cached tasks embed their project
+    invalidate("task")
     return db_project
 
 
@@ -108,12 +230,26 @@ def delete_project(db: Session, project_id: int) -> bool:
     Delete a project given an id.
     '''
     db_project = db.query(ProjectModel).filter(ProjectModel.project_id == project_id).first()
+    bump_version(db, "project_table")
     db.delete(db_project)
     db.commit()
+    invalidate("project", project_id)
+    invalidate("task")
     return db_project
 
 
 # -------------------- TASKS -------------------- #
+def _task_query(db: Session):
+    '''
+    Base query for task reads. TaskResponse embeds the project and the responsible
+    user, so both are loaded in the same SELECT instead of one lazy load per task.
+    '''
+    return db.query(TaskModel).options(
+        joinedload(TaskModel.project),
+        joinedload(TaskModel.responsible)
+    )
+
+
 def create_task(db: Session, task: TaskCreate) -> TaskModel:
     '''
     CRUD step to receive the command to create the task in the database
@@ -126,9 +262,12 @@ def create_task(db: Session, task: TaskCreate) -> TaskModel:
         project_id=task.project_id,
         user_id=task.user_id
     )
+    db_task.change_seq = bump_version(db, "task_table")
     db.add(db_task)
+    apply_counter_deltas(db, count_deltas(added=[task_counter_key(db_task)]))
     db.commit()
     db.refresh(db_task)
+    publish_task_event("created", db_task.task_id, db_task.change_seq, db_task)
     return db_task
 
 
@@ -136,14 +275,147 @@ def get_task(db: Session, task_id: int) -> Optional[TaskModel]:
     '''
     CRUD step to filter the task and receive a response
     '''
-    return db.query(TaskModel).filter(TaskModel.task_id == task_id).first()
+    return _task_query(db).filter(TaskModel.task_id == task_id).first()
+
+
+def get_task_cached(db: Session, task_id: int, versions: Dict[str, int]) -> Optional[dict]:
+    '''
+    get_task through the entity cache, returning the serialized task. versions are
+    the change counters of the tables the response depends on, read beforehand.
+    '''
+    return cached("task", task_id, lambda: to_cache_value(TaskResponse, get_task(db, task_id)), versions)
+
+
+def filter_tasks(
+    query,
+    status: Optional[str] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+):
+    '''
+    Apply the optional task filters shared by the task read paths
+    '''
+    if status is not None:
+        query = query.filter(TaskModel.status == status)
+    if user_id is not None:
+        query = query.filter(TaskModel.user_id == user_id)
+    if project_id is not None:
+        query = query.filter(TaskModel.project_id == project_id)
+    if deadline_from is not None:
+        query = query.filter(TaskModel.deadline >= deadline_from)
+    if deadline_to is not None:
+        query = query.filter(TaskModel.deadline <= deadline_to)
+    return query
+
+
+EXPORT_COLUMNS = [
+    "task_id",
+    "task_name",
+    "task_description",
+    "status",
+    "deadline",
+    "project_id",
+    "project_name",
+    "user_id",
+    "user_name",
+]
+
+
+def task_export_statement(
+    status: Optional[str] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+):
+    '''
+    Export rows: tasks joined with the user and project names, in task_id order
+    '''
+    query = (
+        select(
+            TaskModel.task_id,
+            TaskModel.task_name,
+            TaskModel.task_description,
+            TaskModel.status,
+            TaskModel.deadline,
+            TaskModel.project_id,
+            ProjectModel.project_name,
+            TaskModel.user_id,
+            UserModel.name.label("user_name"),
+        )
+        .join(ProjectModel, TaskModel.project_id == ProjectModel.project_id)
+        .join(UserModel, TaskModel.user_id == UserModel.user_id)
+    )
+    return filter_tasks(
+        query,
+        status=status,
+        user_id=user_id,
+        project_id=project_id,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+    ).order_by(TaskModel.task_id)
 
 
-def get_all_tasks(db: Session) -> List[TaskModel]:
+def iter_task_export_rows(db: Session, chunk_size: int = 1000, **filters):
+    '''
+    Yield lists of export rows (see task_export_statement for the filters).
+    The query runs on a server-side cursor and is fetched chunk_size rows at a time,
+    so memory stays flat whatever the table size.
     '''
-    CRUD step to receive all registered tasks
+    result = db.execute(task_export_statement(**filters).execution_options(yield_per=chunk_size))
+    for partition in result.partitions():
+        yield partition
+
+
+def get_all_tasks(
+    db: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+    status: Optional[str] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+) -> Tuple[List[TaskModel], Optional[int]]:
     '''
-    return db.query(TaskModel).all()
+    CRUD step to receive one page of tasks matching the filters and the cursor of the next page
+    '''
+    query = filter_tasks(
+        _task_query(db),
+        status=status,
+        user_id=user_id,
+        project_id=project_id,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+    )
+    return _paginate(query, TaskModel.task_id, limit, after)
+
+
+def get_all_task_rows(
+    db: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+    status: Optional[str] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+) -> Tuple[List[dict], Optional[int]]:
+    '''
+    Same page as get_all_tasks, as TaskResponse dicts built straight from the rows
+    '''
+    statement = filter_tasks(
+        task_rows.statement(),
+        status=status,
+        user_id=user_id,
+        project_id=project_id,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+    )
+    rows, next_cursor = _paginate_rows(db, statement, TaskModel.task_id, limit, after)
+    return task_rows.to_dicts(rows), next_cursor
 
 
 def update_task(db: Session, task_id: int, task: TaskUpdate) -> Optional[TaskModel]:
@@ -153,11 +425,18 @@ def update_task(db: Session, task_id: int, task: TaskUpdate) -> Optional[TaskMod
     db_task = get_task(db, task_id)
     if not db_task:
         return None
-    update_data = task.dict(exclude_unset=True)
+    old_counter_key = task_counter_key(db_task)
+    # table_version first, then the task and its counters (see bump_version)
+    change_seq = bump_version(db, "task_table")
+    update_data = task.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_task, key, value)
+    db_task.change_seq = change_seq
+    apply_counter_deltas(db, count_deltas(added=[task_counter_key(db_task)], removed=[old_counter_key]))
     db.commit()
     db.refresh(db_task)
+    invalidate("task", task_id)
+    publish_task_event("updated", task_id, db_task.change_seq, db_task)
     return db_task
 
 
@@ -173,12 +452,410 @@ def delete_task(db: Session, task_id: int) -> Optional[TaskModel]:
     task_data_to_return = db_task.__dict__.copy() 
 
     try:
+        # table_version first, then the task and its counters (see bump_version)
+        change_seq = bump_version(db, "task_table")
         db.delete(db_task)
+        apply_counter_deltas(db, count_deltas(removed=[task_counter_key(db_task)]))
+        add_tombstones(db, [task_id], change_seq)
         db.commit()
+        invalidate("task", task_id)
+        publish_task_event("deleted", task_id, change_seq)
         
         # Retorne o dicionário serializado
         return task_data_to_return 
         
     except Exception as e:
         db.rollback() 
-        raise e 
\ No newline at end of file
+        raise e
+
+
+def tombstone_statements(task_ids: List[int], change_seq: int) -> list:
+    '''
+    Statements recording deleted task ids for the delta sync. An older tombstone
+    of the same id (possible where ids get reused, e.g. SQLite) is replaced.
+    '''
+    deleted_at = datetime.now(timezone.utc)
+    return [
+        delete(TaskTombstoneModel).where(TaskTombstoneModel.task_id.in_(task_ids)),
+        insert(TaskTombstoneModel).values([
+            {"task_id": task_id, "change_seq": change_seq, "deleted_at": deleted_at}
+            for task_id in task_ids
+        ]),
+    ]
+
+
+def add_tombstones(db: Session, task_ids: List[int], change_seq: int) -> None:
+    if task_ids:
+        for statement in tombstone_statements(task_ids, change_seq):
+            db.execute(statement)
+
+
+def _changed_tasks_statement(since: int, until: int, limit: Optional[int] = None):
+    statement = (
+        select(TaskModel)
+        .options(joinedload(TaskModel.project), joinedload(TaskModel.responsible))
+        .where(TaskModel.change_seq > since, TaskModel.change_seq <= until)
+        .order_by(TaskModel.change_seq, TaskModel.task_id)
+    )
+    return statement if limit is None else statement.limit(limit)
+
+
+def _deleted_tasks_statement(since: int, until: int, limit: Optional[int] = None):
+    # A tombstone whose id is back in task_table (reused id) is superseded by the row
+    statement = (
+        select(TaskTombstoneModel.task_id, TaskTombstoneModel.change_seq)
+        .outerjoin(TaskModel, TaskModel.task_id == TaskTombstoneModel.task_id)
+        .where(
+            TaskModel.task_id.is_(None),
+            TaskTombstoneModel.change_seq > since,
+            TaskTombstoneModel.change_seq <= until
+        )
+        .order_by(TaskTombstoneModel.change_seq, TaskTombstoneModel.task_id)
+    )
+    return statement if limit is None else statement.limit(limit)
+
+
+def get_task_changes_head(db: Session) -> dict:
+    '''
+    The current token: /task/changes from here on returns only the later changes
+    '''
+    return {"token": get_versions(db, ["task_table"])["task_table"]}
+
+
+def get_task_changes(db: Session, since: int = 0, limit: int = MAX_PAGE_SIZE) -> dict:
+    '''
+    Tasks created/updated and ids deleted after the "since" token (a task_table
+    change counter value), in counter order. When there are more than "limit"
+    changes, has_more is set and the next call continues from the returned token.
+    '''
+    current = get_versions(db, ["task_table"])["task_table"]
+    upserted = db.execute(_changed_tasks_statement(since, current, limit + 1)).scalars().unique().all()
+    deleted = db.execute(_deleted_tasks_statement(since, current, limit + 1)).all()
+
+    token, has_more = current, False
+    change_seqs = sorted([task.change_seq for task in upserted] + [row.change_seq for row in deleted])
+    if len(change_seqs) > limit:
+        # Stop before the first counter value that doesn't fit, so the changes
+        # of one write (which share a counter value) are never split across pages
+        has_more = True
+        token = change_seqs[limit] - 1
+        if token <= since:
+            # A single bulk write larger than the page: return all of it
+            token = change_seqs[0]
+            upserted = db.execute(_changed_tasks_statement(since, token)).scalars().unique().all()
+            deleted = db.execute(_deleted_tasks_statement(since, token)).all()
+        upserted = [task for task in upserted if task.change_seq <= token]
+        deleted = [row for row in deleted if row.change_seq <= token]
+
+    return {
+        "token": token,
+        "has_more": has_more,
+        "upserted": upserted,
+        "deleted": [row.task_id for row in deleted],
+    }
+
+
+def _batches(items: list, batch_size: int):
+    for start in range(0, len(items), batch_size):
+        yield start, items[start:start + batch_size]
+
+
+def bulk_create_tasks(db: Session, tasks: List[TaskCreate], batch_size: int = BULK_BATCH_SIZE) -> List[dict]:
+    '''
+    Create many tasks in one transaction, with one multi-row INSERT per batch
+    '''
+    results = []
+    try:
+        change_seq = bump_version(db, "task_table")
+        for start, batch in _batches(tasks, batch_size):
+            new_ids = db.execute(
+                insert(TaskModel).returning(TaskModel.task_id, sort_by_parameter_order=True),
+                [{**task.model_dump(), "change_seq": change_seq} for task in batch]
+            ).scalars().all()
+            apply_counter_deltas(db, count_deltas(added=[task_counter_key(task) for task in batch]))
+            results.extend(
+                {"index": start + offset, "task_id": task_id, "result": "created"}
+                for offset, task_id in enumerate(new_ids)
+            )
+        db.commit()
+        publish_task_changes(change_seq, len(results))
+    except Exception:
+        db.rollback()
+        raise
+    return results
+
+
+# Columns a bulk update can set, read back to skip the items that change nothing
+BULK_UPDATE_COLUMNS = (
+    TaskModel.task_name,
+    TaskModel.task_description,
+    TaskModel.status,
+    TaskModel.deadline,
+    TaskModel.project_id,
+    TaskModel.user_id,
+)
+
+
+def _same_value(stored, new) -> bool:
+    if isinstance(stored, datetime) and isinstance(new, datetime) and (stored.tzinfo is None) != (new.tzinfo is None):
+        # The deadline column is naive and holds UTC; the API may send an offset
+        stored, new = [value if value.tzinfo else value.replace(tzinfo=timezone.utc) for value in (stored, new)]
+    return stored == new
+
+
+def bulk_update_tasks(db: Session, tasks: List[TaskBulkUpdate], batch_size: int = BULK_BATCH_SIZE) -> List[dict]:
+    '''
+    Update many tasks in one transaction. Each batch reads the stored values of its
+    ids with one SELECT and sends the actual changes as a single executemany UPDATE
+    by primary key. Items that change nothing are reported "unchanged"; when no
+    item changes anything, the change counter is left alone.
+    '''
+    results = []
+    change_seq = None
+    try:
+        updated_at = datetime.now(timezone.utc)
+        for start, batch in _batches(tasks, batch_size):
+            batch_ids = {task.task_id for task in batch}
+            stored = {
+                row.task_id: dict(row._mapping)
+                for row in db.execute(
+                    select(TaskModel.task_id, *BULK_UPDATE_COLUMNS).where(TaskModel.task_id.in_(batch_ids))
+                )
+            }
+            rows = []
+            added, removed = [], []
+            for offset, task in enumerate(batch):
+                result = {"index": start + offset, "task_id": task.task_id}
+                state = stored.get(task.task_id)
+                if state is None:
+                    results.append({**result, "result": "not_found"})
+                    continue
+                changes = {
+                    key: value
+                    for key, value in task.model_dump(exclude_unset=True, exclude={"task_id"}).items()
+                    if not _same_value(state[key], value)
+                }
+                if not changes:
+                    results.append({**result, "result": "unchanged"})
+                    continue
+                # Move the task's count from its current bucket to the new one
+                removed.append((state["user_id"], state["project_id"], state["status"]))
+                state.update(changes)
+                added.append((state["user_id"], state["project_id"], state["status"]))
+                rows.append({"task_id": task.task_id, **changes, "updated_at": updated_at})
+                results.append({**result, "result": "updated"})
+            if rows:
+                if change_seq is None:
+                    change_seq = bump_version(db, "task_table")
+                db.execute(update(TaskModel), [{**row, "change_seq": change_seq} for row in rows])
+                apply_counter_deltas(db, count_deltas(added=added, removed=removed))
+        db.commit()
+        updated_ids = [result["task_id"] for result in results if result["result"] == "updated"]
+        for task_id in updated_ids:
+            invalidate("task", task_id)
+        if change_seq is not None:
+            publish_task_changes(change_seq, len(updated_ids))
+    except Exception:
+        db.rollback()
+        raise
+    return results
+
+
+def bulk_delete_tasks(db: Session, task_ids: List[int], batch_size: int = BULK_BATCH_SIZE) -> List[dict]:
+    '''
+    Delete many tasks in one transaction, with one DELETE ... WHERE task_id IN (...) per batch
+    '''
+    results = []
+    try:
+        change_seq = bump_version(db, "task_table")
+        for start, batch in _batches(task_ids, batch_size):
+            deleted_rows = db.execute(
+                delete(TaskModel)
+                .where(TaskModel.task_id.in_(batch))
+                .returning(TaskModel.task_id, TaskModel.user_id, TaskModel.project_id, TaskModel.status)
+                .execution_options(synchronize_session=False)
+            ).all()
+            deleted_ids = {row.task_id for row in deleted_rows}
+            apply_counter_deltas(db, count_deltas(removed=[task_counter_key(row) for row in deleted_rows]))
+            add_tombstones(db, sorted(deleted_ids), change_seq)
+            results.extend(
+                {
+                    "index": start + offset,
+                    "task_id": task_id,
+                    "result": "deleted" if task_id in deleted_ids else "not_found"
+                }
+                for offset, task_id in enumerate(batch)
+            )
+        db.commit()
+        for task_id in task_ids:
+            invalidate("task", task_id)
+        publish_task_changes(change_seq, sum(result["result"] == "deleted" for result in results))
+    except Exception:
+        db.rollback()
+        raise
+    return results
+
+
+# -------------------- SEARCH -------------------- #
+def _search_page(
+    db: Session,
+    q: str,
+    limit: int,
+    after: Optional[int],
+    status: Optional[str],
+    user_id: Optional[int],
+    project_id: Optional[int],
+) -> Tuple[List[int], Optional[int]]:
+    '''
+    Ids of one page of search results, best match first. Results are ordered by
+    rank, not by key, so the cursor is the number of results already returned.
+    '''
+    statement = search_statement(db.get_bind().dialect.name, q)
+    if statement is None:
+        return [], None
+    statement = filter_tasks(statement, status=status, user_id=user_id, project_id=project_id)
+    offset = after or 0
+    rows = db.execute(statement.offset(offset).limit(limit + 1)).all()
+    next_cursor = offset + limit if len(rows) > limit else None
+    return [row.task_id for row in rows[:limit]], next_cursor
+
+
+def search_tasks(
+    db: Session,
+    q: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+    status: Optional[str] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+) -> Tuple[List[TaskModel], Optional[int]]:
+    '''
+    CRUD step to receive one page of tasks matching the search text, in rank order
+    '''
+    task_ids, next_cursor = _search_page(db, q, limit, after, status, user_id, project_id)
+    tasks = {task.task_id: task for task in _task_query(db).filter(TaskModel.task_id.in_(task_ids))}
+    return [tasks[task_id] for task_id in task_ids if task_id in tasks], next_cursor
+
+
+def search_task_rows(
+    db: Session,
+    q: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+    status: Optional[str] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+) -> Tuple[List[dict], Optional[int]]:
+    '''
+    Same page as search_tasks, as TaskResponse dicts built straight from the rows
+    '''
+    task_ids, next_cursor = _search_page(db, q, limit, after, status, user_id, project_id)
+    rows = db.execute(task_rows.statement().where(TaskModel.task_id.in_(task_ids))).all()
+    tasks = {task["task_id"]: task for task in task_rows.to_dicts(rows)}
+    return [tasks[task_id] for task_id in task_ids if task_id in tasks], next_cursor
+
+
+# -------------------- LOOKUP -------------------- #
+# ASCII digits only (str.isdigit also accepts '²', which int() rejects); longer
+# numbers cannot be an id and would overflow an INTEGER on Postgres
+ID_PREFIX = re.compile(r"[0-9]{1,9}")
+
+def _lookup(db: Session, id_column, label_column, prefix: str, limit: int) -> List[dict]:
+    '''
+    {id, label} of the rows whose label starts with prefix (any case), in label
+    order. A prefix made of digits also matches the row with that id, listed first.
+    '''
+    key = name_key(label_column, db.get_bind().dialect.name)
+    statement = select(id_column.label("id"), label_column.label("label"))
+    items = []
+    if ID_PREFIX.fullmatch(prefix):
+        items = [dict(row._mapping) for row in db.execute(statement.where(id_column == int(prefix)))]
+    if prefix:
+        statement = statement.where(prefix_range(key, prefix))
+    rows = db.execute(statement.order_by(key, id_column).limit(limit)).all()
+    found = {item["id"] for item in items}
+    items.extend(dict(row._mapping) for row in rows if row.id not in found)
+    return items[:limit]
+
+
+def lookup_users(db: Session, prefix: str = "", limit: int = DEFAULT_LOOKUP_LIMIT) -> List[dict]:
+    return _lookup(db, UserModel.user_id, UserModel.name, prefix, limit)
+
+
+def lookup_projects(db: Session, prefix: str = "", limit: int = DEFAULT_LOOKUP_LIMIT) -> List[dict]:
+    return _lookup(db, ProjectModel.project_id, ProjectModel.project_name, prefix, limit)
+
+
+def lookup_tasks(db: Session, prefix: str = "", limit: int = DEFAULT_LOOKUP_LIMIT) -> List[dict]:
+    return _lookup(db, TaskModel.task_id, TaskModel.task_name, prefix, limit)
+
+
+# -------------------- STATS -------------------- #
+# Stats read the task counters kept up to date by the write paths above,
+# so their cost depends on users x projects x statuses, not on the number of tasks.
+def _filter_stats(query, user_id: Optional[int], project_id: Optional[int]):
+    if user_id is not None:
+        query = query.where(TaskCounterModel.user_id == user_id)
+    if project_id is not None:
+        query = query.where(TaskCounterModel.project_id == project_id)
+    return query
+
+
+def get_task_status_counts(db: Session, user_id: Optional[int] = None, project_id: Optional[int] = None) -> List[dict]:
+    '''
+    Number of tasks per status
+    '''
+    task_count = func.sum(TaskCounterModel.task_count)
+    query = (
+        select(TaskCounterModel.status, task_count.label("count"))
+        .group_by(TaskCounterModel.status)
+        .having(task_count > 0)
+    )
+    query = _filter_stats(query, user_id, project_id).order_by(TaskCounterModel.status)
+    return [{"status": status, "count": count} for status, count in db.execute(query)]
+
+
+def get_user_status_counts(db: Session, user_id: Optional[int] = None, project_id: Optional[int] = None) -> List[dict]:
+    '''
+    Number of tasks per responsible user and status
+    '''
+    task_count = func.sum(TaskCounterModel.task_count)
+    query = (
+        select(TaskCounterModel.user_id, UserModel.name, TaskCounterModel.status, task_count.label("count"))
+        .join(UserModel, TaskCounterModel.user_id == UserModel.user_id)
+        .group_by(TaskCounterModel.user_id, UserModel.name, TaskCounterModel.status)
+        .having(task_count > 0)
+    )
+    query = _filter_stats(query, user_id, project_id).order_by(TaskCounterModel.user_id, TaskCounterModel.status)
+    return [
+        {"user_id": row_user_id, "name": name, "status": status, "count": count}
+        for row_user_id, name, status, count in db.execute(query)
+    ]
+
+
+def get_task_overview(db: Session, user_id: Optional[int] = None, project_id: Optional[int] = None) -> dict:
+    '''
+    Overview metrics of the dashboard: total tasks, % finished and the user with most tasks
+    '''
+    status_counts = get_task_status_counts(db, user_id=user_id, project_id=project_id)
+    total_tasks = sum(row["count"] for row in status_counts)
+    finished_tasks = sum(row["count"] for row in status_counts if row["status"] == "Finished")
+
+    task_count = func.sum(TaskCounterModel.task_count)
+    top_user_query = (
+        select(TaskCounterModel.user_id, UserModel.name, task_count.label("task_count"))
+        .join(UserModel, TaskCounterModel.user_id == UserModel.user_id)
+        .group_by(TaskCounterModel.user_id, UserModel.name)
+        .having(task_count > 0)
+    )
+    top_user_query = _filter_stats(top_user_query, user_id, project_id)
+    top_user = db.execute(
+        top_user_query.order_by(task_count.desc(), UserModel.name).limit(1)
+    ).first()
+
+    return {
+        "total_tasks": total_tasks,
+        "finished_tasks": finished_tasks,
+        "finished_percentage": (finished_tasks / total_tasks * 100) if total_tasks else 0.0,
+        "top_user": dict(top_user._mapping) if top_user else None,
+    }
@@ -0,0 +1,154 @@
+'''
+In-process publish/subscribe of task changes, consumed by the SSE route
+GET /api/task/events.
+
+The write paths in crud.py / async_crud.py publish after their commit, from the
+request thread (sync routes run in the threadpool) or from the event loop
+(async routes). Each event is encoded once and the same bytes are put on every
+subscriber queue, so an idle subscriber costs one small queue and a coroutine
+waiting on it.
+
+Only subscribers of the same process are reached: with several workers each one
+has its own broker, and clients catch up through GET /api/task/changes.
+'''
+import asyncio
+import json
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Optional, Set
+from backend.schemas.task_schema import TaskResponse
+
+
+# A subscriber that falls behind gets the resync marker and the end-of-stream
+# None, so its queue must hold at least those two
+MIN_QUEUE_SIZE = 2
+SUBSCRIBER_QUEUE_SIZE = max(int(os.getenv("EVENTS_QUEUE_SIZE", "100")), MIN_QUEUE_SIZE)
+HEARTBEAT_SECONDS = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+
+# Sent to a subscriber that fell behind (queue full) before it is disconnected:
+# the client should resync with GET /api/task/changes
+RESYNC_EVENT = b"event: resync\ndata: {}\n\n"
+HEARTBEAT = b": ping\n\n"
+
+
+def encode_event(event_type: str, data: dict, event_id: Optional[int] = None) -> bytes:
+    '''
+    Frame an event for text/event-stream. The id is the task_table change counter,
+    usable as the "since" token of /task/changes.
+    '''
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(data, default=str, separators=(',', ':'))}")
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+class EventBroker:
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = max(queue_size, MIN_QUEUE_SIZE)
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self.published = 0
+        self.dropped = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self):
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            with self._lock:
+                self._subscribers.discard(queue)
+
+    def publish(self, event_type: str, data: dict, event_id: Optional[int] = None) -> None:
+        '''
+        Thread-safe; a no-op while nobody is subscribed
+        '''
+        if not self._subscribers or self._loop is None or self._loop.is_closed():
+            return
+        message = encode_event(event_type, data, event_id)
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._fan_out(message)
+        else:
+            self._loop.call_soon_threadsafe(self._fan_out, message)
+
+    def _fan_out(self, message: bytes) -> None:
+        self.published += 1
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # A slow client must not hold events back for everyone else:
+                # replace its backlog with a resync marker and let it reconnect
+                self.dropped += 1
+                self._subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC_EVENT)
+                queue.put_nowait(None)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": self.subscriber_count,
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+
+broker = EventBroker()
+
+
+def publish_task_event(event_type: str, task_id: int, change_seq: int, task=None) -> None:
+    '''
+    event_type is "created", "updated" or "deleted"; task is the TaskModel (with
+    its project and responsible loaded), sent as a TaskResponse
+    '''
+    if not broker.subscriber_count:
+        return
+    payload = None
+    if task is not None:
+        payload = TaskResponse.model_validate(task).model_dump(mode="json")
+    broker.publish(event_type, {"task_id": task_id, "change_seq": change_seq, "task": payload}, change_seq)
+
+
+def publish_task_changes(change_seq: int, count: int) -> None:
+    '''
+    Bulk writes publish one "changes" event instead of one event per task; clients
+    fetch the rows from /task/changes
+    '''
+    broker.publish("changes", {"change_seq": change_seq, "count": count}, change_seq)
+
+
+async def event_stream(request):
+    '''
+    Body of GET /api/task/events for one client, until it disconnects or falls behind
+    '''
+    async with broker.subscribe() as queue:
+        # Subscribed from here on: a client can now sync with /task/changes
+        # without missing events in between
+        yield b"retry: 3000\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield HEARTBEAT
+                continue
+            if message is None:
+                return
+            yield message
@@ -0,0 +1,35 @@
+'''
+Formatting of GET /api/task/export (NDJSON or CSV), shared by the sync and async
+routers, which stream the rows chunk by chunk from a session of their own.
+'''
+import csv
+import io
+import json
+from datetime import datetime
+from backend.crud import EXPORT_COLUMNS
+
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _export_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _csv_text(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def export_header(export_format: str) -> str:
+    return _csv_text([EXPORT_COLUMNS]) if export_format == "csv" else ""
+
+
+def export_chunk(export_format: str, rows) -> str:
+    if export_format == "csv":
+        return _csv_text([_export_value(value) for value in row] for row in rows)
+    return "".join(
+        json.dumps({column: _export_value(value) for column, value in zip(EXPORT_COLUMNS, row)}) + "\n"
+        for row in rows
+    )
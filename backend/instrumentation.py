@@ -0,0 +1,319 @@
+'''
+Per-request timing: wall time, number of SQL statements, time spent in the
+database and in response serialization.
+
+- InstrumentationMiddleware gives each request a RequestStats (through a context
+  variable, which sync routes see as well since the threadpool copies the context),
+  adds a Server-Timing header to the response and records the request in `metrics`.
+- instrument_engine() hooks the SQLAlchemy engine events that count statements and
+  time them; statements slower than SLOW_QUERY_MS are logged to "backend.sql".
+- TimedRoute measures serialization: the time between the endpoint returning
+  and the route handing back a Response (response_model validation + rendering).
+  It also runs the requests sent with `X-Profile: 1` under cProfile (backend/profiling.py).
+- render_metrics() renders `metrics` in the Prometheus text format (GET /metrics).
+'''
+import cProfile
+import contextvars
+import inspect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, Optional, Tuple
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from backend.profiling import (
+    PROFILE_COVERS_ALL_THREADS,
+    profile_requested,
+    profile_report,
+    start_request_profile,
+    stop_request_profile,
+)
+
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
+# Upper bounds (seconds) of the request duration histogram
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+logger = logging.getLogger("backend.sql")
+
+
+class RequestStats:
+    __slots__ = ("start", "queries", "db_seconds", "serialize_seconds", "route", "endpoint_done")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.route = None
+        self.endpoint_done = None
+
+    def server_timing(self) -> str:
+        total_ms = (time.perf_counter() - self.start) * 1000
+        return (
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.queries} queries", '
+            f"serialize;dur={self.serialize_seconds * 1000:.2f}, "
+            f"total;dur={total_ms:.2f}"
+        )
+
+
+_request_stats: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar("request_stats", default=None)
+
+# Profiles of the request being profiled, one per thread it ran on
+_request_profiles: contextvars.ContextVar[Optional[list]] = contextvars.ContextVar("request_profiles", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+@contextmanager
+def track_serialization():
+    '''
+    Count the enclosed block as serialization time of the current request
+    '''
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.serialize_seconds += time.perf_counter() - start
+
+
+class Metrics:
+    '''
+    Process-wide request counters, by method, route template and status
+    '''
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Dict[Tuple[str, str, str], int] = {}
+        self.duration_buckets: Dict[Tuple[str, str], list] = {}
+        self.duration_sum: Dict[Tuple[str, str], float] = {}
+        self.duration_count: Dict[Tuple[str, str], int] = {}
+        self.queries: Dict[Tuple[str, str], int] = {}
+        self.db_seconds: Dict[Tuple[str, str], float] = {}
+        self.serialize_seconds: Dict[Tuple[str, str], float] = {}
+        self.slow_queries = 0
+
+    def record(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        key = (method, route)
+        with self._lock:
+            request_key = (method, route, str(status))
+            self.requests[request_key] = self.requests.get(request_key, 0) + 1
+            buckets = self.duration_buckets.setdefault(key, [0] * len(DURATION_BUCKETS))
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    buckets[index] += 1
+            self.duration_sum[key] = self.duration_sum.get(key, 0.0) + seconds
+            self.duration_count[key] = self.duration_count.get(key, 0) + 1
+            self.queries[key] = self.queries.get(key, 0) + stats.queries
+            self.db_seconds[key] = self.db_seconds.get(key, 0.0) + stats.db_seconds
+            self.serialize_seconds[key] = self.serialize_seconds.get(key, 0.0) + stats.serialize_seconds
+
+    def record_slow_query(self) -> None:
+        with self._lock:
+            self.slow_queries += 1
+
+
+metrics = Metrics()
+
+
+class InstrumentationMiddleware:
+    '''
+    Pure ASGI middleware (no BaseHTTPMiddleware), so streaming responses pass through untouched
+    '''
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            route = scope.get("route")
+            # Unmatched paths share one label to keep the metric cardinality bounded
+            route_path = getattr(route, "path", "unmatched")
+            metrics.record(scope["method"], route_path, status_code, time.perf_counter() - stats.start, stats)
+
+
+def instrument_engine(engine) -> None:
+    '''
+    Count and time the statements of a (sync) engine; for an AsyncEngine pass its sync_engine
+    '''
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info["query_start"].pop()
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += seconds
+        if seconds * 1000 >= SLOW_QUERY_MS:
+            metrics.record_slow_query()
+            route = getattr(stats, "route", None) or "-"
+            # Parameters are left out: they carry user data
+            logger.warning("slow query (%.1f ms) in %s: %s", seconds * 1000, route, " ".join(statement.split())[:1000])
+
+
+def _mark_endpoint_done() -> None:
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.endpoint_done = time.perf_counter()
+
+
+class TimedRoute(APIRoute):
+    '''
+    APIRoute that attributes to serialization the time from the endpoint's return
+    to the Response being built
+    '''
+    def get_route_handler(self):
+        endpoint = self.dependant.call
+
+        if inspect.iscoroutinefunction(endpoint):
+            @wraps(endpoint)
+            async def timed_endpoint(*args, **kwargs):
+                try:
+                    return await endpoint(*args, **kwargs)
+                finally:
+                    _mark_endpoint_done()
+        else:
+            @wraps(endpoint)
+            def timed_endpoint(*args, **kwargs):
+                # Sync endpoints run in a threadpool worker, out of reach of the
+                # profile started on the event loop thread before Python 3.12
+                profiles = _request_profiles.get()
+                profile = None
+                if profiles is not None and not PROFILE_COVERS_ALL_THREADS:
+                    profile = cProfile.Profile()
+                    profile.enable()
+                try:
+                    return endpoint(*args, **kwargs)
+                finally:
+                    if profile is not None:
+                        profile.disable()
+                        profiles.append(profile)
+                    _mark_endpoint_done()
+
+        self.dependant.call = timed_endpoint
+        handler = super().get_route_handler()
+        route_path = self.path
+
+        async def timed_handler(request):
+            stats = _request_stats.get()
+            if stats is not None:
+                stats.route = route_path
+            if profile_requested(request.headers):
+                return await profiled_handler(request)
+            response = await handler(request)
+            if stats is not None and stats.endpoint_done is not None:
+                stats.serialize_seconds += time.perf_counter() - stats.endpoint_done
+            return response
+
+        async def profiled_handler(request):
+            profile = start_request_profile()
+            if profile is None:
+                return PlainTextResponse("Another request is being profiled", status_code=409)
+            profiles = [profile]
+            token = _request_profiles.set(profiles)
+            try:
+                response = await handler(request)
+            finally:
+                stop_request_profile(profile)
+                _request_profiles.reset(token)
+            return PlainTextResponse(
+                profile_report(profiles),
+                headers={"X-Profile-Status": str(response.status_code), "X-Profile-Route": route_path},
+            )
+
+        return timed_handler
+
+
+def render_metrics() -> str:
+    from backend.database import pool_status
+
+    lines = []
+
+    def family(name: str, metric_type: str, description: str) -> None:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+    def labels(**values) -> str:
+        escaped = (f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+                   for key, value in values.items())
+        return "{" + ",".join(escaped) + "}"
+
+    with metrics._lock:
+        requests = dict(metrics.requests)
+        duration_buckets = {key: list(value) for key, value in metrics.duration_buckets.items()}
+        duration_sum = dict(metrics.duration_sum)
+        duration_count = dict(metrics.duration_count)
+        queries = dict(metrics.queries)
+        db_seconds = dict(metrics.db_seconds)
+        serialize_seconds = dict(metrics.serialize_seconds)
+        slow_queries = metrics.slow_queries
+
+    family("http_requests_total", "counter", "HTTP requests by method, route and status.")
+    for (method, route, status), count in sorted(requests.items()):
+        lines.append(f"http_requests_total{labels(method=method, route=route, status=status)} {count}")
+
+    family("http_request_duration_seconds", "histogram", "HTTP request wall time.")
+    for (method, route), buckets in sorted(duration_buckets.items()):
+        count = duration_count[(method, route)]
+        for bound, bucket_count in zip(DURATION_BUCKETS, buckets):
+            lines.append(f"http_request_duration_seconds_bucket{labels(method=method, route=route, le=bound)} {bucket_count}")
+        lines.append(f"http_request_duration_seconds_bucket{labels(method=method, route=route, le='+Inf')} {count}")
+        lines.append(f"http_request_duration_seconds_sum{labels(method=method, route=route)} {duration_sum[(method, route)]:.6f}")
+        lines.append(f"http_request_duration_seconds_count{labels(method=method, route=route)} {count}")
+
+    family("db_queries_total", "counter", "SQL statements executed while handling requests.")
+    for (method, route), count in sorted(queries.items()):
+        lines.append(f"db_queries_total{labels(method=method, route=route)} {count}")
+
+    family("db_query_seconds_total", "counter", "Time spent in SQL statements while handling requests.")
+    for (method, route), seconds in sorted(db_seconds.items()):
+        lines.append(f"db_query_seconds_total{labels(method=method, route=route)} {seconds:.6f}")
+
+    family("serialization_seconds_total", "counter", "Time spent serializing responses.")
+    for (method, route), seconds in sorted(serialize_seconds.items()):
+        lines.append(f"serialization_seconds_total{labels(method=method, route=route)} {seconds:.6f}")
+
+    family("db_slow_queries_total", "counter", f"SQL statements slower than {SLOW_QUERY_MS:g} ms.")
+    lines.append(f"db_slow_queries_total {slow_queries}")
+
+    pool = pool_status()
+    for name in ("size", "checked_out", "overflow"):
+        if name in pool:
+            family(f"db_pool_{name}", "gauge", f"Connection pool {name.replace('_', ' ')}.")
+            lines.append(f"db_pool_{name} {pool[name]}")
+    family("db_pool_checkout_timeouts_total", "counter", "Connection checkouts that timed out.")
+    lines.append(f"db_pool_checkout_timeouts_total {pool['checkout_timeouts']}")
+    family("db_pool_checkout_wait_seconds_total", "counter", "Time spent waiting for a pooled connection.")
+    lines.append(f"db_pool_checkout_wait_seconds_total {pool['checkout_wait_seconds']:.6f}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,39 @@
+'''
+Prefix lookups for the search-as-you-type selectors (GET /api/<entity>/lookup):
+the ids and names of at most a few rows whose name starts with what was typed.
+
+Names are matched case-insensitively as a range on lower(name), so that the
+expression indexes of migration 0006 serve both the match and the order. On
+Postgres the key is compared in byte order (COLLATE "C"), like the index, which
+keeps the range exact whatever the database collation.
+'''
+import sys
+from sqlalchemy import and_, func
+
+
+# (index, table, name column, id column) created by migration 0006
+LOOKUP_INDEXES = [
+    ("ix_user_name_lookup", "user_table", "name", "user_id"),
+    ("ix_project_name_lookup", "project_table", "project_name", "project_id"),
+    ("ix_task_name_lookup", "task_table", "task_name", "task_id"),
+]
+
+
+def name_key(column, dialect_name: str):
+    key = func.lower(column)
+    if dialect_name == "postgresql":
+        key = key.collate("C")
+    return key
+
+
+def prefix_range(key, prefix: str):
+    '''
+    key >= prefix AND key < the smallest string above every string starting with prefix
+    '''
+    prefix = prefix.lower()
+    # Trailing U+10FFFF has no successor: bump the character before it instead
+    stem = prefix.rstrip(chr(sys.maxunicode))
+    if not stem:
+        return key >= prefix
+    upper = stem[:-1] + chr(ord(stem[-1]) + 1)
+    return and_(key >= prefix, key < upper)
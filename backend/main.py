@@ -1,17 +1,48 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from backend.database import engine
-from backend.routers import user_router, project_router, task_router
-from backend.models import project_model, task_model, user_model
+from fastapi.middleware.gzip import GZipMiddleware
+from backend.database import engine, async_engine, settings
+from backend.instrumentation import InstrumentationMiddleware, instrument_engine
+from backend.migrate import check_schema, check_schema_async
+from backend.routers import system_router, metrics_router, admin_router
 
+if settings.is_async:
+    # DB_MODE=async: every database route is async and runs on the async engine,
+    # the only one created in this mode
+    from backend.routers import (
+        async_user_router as user_router,
+        async_project_router as project_router,
+        async_task_router as task_router,
+        async_stats_router as stats_router,
+    )
+else:
+    from backend.routers import user_router, project_router, task_router, stats_router
 
-project_model.Base.metadata.create_all(bind=engine)
-task_model.Base.metadata.create_all(bind=engine)
-user_model.Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema changes are applied by `python -m backend.migrate`; startup only
+    # verifies the version so that many workers can boot without running DDL
+    if settings.is_async:
+        await check_schema_async(async_engine)
+    else:
+        check_schema(engine)
+    yield
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
+# Small bodies are not worth compressing; the event stream is never compressed
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(InstrumentationMiddleware)
+
+instrument_engine(async_engine.sync_engine if settings.is_async else engine)
 
 
 app.include_router(user_router.router, prefix="/api", tags=["Users"])
 app.include_router(project_router.router, prefix="/api", tags=["Projects"])
 app.include_router(task_router.router, prefix="/api", tags=["Tasks"])
+app.include_router(stats_router.router, prefix="/api", tags=["Stats"])
+app.include_router(system_router.router, prefix="/api", tags=["System"])
+app.include_router(admin_router.router, prefix="/api", tags=["Admin"])
+# Scraped by Prometheus at the conventional path, outside /api
+app.include_router(metrics_router.router)
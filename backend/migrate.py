@@ -0,0 +1,124 @@
+'''
+Schema migrations, run as a separate step before starting the API:
+
+    python -m backend.migrate            # apply pending migrations
+    python -m backend.migrate current    # print the database schema version
+
+The API only checks at startup that the database is at SCHEMA_VERSION
+(one indexed SELECT), so starting many workers never runs DDL.
+'''
+import sys
+from datetime import datetime, timezone
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, select, func, insert, inspect, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from backend.migrations import load_migrations
+
+
+MIGRATIONS = load_migrations()
+
+SCHEMA_VERSION = MIGRATIONS[-1].VERSION
+
+# Arbitrary key of the Postgres advisory lock serializing concurrent migrate runs
+MIGRATION_LOCK_ID = 20250917
+
+version_metadata = MetaData()
+
+schema_version_table = Table(
+    "schema_version", version_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+def current_version(connection) -> int:
+    if not inspect(connection).has_table(schema_version_table.name):
+        return 0
+    return connection.execute(select(func.max(schema_version_table.c.version))).scalar() or 0
+
+
+def upgrade(engine, target: int = SCHEMA_VERSION) -> list:
+    '''
+    Apply every pending migration up to target, each in its own transaction
+    together with its schema_version row. Returns the versions applied.
+    '''
+    applied = []
+    with engine.begin() as connection:
+        version_metadata.create_all(bind=connection, checkfirst=True)
+
+    for migration in MIGRATIONS:
+        if migration.VERSION > target:
+            break
+        with engine.begin() as connection:
+            if connection.dialect.name == "postgresql":
+                connection.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": MIGRATION_LOCK_ID})
+            if migration.VERSION <= current_version(connection):
+                continue
+            migration.upgrade(connection)
+            connection.execute(insert(schema_version_table).values(
+                version=migration.VERSION,
+                description=migration.DESCRIPTION,
+                applied_at=datetime.now(timezone.utc),
+            ))
+            applied.append(migration.VERSION)
+    return applied
+
+
+def check_schema_version(connection) -> int:
+    '''
+    Cheap startup check: fail fast if the database is not at SCHEMA_VERSION
+    '''
+    try:
+        version = connection.execute(select(func.max(schema_version_table.c.version))).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        # schema_version doesn't exist yet: nothing was ever migrated
+        version = 0
+    if version != SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Database schema is at version {version} but this code expects {SCHEMA_VERSION}. "
+            "Run `python -m backend.migrate` first."
+        )
+    return version
+
+
+def check_schema(engine) -> int:
+    with engine.connect() as connection:
+        return check_schema_version(connection)
+
+
+async def check_schema_async(async_engine) -> int:
+    async with async_engine.connect() as connection:
+        return await connection.run_sync(check_schema_version)
+
+
+def main(argv=None) -> int:
+    from backend.database import create_sync_engine
+
+    engine = create_sync_engine()
+
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "upgrade"
+
+    if command == "current":
+        with engine.connect() as connection:
+            print(f"Schema version {current_version(connection)} (latest {SCHEMA_VERSION})")
+        return 0
+
+    if command == "upgrade":
+        applied = upgrade(engine)
+        if applied:
+            print(f"Applied migrations: {', '.join(map(str, applied))} (now at version {SCHEMA_VERSION})")
+        else:
+            print(f"Schema already at version {SCHEMA_VERSION}")
+        return 0
+
+    print("usage: python -m backend.migrate [upgrade|current]")
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
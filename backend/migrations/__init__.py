@@ -0,0 +1,16 @@
+'''
+Versioned schema migrations. Each module is named mNNNN_<description>.py and
+defines VERSION, DESCRIPTION and upgrade(connection). They are applied in
+order by `python -m backend.migrate`, never by the app itself.
+'''
+import importlib
+import pkgutil
+
+
+def load_migrations() -> list:
+    modules = [
+        importlib.import_module(f"{__name__}.{info.name}")
+        for info in pkgutil.iter_modules(__path__)
+        if info.name.startswith("m")
+    ]
+    return sorted(modules, key=lambda module: module.VERSION)
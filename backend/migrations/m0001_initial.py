@@ -0,0 +1,48 @@
+'''
+Tables as they were created by Base.metadata.create_all before migrations
+existed. checkfirst lets databases created that way adopt the migrations.
+'''
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, ForeignKey
+
+
+VERSION = 1
+DESCRIPTION = "initial schema"
+
+
+def upgrade(connection) -> None:
+    metadata = MetaData()
+
+    Table(
+        "user_table", metadata,
+        Column("user_id", Integer, primary_key=True, index=True),
+        Column("name", String, index=True),
+        Column("email", String, index=True),
+        Column("area", String, index=True),
+        Column("created_at", DateTime(timezone=True), index=True),
+    )
+    Table(
+        "project_table", metadata,
+        Column("project_id", Integer, primary_key=True, index=True),
+        Column("project_name", String, index=True),
+        Column("project_description", String, index=True),
+        Column("created_at", DateTime(timezone=True), index=True),
+    )
+    Table(
+        "task_table", metadata,
+        Column("task_id", Integer, primary_key=True, index=True),
+        Column("task_name", String, index=True),
+        Column("task_description", String, index=True),
+        Column("status", String, index=True),
+        Column("deadline", DateTime),
+        Column("project_id", Integer, ForeignKey("project_table.project_id"), nullable=False),
+        Column("user_id", Integer, ForeignKey("user_table.user_id"), nullable=False),
+    )
+    Table(
+        "task_counter_table", metadata,
+        Column("user_id", Integer, ForeignKey("user_table.user_id"), primary_key=True),
+        Column("project_id", Integer, ForeignKey("project_table.project_id"), primary_key=True),
+        Column("status", String, primary_key=True),
+        Column("task_count", Integer, nullable=False),
+    )
+
+    metadata.create_all(bind=connection, checkfirst=True)
@@ -0,0 +1,53 @@
+'''
+Replace the one-index-per-column set with indexes matching the queries:
+redundant primary key indexes and B-trees on free text are dropped, the task
+foreign keys get composite indexes shared with the status filter and keyset order.
+'''
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, Index, text
+
+
+VERSION = 2
+DESCRIPTION = "indexes matching the access paths"
+
+DROPPED_INDEXES = [
+    "ix_user_table_user_id",
+    "ix_user_table_name",
+    "ix_user_table_email",
+    "ix_user_table_area",
+    "ix_user_table_created_at",
+    "ix_project_table_project_id",
+    "ix_project_table_project_name",
+    "ix_project_table_project_description",
+    "ix_project_table_created_at",
+    "ix_task_table_task_id",
+    "ix_task_table_task_name",
+    "ix_task_table_task_description",
+    "ix_task_table_status",
+]
+
+
+def upgrade(connection) -> None:
+    for index_name in DROPPED_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+    metadata = MetaData()
+    task_table = Table(
+        "task_table", metadata,
+        Column("task_id", Integer),
+        Column("status", String),
+        Column("deadline", DateTime),
+        Column("project_id", Integer),
+        Column("user_id", Integer),
+    )
+    task_counter_table = Table(
+        "task_counter_table", metadata,
+        Column("project_id", Integer),
+    )
+    indexes = [
+        Index("ix_task_project_status", task_table.c.project_id, task_table.c.status, task_table.c.task_id),
+        Index("ix_task_user_status", task_table.c.user_id, task_table.c.status, task_table.c.task_id),
+        Index("ix_task_deadline", task_table.c.deadline, task_table.c.task_id),
+        Index("ix_task_counter_project", task_counter_table.c.project_id),
+    ]
+    for index in indexes:
+        index.create(bind=connection, checkfirst=True)
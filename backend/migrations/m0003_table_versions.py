@@ -0,0 +1,23 @@
+'''
+Change counter per table, bumped by every write. The routers derive ETags from
+it, so a conditional GET can be answered without reading the rows.
+'''
+from sqlalchemy import MetaData, Table, Column, String, BigInteger, insert
+
+
+VERSION = 3
+DESCRIPTION = "table change counters"
+
+
+def upgrade(connection) -> None:
+    metadata = MetaData()
+    table_version = Table(
+        "table_version", metadata,
+        Column("table_name", String, primary_key=True),
+        Column("version", BigInteger, nullable=False),
+    )
+    table_version.create(bind=connection)
+    connection.execute(insert(table_version), [
+        {"table_name": table_name, "version": 0}
+        for table_name in ("user_table", "project_table", "task_table")
+    ])
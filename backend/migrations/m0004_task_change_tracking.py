@@ -0,0 +1,33 @@
+'''
+Change tracking for tasks: created/updated timestamps, the change sequence of
+the last write (task_table change counter) and tombstones for deleted tasks,
+so clients can sync the rows changed since a token.
+'''
+from sqlalchemy import MetaData, Table, Column, Integer, DateTime, BigInteger, Index, text
+
+
+VERSION = 4
+DESCRIPTION = "task change tracking"
+
+
+def upgrade(connection) -> None:
+    connection.execute(text("ALTER TABLE task_table ADD COLUMN created_at TIMESTAMP WITH TIME ZONE"))
+    connection.execute(text("ALTER TABLE task_table ADD COLUMN updated_at TIMESTAMP WITH TIME ZONE"))
+    connection.execute(text("ALTER TABLE task_table ADD COLUMN change_seq BIGINT NOT NULL DEFAULT 0"))
+
+    metadata = MetaData()
+    task_table = Table(
+        "task_table", metadata,
+        Column("task_id", Integer),
+        Column("change_seq", BigInteger),
+    )
+    Index("ix_task_change_seq", task_table.c.change_seq, task_table.c.task_id).create(bind=connection)
+
+    task_tombstone = Table(
+        "task_tombstone", metadata,
+        Column("task_id", Integer, primary_key=True),
+        Column("change_seq", BigInteger, nullable=False),
+        Column("deleted_at", DateTime(timezone=True)),
+        Index("ix_task_tombstone_change_seq", "change_seq", "task_id"),
+    )
+    task_tombstone.create(bind=connection)
@@ -0,0 +1,65 @@
+'''
+Full-text index over task names and descriptions for GET /api/task/search
+(see backend/search.py): a generated tsvector column with a GIN index on
+Postgres, an FTS5 table maintained by triggers on SQLite.
+'''
+from sqlalchemy import text
+from backend.search import SEARCH_CONFIG
+
+
+VERSION = 5
+DESCRIPTION = "task full-text search"
+
+
+POSTGRES_STATEMENTS = [
+    f"""
+    ALTER TABLE task_table ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(task_name, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(task_description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_task_search ON task_table USING GIN (search_vector)",
+]
+
+SQLITE_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE task_search USING fts5(
+        task_name, task_description,
+        content='task_table', content_rowid='task_id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER task_search_insert AFTER INSERT ON task_table BEGIN
+        INSERT INTO task_search(rowid, task_name, task_description)
+        VALUES (new.task_id, new.task_name, new.task_description);
+    END
+    """,
+    """
+    CREATE TRIGGER task_search_delete AFTER DELETE ON task_table BEGIN
+        INSERT INTO task_search(task_search, rowid, task_name, task_description)
+        VALUES ('delete', old.task_id, old.task_name, old.task_description);
+    END
+    """,
+    """
+    CREATE TRIGGER task_search_update AFTER UPDATE OF task_name, task_description ON task_table BEGIN
+        INSERT INTO task_search(task_search, rowid, task_name, task_description)
+        VALUES ('delete', old.task_id, old.task_name, old.task_description);
+        INSERT INTO task_search(rowid, task_name, task_description)
+        VALUES (new.task_id, new.task_name, new.task_description);
+    END
+    """,
+    "INSERT INTO task_search(task_search) VALUES ('rebuild')",
+]
+
+
+def upgrade(connection) -> None:
+    if connection.dialect.name == "postgresql":
+        statements = POSTGRES_STATEMENTS
+    elif connection.dialect.name == "sqlite":
+        statements = SQLITE_STATEMENTS
+    else:
+        # No text index: /task/search answers 501 on other databases
+        statements = []
+    for statement in statements:
+        connection.execute(text(statement))
@@ -0,0 +1,19 @@
+'''
+Expression indexes on lower(name) for the prefix lookups of the
+search-as-you-type selectors (see backend/lookup.py).
+'''
+from sqlalchemy import text
+from backend.lookup import LOOKUP_INDEXES
+
+
+VERSION = 6
+DESCRIPTION = "name lookup indexes"
+
+
+def upgrade(connection) -> None:
+    # Byte order on Postgres, matching the lookup queries
+    collation = ' COLLATE "C"' if connection.dialect.name == "postgresql" else ""
+    for index_name, table_name, name_column, id_column in LOOKUP_INDEXES:
+        connection.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} (lower({name_column}){collation}, {id_column})"
+        ))
@@ -0,0 +1,14 @@
+'''
+Task counter buckets left at zero by earlier versions, which kept them and so
+blocked deleting their user or project. The write paths now delete a bucket
+when it empties.
+'''
+from sqlalchemy import text
+
+
+VERSION = 7
+DESCRIPTION = "drop empty task counters"
+
+
+def upgrade(connection) -> None:
+    connection.execute(text("DELETE FROM task_counter_table WHERE task_count <= 0"))
@@ -0,0 +1,20 @@
+'''
+Tasks written before change tracking (version 4) have change_seq 0, which the
+delta sync never returns. Record them as one new change of task_table, so a
+full sync (since=0) includes them. This covers databases upgraded through
+version 4 and those created earlier and upgraded now.
+'''
+from sqlalchemy import text
+
+
+VERSION = 8
+DESCRIPTION = "stamp tasks missing from the delta sync"
+
+
+def upgrade(connection) -> None:
+    connection.execute(text("UPDATE table_version SET version = version + 1 WHERE table_name = 'task_table'"))
+    connection.execute(text(
+        "UPDATE task_table SET change_seq = "
+        "(SELECT version FROM table_version WHERE table_name = 'task_table') "
+        "WHERE change_seq = 0"
+    ))
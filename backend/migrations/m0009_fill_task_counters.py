@@ -0,0 +1,19 @@
+'''
+The task counters were added empty: databases that already had tasks showed no
+dashboard metrics until someone ran "python -m backend.counters rebuild".
+Recompute them from task_table, which also fixes any drift from earlier versions.
+'''
+from sqlalchemy import text
+
+
+VERSION = 9
+DESCRIPTION = "fill task counters"
+
+
+def upgrade(connection) -> None:
+    connection.execute(text("DELETE FROM task_counter_table"))
+    connection.execute(text(
+        "INSERT INTO task_counter_table (user_id, project_id, status, task_count) "
+        "SELECT user_id, project_id, status, count(*) FROM task_table "
+        "GROUP BY user_id, project_id, status"
+    ))
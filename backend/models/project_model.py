@@ -7,9 +7,9 @@ from backend.database import Base
 class ProjectModel(Base):
     __tablename__ = "project_table"
 
-    project_id = Column(Integer, primary_key=True, index=True)
-    project_name = Column(String, index=True)
-    project_description = Column(String, index = True)
-    created_at = Column(DateTime(timezone=True),default=func.now(),index=True)
+    project_id = Column(Integer, primary_key=True)
+    project_name = Column(String)
+    project_description = Column(String)
+    created_at = Column(DateTime(timezone=True),default=func.now())
 
     tasks = relationship("TaskModel", back_populates="project")
\ No newline at end of file
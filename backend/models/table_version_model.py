@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, BigInteger
+from backend.database import Base
+
+
+class TableVersionModel(Base):
+    __tablename__ = "table_version"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from backend.database import Base
+
+
+class TaskCounterModel(Base):
+    __tablename__ = "task_counter_table"
+    # The primary key leads with user_id; stats filtered by project use this one
+    __table_args__ = (
+        Index("ix_task_counter_project", "project_id"),
+    )
+
+    user_id = Column(Integer, ForeignKey("user_table.user_id"), primary_key=True)
+    project_id = Column(Integer, ForeignKey("project_table.project_id"), primary_key=True)
+    status = Column(String, primary_key=True)
+    task_count = Column(Integer, nullable=False, default=0)
@@ -1,21 +1,35 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime, BigInteger
 from sqlalchemy.sql import func
 from backend.database import Base
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 
 class TaskModel(Base):
     __tablename__ = "task_table"
+    # Indexes follow the read paths: list pages filtered by project/user and status
+    # and ordered by task_id (keyset), deadline ranges. Both FKs lead an index.
+    # A status-only filter (3 values) is served well enough by the primary key order.
+    __table_args__ = (
+        Index("ix_task_project_status", "project_id", "status", "task_id"),
+        Index("ix_task_user_status", "user_id", "status", "task_id"),
+        Index("ix_task_deadline", "deadline", "task_id"),
+        Index("ix_task_change_seq", "change_seq", "task_id"),
+    )
 
-    task_id = Column(Integer, primary_key=True, index=True)
-    task_name = Column(String, index=True)
-    task_description = Column(String, index=True)
-    status = Column(String, index=True)
+    task_id = Column(Integer, primary_key=True)
+    task_name = Column(String)
+    task_description = Column(String)
+    status = Column(String)
     deadline = Column(DateTime)
 
     project_id = Column(Integer, ForeignKey("project_table.project_id"), nullable=False)
     user_id = Column(Integer, ForeignKey("user_table.user_id"),nullable=False)
 
+    # Change tracking: change_seq is the task_table change counter of the last write
+    created_at = Column(DateTime(timezone=True), default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+    change_seq = Column(BigInteger, nullable=False, default=0)
+
     project = relationship("ProjectModel",back_populates='tasks')
     responsible = relationship("UserModel",back_populates='tasks')
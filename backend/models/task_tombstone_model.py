@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, DateTime, BigInteger, Index
+from sqlalchemy.sql import func
+from backend.database import Base
+
+
+class TaskTombstoneModel(Base):
+    __tablename__ = "task_tombstone"
+    __table_args__ = (
+        Index("ix_task_tombstone_change_seq", "change_seq", "task_id"),
+    )
+
+    task_id = Column(Integer, primary_key=True)
+    change_seq = Column(BigInteger, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), default=func.now())
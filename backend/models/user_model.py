@@ -7,10 +7,10 @@ from sqlalchemy.orm import relationship
 class UserModel(Base):
     __tablename__ = "user_table"
 
-    user_id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, index=True)
-    email = Column(String, index=True)
-    area = Column(String, index=True)
-    created_at = Column(DateTime(timezone=True),default=func.now(),index=True)
+    user_id = Column(Integer, primary_key=True)
+    name = Column(String)
+    email = Column(String)
+    area = Column(String)
+    created_at = Column(DateTime(timezone=True),default=func.now())
 
     tasks = relationship("TaskModel",back_populates='responsible')
\ No newline at end of file
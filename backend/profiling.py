@@ -0,0 +1,132 @@
+'''
+CPU profiling of a running worker.
+
+- sample_stacks(): a sampling profiler. It polls the stacks of every thread of the
+  process (event loop and threadpool workers) for a few seconds and returns them in
+  the collapsed format read by flamegraph.pl and speedscope. Served by
+  GET /api/admin/profile, which needs ADMIN_TOKEN to be set and sent back in the
+  X-Admin-Token header; without ADMIN_TOKEN the route does not exist (404).
+- Per-request cProfile: outside production (APP_ENV != "production"), a request
+  sent with `X-Profile: 1` runs under cProfile and its response body is replaced by
+  the pstats report (see TimedRoute in backend/instrumentation.py).
+'''
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN") or None
+
+APP_ENV = os.getenv("APP_ENV", "production").strip().lower()
+
+REQUEST_PROFILING = APP_ENV != "production"
+
+PROFILE_HEADER = "x-profile"
+
+# Entries of the pstats report returned for a profiled request
+PROFILE_REPORT_LINES = 60
+
+MAX_SAMPLE_SECONDS = 60.0
+
+_sampling = threading.Lock()
+
+# cProfile allows one active profile per thread (per process since Python 3.12),
+# so profiled requests run one at a time
+_request_profiling = threading.Lock()
+
+# Since Python 3.12 cProfile hooks sys.monitoring, which sees every thread: the profile
+# started on the event loop also covers the threadpool worker running a sync route,
+# as well as any other request served meanwhile
+PROFILE_COVERS_ALL_THREADS = sys.version_info >= (3, 12)
+
+
+class ProfilerBusy(RuntimeError):
+    pass
+
+
+def admin_token_matches(token: Optional[str]) -> bool:
+    if ADMIN_TOKEN is None or token is None:
+        return False
+    return hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+
+def _short_filename(filename: str) -> str:
+    # Relative to the longest sys.path entry containing it: backend/crud.py, sqlalchemy/orm/query.py...
+    for prefix in sorted((os.path.join(path, "") for path in sys.path if path), key=len, reverse=True):
+        if filename.startswith(prefix):
+            return filename[len(prefix):]
+    return filename
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({_short_filename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def sample_stacks(seconds: float, interval: float = 0.005) -> str:
+    '''
+    Sample every thread's stack each `interval` seconds for `seconds`, and return
+    one "thread;outer;...;inner count" line per distinct stack, most frequent first.
+    Only one sampling runs at a time per worker (ProfilerBusy otherwise).
+    '''
+    if not _sampling.acquire(blocking=False):
+        raise ProfilerBusy("A profile is already being taken on this worker")
+    try:
+        own_thread = threading.get_ident()
+        stacks = Counter()
+        deadline = time.monotonic() + min(seconds, MAX_SAMPLE_SECONDS)
+        while time.monotonic() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                labels.append(names.get(thread_id, str(thread_id)))
+                stacks[";".join(reversed(labels))] += 1
+            time.sleep(interval)
+    finally:
+        _sampling.release()
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def profile_requested(headers) -> bool:
+    return REQUEST_PROFILING and headers.get(PROFILE_HEADER, "").strip().lower() in ("1", "true", "yes")
+
+
+def profile_report(profiles: list, sort: str = "cumulative") -> str:
+    '''
+    Merge the profiles of one request (event loop thread plus, for sync routes,
+    the threadpool worker) into a pstats text report
+    '''
+    output = io.StringIO()
+    stats = pstats.Stats(profiles[0], stream=output)
+    for profile in profiles[1:]:
+        stats.add(profile)
+    stats.strip_dirs().sort_stats(sort).print_stats(PROFILE_REPORT_LINES)
+    return output.getvalue()
+
+
+def start_request_profile() -> Optional[cProfile.Profile]:
+    '''
+    Profile of the calling thread, or None when another request is being profiled
+    '''
+    if not _request_profiling.acquire(blocking=False):
+        return None
+    profile = cProfile.Profile()
+    profile.enable()
+    return profile
+
+
+def stop_request_profile(profile: cProfile.Profile) -> None:
+    profile.disable()
+    _request_profiling.release()
@@ -0,0 +1,28 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from backend.instrumentation import TimedRoute
+from backend.profiling import ADMIN_TOKEN, MAX_SAMPLE_SECONDS, ProfilerBusy, admin_token_matches, sample_stacks
+
+
+def require_admin(x_admin_token: Optional[str] = Header(default=None)):
+    if ADMIN_TOKEN is None:
+        # Admin routes are opt-in: without ADMIN_TOKEN they do not exist
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not admin_token_matches(x_admin_token):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(require_admin)])
+
+@router.get("/admin/profile", response_class=PlainTextResponse)
+def read_profile_route(
+    seconds: float = Query(10.0, gt=0, le=MAX_SAMPLE_SECONDS),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+):
+    # A sync route: the sampling runs in a threadpool worker while the event
+    # loop and the other workers keep serving the traffic being profiled
+    try:
+        return PlainTextResponse(sample_stacks(seconds, interval_ms / 1000))
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
@@ -0,0 +1,106 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import get_async_db
+from backend.instrumentation import TimedRoute
+from backend.schemas.project_schema import ProjectCreate, ProjectUpdate, ProjectResponse
+from sqlalchemy.exc import SQLAlchemyError
+from backend.serializers import fast_json_response, FAST_SERIALIZATION
+from backend.conditional import not_modified_async, not_modified_since, PROJECT_TABLES
+from backend.table_versions import get_versions_async
+from typing import List, Optional
+from backend.schemas.lookup_schema import LookupItem
+from backend.crud import lookup_projects, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, DEFAULT_LOOKUP_LIMIT, MAX_LOOKUP_LIMIT
+from backend.async_crud import (
+    create_project,
+    get_project_cached,
+    get_all_projects,
+    get_all_project_rows,
+    update_project,
+    delete_project
+)
+
+
+router = APIRouter(route_class=TimedRoute)
+
+@router.post("/project/", response_model=ProjectResponse)
+async def create_project_route(project: ProjectCreate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        return await create_project(db=db, project=project)
+
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal error in database: {e}"
+        )
+
+
+@router.get("/project/", response_model=List[ProjectResponse])
+async def read_all_projects_route(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = Query(None, description="Cursor returned in the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    not_modified_response = await not_modified_async(db, request, response, PROJECT_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    read_page = get_all_project_rows if FAST_SERIALIZATION else get_all_projects
+    projects, next_cursor = await read_page(db, limit=limit, after=after)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    if FAST_SERIALIZATION:
+        return fast_json_response(projects, response)
+    return projects
+
+
+@router.get("/project/lookup", response_model=List[LookupItem])
+async def lookup_projects_route(
+    request: Request,
+    response: Response,
+    prefix: str = Query("", max_length=100, description="Start of the name, any case, or an id"),
+    limit: int = Query(DEFAULT_LOOKUP_LIMIT, ge=1, le=MAX_LOOKUP_LIMIT),
+    db: AsyncSession = Depends(get_async_db)
+):
+    not_modified_response = await not_modified_async(db, request, response, PROJECT_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    return await db.run_sync(lookup_projects, prefix=prefix.strip(), limit=limit)
+
+@router.get("/project/{project_id}", response_model=ProjectResponse)
+async def read_project_route(project_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    versions = await get_versions_async(db, PROJECT_TABLES)
+    not_modified_response = not_modified_since(request, response, versions)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    db_project = await get_project_cached(db, project_id=project_id, versions=versions)
+    if db_project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return db_project
+
+
+@router.put("/project/{project_id}", response_model=ProjectResponse)
+async def update_project_route(project_id: int, project: ProjectUpdate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        db_project = await update_project(db, project_id=project_id, project=project)
+        if db_project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return db_project
+
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal error in database: {e}"
+        )
+
+@router.delete("/project/{project_id}", response_model=ProjectResponse)
+async def delete_project_route(project_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_project = await delete_project(db, project_id=project_id)
+    if db_project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return db_project
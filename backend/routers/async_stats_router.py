@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import get_async_db
+from backend.instrumentation import TimedRoute
+from backend.schemas.stats_schema import TaskOverview, StatusCount, UserStatusCount
+from typing import List, Optional
+from backend.crud import (
+    get_task_overview,
+    get_task_status_counts,
+    get_user_status_counts
+)
+
+
+router = APIRouter(route_class=TimedRoute)
+
+@router.get("/stats/overview", response_model=TaskOverview)
+async def read_task_overview_route(
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await db.run_sync(get_task_overview, user_id=user_id, project_id=project_id)
+
+@router.get("/stats/status", response_model=List[StatusCount])
+async def read_status_counts_route(
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await db.run_sync(get_task_status_counts, user_id=user_id, project_id=project_id)
+
+@router.get("/stats/user-status", response_model=List[UserStatusCount])
+async def read_user_status_counts_route(
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await db.run_sync(get_user_status_counts, user_id=user_id, project_id=project_id)
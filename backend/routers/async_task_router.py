@@ -0,0 +1,280 @@
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import get_async_db, AsyncSessionLocal
+from backend.instrumentation import TimedRoute
+from backend.schemas.task_schema import (
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskBulkUpdate,
+    TaskBulkResult,
+    TaskChanges,
+    TaskChangesHead,
+    StatusBase
+)
+from backend.schemas.lookup_schema import LookupItem
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from backend.serializers import fast_json_response, FAST_SERIALIZATION
+from backend.conditional import not_modified_async, not_modified_since, TASK_TABLES
+from backend.table_versions import get_versions_async
+from backend.events import event_stream
+from backend.export import MEDIA_TYPES, export_header, export_chunk
+from backend.search import SearchNotSupported
+from typing import List, Optional, Literal
+from datetime import datetime
+from backend.crud import (
+    bulk_create_tasks,
+    bulk_update_tasks,
+    bulk_delete_tasks,
+    get_task_changes,
+    get_task_changes_head,
+    lookup_tasks,
+    search_tasks,
+    search_task_rows,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    DEFAULT_LOOKUP_LIMIT,
+    MAX_LOOKUP_LIMIT,
+    BULK_BATCH_SIZE,
+    MAX_BULK_BATCH_SIZE
+)
+from backend.async_crud import (
+    create_task,
+    get_task_cached,
+    get_all_tasks,
+    get_all_task_rows,
+    update_task,
+    delete_task,
+    iter_task_export_rows
+)
+
+
+router = APIRouter(route_class=TimedRoute)
+
+@router.post("/task/", response_model=TaskResponse)
+async def create_task_route(task: TaskCreate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        return await create_task(db=db, task=task)
+
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal error in database: {e}"
+        )
+
+@router.get("/task/", response_model=List[TaskResponse])
+async def read_all_tasks_route(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = Query(None, description="Cursor returned in the X-Next-Cursor header"),
+    status: Optional[StatusBase] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    not_modified_response = await not_modified_async(db, request, response, TASK_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    read_page = get_all_task_rows if FAST_SERIALIZATION else get_all_tasks
+    tasks, next_cursor = await read_page(
+        db,
+        limit=limit,
+        after=after,
+        status=status.value if status else None,
+        user_id=user_id,
+        project_id=project_id,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    if FAST_SERIALIZATION:
+        return fast_json_response(tasks, response)
+    return tasks
+
+async def _run_bulk(db: AsyncSession, operation, items, batch_size: int):
+    try:
+        return await db.run_sync(operation, items, batch_size=batch_size)
+
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="One or more tasks reference a user or project that doesn't exist. Nothing was saved"
+        )
+
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal error in database: {e}"
+        )
+
+@router.post("/task/bulk", response_model=List[TaskBulkResult])
+async def bulk_create_tasks_route(
+    tasks: List[TaskCreate],
+    batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=MAX_BULK_BATCH_SIZE),
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await _run_bulk(db, bulk_create_tasks, tasks, batch_size)
+
+@router.patch("/task/bulk", response_model=List[TaskBulkResult])
+async def bulk_update_tasks_route(
+    tasks: List[TaskBulkUpdate],
+    batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=MAX_BULK_BATCH_SIZE),
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await _run_bulk(db, bulk_update_tasks, tasks, batch_size)
+
+@router.delete("/task/bulk", response_model=List[TaskBulkResult])
+async def bulk_delete_tasks_route(
+    task_ids: List[int] = Body(...),
+    batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=MAX_BULK_BATCH_SIZE),
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await _run_bulk(db, bulk_delete_tasks, task_ids, batch_size)
+
+async def _stream_export(export_format: str, filters: dict):
+    # The request's session is closed before a streaming body is sent,
+    # so the generator owns its own session for the lifetime of the cursor
+    async with AsyncSessionLocal() as db:
+        yield export_header(export_format)
+        async for rows in iter_task_export_rows(db, **filters):
+            yield export_chunk(export_format, rows)
+
+@router.get("/task/export")
+async def export_tasks_route(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    status: Optional[StatusBase] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None
+):
+    filters = {
+        "status": status.value if status else None,
+        "user_id": user_id,
+        "project_id": project_id,
+        "deadline_from": deadline_from,
+        "deadline_to": deadline_to
+    }
+    return StreamingResponse(
+        _stream_export(format, filters),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename=tasks.{format}"}
+    )
+
+@router.get("/task/lookup", response_model=List[LookupItem])
+async def lookup_tasks_route(
+    request: Request,
+    response: Response,
+    prefix: str = Query("", max_length=100, description="Start of the name, any case, or an id"),
+    limit: int = Query(DEFAULT_LOOKUP_LIMIT, ge=1, le=MAX_LOOKUP_LIMIT),
+    db: AsyncSession = Depends(get_async_db)
+):
+    not_modified_response = await not_modified_async(db, request, response, TASK_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    return await db.run_sync(lookup_tasks, prefix=prefix.strip(), limit=limit)
+
+@router.get("/task/search", response_model=List[TaskResponse])
+async def search_tasks_route(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to look for in task names and descriptions"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = Query(None, ge=0, description="Cursor returned in the X-Next-Cursor header"),
+    status: Optional[StatusBase] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    not_modified_response = await not_modified_async(db, request, response, TASK_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    search = search_task_rows if FAST_SERIALIZATION else search_tasks
+    try:
+        tasks, next_cursor = await db.run_sync(
+            search,
+            q,
+            limit=limit,
+            after=after,
+            status=status.value if status else None,
+            user_id=user_id,
+            project_id=project_id
+        )
+    except SearchNotSupported as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    if FAST_SERIALIZATION:
+        return fast_json_response(tasks, response)
+    return tasks
+
+@router.get("/task/changes", response_model=TaskChanges)
+async def read_task_changes_route(
+    request: Request,
+    response: Response,
+    since: int = Query(0, ge=0, description="Token returned by the previous call, 0 for a full sync"),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db)
+):
+    not_modified_response = await not_modified_async(db, request, response, TASK_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    return await db.run_sync(get_task_changes, since=since, limit=limit)
+
+@router.get("/task/changes/head", response_model=TaskChangesHead)
+async def read_task_changes_head_route(db: AsyncSession = Depends(get_async_db)):
+    return await db.run_sync(get_task_changes_head)
+
+@router.get("/task/events")
+async def task_events_route(request: Request):
+    return StreamingResponse(
+        event_stream(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/task/{task_id}", response_model=TaskResponse)
+async def read_task_route(task_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    versions = await get_versions_async(db, TASK_TABLES)
+    not_modified_response = not_modified_since(request, response, versions)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    db_task = await get_task_cached(db, task_id=task_id, versions=versions)
+    if db_task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return db_task
+
+@router.put("/task/{task_id}", response_model=TaskResponse)
+async def update_task_route(task_id: int, task: TaskUpdate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        db_task = await update_task(db, task_id=task_id, task=task)
+        if db_task is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        return db_task
+
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal error in database: {e}"
+        )
+
+@router.delete("/task/{task_id}", status_code=200)
+async def delete_task_route(task_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_task = await delete_task(db, task_id=task_id)
+
+    if db_task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    return {"message": f"Task ID {task_id} deleted successfully!", "deleted_id": task_id}
@@ -0,0 +1,116 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import get_async_db
+from backend.instrumentation import TimedRoute
+from backend.schemas.user_schema import UserCreate, UserResponse, UserUpdate
+from backend.serializers import fast_json_response, FAST_SERIALIZATION
+from backend.conditional import not_modified_async, not_modified_since, USER_TABLES
+from backend.table_versions import get_versions_async
+from typing import List, Optional
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from backend.schemas.lookup_schema import LookupItem
+from backend.crud import lookup_users, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, DEFAULT_LOOKUP_LIMIT, MAX_LOOKUP_LIMIT
+from backend.async_crud import (
+    create_user,
+    get_user_cached,
+    get_all_users,
+    get_all_user_rows,
+    update_user,
+    delete_user
+)
+
+router = APIRouter(route_class=TimedRoute)
+
+@router.post("/user/", response_model=UserResponse)
+async def create_user_route(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        return await create_user(db=db, user=user)
+
+    except IntegrityError as e:
+        await db.rollback()
+        detail = "Error creating the user"
+
+        if "null value in column" in str(e):
+            detail = "You forgot to fill 1 or more fields"
+
+        raise HTTPException(
+            status_code=400,
+            detail=detail
+        )
+
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal error in database: {e}"
+        )
+
+@router.get("/user/", response_model=List[UserResponse])
+async def read_all_users_route(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = Query(None, description="Cursor returned in the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    not_modified_response = await not_modified_async(db, request, response, USER_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    read_page = get_all_user_rows if FAST_SERIALIZATION else get_all_users
+    users, next_cursor = await read_page(db, limit=limit, after=after)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    if FAST_SERIALIZATION:
+        return fast_json_response(users, response)
+    return users
+
+@router.get("/user/lookup", response_model=List[LookupItem])
+async def lookup_users_route(
+    request: Request,
+    response: Response,
+    prefix: str = Query("", max_length=100, description="Start of the name, any case, or an id"),
+    limit: int = Query(DEFAULT_LOOKUP_LIMIT, ge=1, le=MAX_LOOKUP_LIMIT),
+    db: AsyncSession = Depends(get_async_db)
+):
+    not_modified_response = await not_modified_async(db, request, response, USER_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    return await db.run_sync(lookup_users, prefix=prefix.strip(), limit=limit)
+
+@router.get("/user/{user_id}", response_model=UserResponse)
+async def read_user_route(user_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    versions = await get_versions_async(db, USER_TABLES)
+    not_modified_response = not_modified_since(request, response, versions)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    db_user = await get_user_cached(db, user_id=user_id, versions=versions)
+    if db_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return db_user
+
+@router.put("/user/{user_id}", response_model=UserResponse)
+async def update_user_route(user_id: int, user: UserUpdate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        db_user = await update_user(db, user_id=user_id, user=user)
+
+        if db_user is None:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        return db_user
+
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal error in database: {e}"
+        )
+
+@router.delete("/user/{user_id}", response_model=UserResponse)
+async def delete_user_route(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_user = await delete_user(db, user_id=user_id)
+    if db_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return db_user
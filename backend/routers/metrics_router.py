@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from backend.instrumentation import render_metrics
+
+
+router = APIRouter()
+
+@router.get("/metrics", include_in_schema=False)
+def read_metrics_route():
+    # Prometheus text exposition format
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
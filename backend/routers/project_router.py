@@ -1,19 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from backend.database import get_db
+from backend.instrumentation import TimedRoute
 from backend.schemas.project_schema import ProjectCreate, ProjectUpdate, ProjectResponse
+from backend.schemas.lookup_schema import LookupItem
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from typing import List
+from backend.serializers import fast_json_response, FAST_SERIALIZATION
+from backend.conditional import not_modified, not_modified_since, PROJECT_TABLES
+from backend.table_versions import get_versions
+from typing import List, Optional
 from backend.crud import (
     create_project,
-    get_project,
+    get_project_cached,
     get_all_projects,
+    get_all_project_rows,
     update_project,
-    delete_project
+    delete_project,
+    lookup_projects,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    DEFAULT_LOOKUP_LIMIT,
+    MAX_LOOKUP_LIMIT
 )
 
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 @router.post("/project/", response_model=ProjectResponse)
 def create_project_route(project: ProjectCreate, db: Session = Depends(get_db)):
@@ -29,14 +40,48 @@ def create_project_route(project: ProjectCreate, db: Session = Depends(get_db)):
     
 
 @router.get("/project/", response_model=List[ProjectResponse])
-def read_all_projects_route(db: Session = Depends(get_db)):
-    projects = get_all_projects(db)
+def read_all_projects_route(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = Query(None, description="Cursor returned in the X-Next-Cursor header"),
+    db: Session = Depends(get_db)
+):
+    not_modified_response = not_modified(db, request, response, PROJECT_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    read_page = get_all_project_rows if FAST_SERIALIZATION else get_all_projects
+    projects, next_cursor = read_page(db, limit=limit, after=after)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    if FAST_SERIALIZATION:
+        return fast_json_response(projects, response)
     return projects
 
 
+@router.get("/project/lookup", response_model=List[LookupItem])
+def lookup_projects_route(
+    request: Request,
+    response: Response,
+    prefix: str = Query("", max_length=100, description="Start of the name, any case, or an id"),
+    limit: int = Query(DEFAULT_LOOKUP_LIMIT, ge=1, le=MAX_LOOKUP_LIMIT),
+    db: Session = Depends(get_db)
+):
+    not_modified_response = not_modified(db, request, response, PROJECT_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    return lookup_projects(db, prefix=prefix.strip(), limit=limit)
+
 @router.get("/project/{project_id}", response_model=ProjectResponse)
-def read_project_route(project_id: int, db: Session = Depends(get_db)):
-    db_project = get_project(db, project_id=project_id)
+def read_project_route(project_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    versions = get_versions(db, PROJECT_TABLES)
+    not_modified_response = not_modified_since(request, response, versions)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    db_project = get_project_cached(db, project_id=project_id, versions=versions)
     if db_project is None:
         raise HTTPException(status_code=404, detail="Project not found")
     return db_project
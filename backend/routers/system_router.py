@@ -0,0 +1,33 @@
+from fastapi import APIRouter
+from backend.database import settings, pool_status
+from backend.instrumentation import TimedRoute
+from backend.cache import cache_backend
+from backend.events import broker
+
+
+router = APIRouter(route_class=TimedRoute)
+
+@router.get("/system/pool")
+def read_pool_status_route():
+    return {
+        "database_url": settings.safe_url(),
+        "settings": {
+            "pool_size": settings.pool_size,
+            "max_overflow": settings.max_overflow,
+            "pool_timeout": settings.pool_timeout,
+            "pool_recycle": settings.pool_recycle,
+            "pool_pre_ping": settings.pool_pre_ping,
+            "statement_timeout_ms": settings.statement_timeout_ms,
+        },
+        "pool": pool_status(),
+    }
+
+
+@router.get("/system/cache")
+def read_cache_stats_route():
+    return {"backend": type(cache_backend()).__name__, **cache_backend().stats()}
+
+
+@router.get("/system/events")
+def read_event_stats_route():
+    return broker.stats()
@@ -1,19 +1,54 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from backend.database import get_db
-from backend.schemas.task_schema import TaskCreate, TaskUpdate, TaskResponse
+from backend.database import get_db, SessionLocal
+from backend.instrumentation import TimedRoute
+from backend.schemas.task_schema import (
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskBulkUpdate,
+    TaskBulkResult,
+    TaskChanges,
+    TaskChangesHead,
+    StatusBase
+)
+from backend.schemas.lookup_schema import LookupItem
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from typing import List
+from backend.serializers import fast_json_response, FAST_SERIALIZATION
+from backend.conditional import not_modified, not_modified_since, TASK_TABLES
+from backend.table_versions import get_versions
+from backend.events import event_stream
+from backend.export import MEDIA_TYPES, export_header, export_chunk
+from backend.search import SearchNotSupported
+from typing import List, Optional, Literal
+from datetime import datetime
 from backend.crud import (
     create_task,
-    get_task,
+    get_task_cached,
     get_all_tasks,
+    get_all_task_rows,
     update_task,
-    delete_task
+    delete_task,
+    bulk_create_tasks,
+    bulk_update_tasks,
+    bulk_delete_tasks,
+    iter_task_export_rows,
+    get_task_changes,
+    get_task_changes_head,
+    search_tasks,
+    search_task_rows,
+    lookup_tasks,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    DEFAULT_LOOKUP_LIMIT,
+    MAX_LOOKUP_LIMIT,
+    BULK_BATCH_SIZE,
+    MAX_BULK_BATCH_SIZE
 )
 
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 @router.post("/task/", response_model=TaskResponse)
 def create_task_route(task: TaskCreate, db: Session = Depends(get_db)):
@@ -28,13 +63,195 @@ def create_task_route(task: TaskCreate, db: Session = Depends(get_db)):
         )
     
 @router.get("/task/", response_model=List[TaskResponse])
-def read_all_tasks_route(db: Session = Depends(get_db)):
-    tasks = get_all_tasks(db)
+def read_all_tasks_route(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = Query(None, description="Cursor returned in the X-Next-Cursor header"),
+    status: Optional[StatusBase] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None,
+    db: Session = Depends(get_db)
+):
+    not_modified_response = not_modified(db, request, response, TASK_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    read_page = get_all_task_rows if FAST_SERIALIZATION else get_all_tasks
+    tasks, next_cursor = read_page(
+        db,
+        limit=limit,
+        after=after,
+        status=status.value if status else None,
+        user_id=user_id,
+        project_id=project_id,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    if FAST_SERIALIZATION:
+        return fast_json_response(tasks, response)
     return tasks
 
+def _run_bulk(db: Session, operation, items, batch_size: int):
+    try:
+        return operation(db, items, batch_size=batch_size)
+
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="One or more tasks reference a user or project that doesn't exist. Nothing was saved"
+        )
+
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal error in database: {e}"
+        )
+
+@router.post("/task/bulk", response_model=List[TaskBulkResult])
+def bulk_create_tasks_route(
+    tasks: List[TaskCreate],
+    batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=MAX_BULK_BATCH_SIZE),
+    db: Session = Depends(get_db)
+):
+    return _run_bulk(db, bulk_create_tasks, tasks, batch_size)
+
+@router.patch("/task/bulk", response_model=List[TaskBulkResult])
+def bulk_update_tasks_route(
+    tasks: List[TaskBulkUpdate],
+    batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=MAX_BULK_BATCH_SIZE),
+    db: Session = Depends(get_db)
+):
+    return _run_bulk(db, bulk_update_tasks, tasks, batch_size)
+
+@router.delete("/task/bulk", response_model=List[TaskBulkResult])
+def bulk_delete_tasks_route(
+    task_ids: List[int] = Body(...),
+    batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=MAX_BULK_BATCH_SIZE),
+    db: Session = Depends(get_db)
+):
+    return _run_bulk(db, bulk_delete_tasks, task_ids, batch_size)
+
+def _stream_export(export_format: str, filters: dict):
+    # The request's session is closed before a streaming body is sent,
+    # so the generator owns its own session for the lifetime of the cursor
+    db = SessionLocal()
+    try:
+        yield export_header(export_format)
+        for rows in iter_task_export_rows(db, **filters):
+            yield export_chunk(export_format, rows)
+    finally:
+        db.close()
+
+@router.get("/task/export")
+def export_tasks_route(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    status: Optional[StatusBase] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    deadline_from: Optional[datetime] = None,
+    deadline_to: Optional[datetime] = None
+):
+    filters = {
+        "status": status.value if status else None,
+        "user_id": user_id,
+        "project_id": project_id,
+        "deadline_from": deadline_from,
+        "deadline_to": deadline_to
+    }
+    return StreamingResponse(
+        _stream_export(format, filters),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename=tasks.{format}"}
+    )
+
+@router.get("/task/lookup", response_model=List[LookupItem])
+def lookup_tasks_route(
+    request: Request,
+    response: Response,
+    prefix: str = Query("", max_length=100, description="Start of the name, any case, or an id"),
+    limit: int = Query(DEFAULT_LOOKUP_LIMIT, ge=1, le=MAX_LOOKUP_LIMIT),
+    db: Session = Depends(get_db)
+):
+    not_modified_response = not_modified(db, request, response, TASK_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    return lookup_tasks(db, prefix=prefix.strip(), limit=limit)
+
+@router.get("/task/search", response_model=List[TaskResponse])
+def search_tasks_route(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to look for in task names and descriptions"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = Query(None, ge=0, description="Cursor returned in the X-Next-Cursor header"),
+    status: Optional[StatusBase] = None,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    not_modified_response = not_modified(db, request, response, TASK_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    search = search_task_rows if FAST_SERIALIZATION else search_tasks
+    try:
+        tasks, next_cursor = search(
+            db,
+            q,
+            limit=limit,
+            after=after,
+            status=status.value if status else None,
+            user_id=user_id,
+            project_id=project_id
+        )
+    except SearchNotSupported as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    if FAST_SERIALIZATION:
+        return fast_json_response(tasks, response)
+    return tasks
+
+@router.get("/task/changes", response_model=TaskChanges)
+def read_task_changes_route(
+    request: Request,
+    response: Response,
+    since: int = Query(0, ge=0, description="Token returned by the previous call, 0 for a full sync"),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
+    not_modified_response = not_modified(db, request, response, TASK_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    return get_task_changes(db, since=since, limit=limit)
+
+@router.get("/task/changes/head", response_model=TaskChangesHead)
+def read_task_changes_head_route(db: Session = Depends(get_db)):
+    return get_task_changes_head(db)
+
+@router.get("/task/events")
+async def task_events_route(request: Request):
+    return StreamingResponse(
+        event_stream(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/task/{task_id}", response_model=TaskResponse)
-def read_task_route(task_id: int, db: Session = Depends(get_db)):
-    db_task = get_task(db, task_id=task_id)
+def read_task_route(task_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    versions = get_versions(db, TASK_TABLES)
+    not_modified_response = not_modified_since(request, response, versions)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    db_task = get_task_cached(db, task_id=task_id, versions=versions)
     if db_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     return db_task
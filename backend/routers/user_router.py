@@ -1,18 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from backend.database import get_db
+from backend.instrumentation import TimedRoute
 from backend.schemas.user_schema import UserCreate, UserResponse, UserUpdate
-from typing import List
+from backend.schemas.lookup_schema import LookupItem
+from backend.serializers import fast_json_response, FAST_SERIALIZATION
+from backend.conditional import not_modified, not_modified_since, USER_TABLES
+from backend.table_versions import get_versions
+from typing import List, Optional
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from backend.crud import (
     create_user,
-    get_user,
+    get_user_cached,
     get_all_users,
+    get_all_user_rows,
     update_user,
-    delete_user
+    delete_user,
+    lookup_users,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    DEFAULT_LOOKUP_LIMIT,
+    MAX_LOOKUP_LIMIT
 )
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 @router.post("/user/", response_model=UserResponse)
 def create_user_route(user: UserCreate, db: Session = Depends(get_db)):
@@ -39,13 +50,47 @@ def create_user_route(user: UserCreate, db: Session = Depends(get_db)):
         )
 
 @router.get("/user/", response_model=List[UserResponse])
-def read_all_users_route(db: Session = Depends(get_db)):
-    users = get_all_users(db)
+def read_all_users_route(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = Query(None, description="Cursor returned in the X-Next-Cursor header"),
+    db: Session = Depends(get_db)
+):
+    not_modified_response = not_modified(db, request, response, USER_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    read_page = get_all_user_rows if FAST_SERIALIZATION else get_all_users
+    users, next_cursor = read_page(db, limit=limit, after=after)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    if FAST_SERIALIZATION:
+        return fast_json_response(users, response)
     return users
 
+@router.get("/user/lookup", response_model=List[LookupItem])
+def lookup_users_route(
+    request: Request,
+    response: Response,
+    prefix: str = Query("", max_length=100, description="Start of the name, any case, or an id"),
+    limit: int = Query(DEFAULT_LOOKUP_LIMIT, ge=1, le=MAX_LOOKUP_LIMIT),
+    db: Session = Depends(get_db)
+):
+    not_modified_response = not_modified(db, request, response, USER_TABLES)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    return lookup_users(db, prefix=prefix.strip(), limit=limit)
+
 @router.get("/user/{user_id}", response_model=UserResponse)
-def read_user_route(user_id: int, db: Session = Depends(get_db)):
-    db_user = get_user(db, user_id=user_id)
+def read_user_route(user_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    versions = get_versions(db, USER_TABLES)
+    not_modified_response = not_modified_since(request, response, versions)
+    if not_modified_response is not None:
+        return not_modified_response
+
+    db_user = get_user_cached(db, user_id=user_id, versions=versions)
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return db_user
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class LookupItem(BaseModel):
+    id: int
+    label: str
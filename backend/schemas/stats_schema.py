@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class StatusCount(BaseModel):
+    status: str
+    count: int
+
+
+class UserStatusCount(BaseModel):
+    user_id: int
+    name: str
+    status: str
+    count: int
+
+
+class TopUser(BaseModel):
+    user_id: int
+    name: str
+    task_count: int
+
+
+class TaskOverview(BaseModel):
+    total_tasks: int
+    finished_tasks: int
+    finished_percentage: float
+    top_user: Optional[TopUser] = None
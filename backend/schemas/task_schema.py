@@ -1,6 +1,6 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Literal
 from enum import Enum
 from backend.schemas.user_schema import UserResponse
 from backend.schemas.project_schema import ProjectResponse
@@ -13,19 +13,16 @@ class StatusBase(str, Enum):
 
 
 class TaskBase(BaseModel):
+    # Status is validated against the enum but kept as its string value
+    model_config = ConfigDict(use_enum_values=True)
+
     task_name: str
     task_description: str
-    status: str
+    status: StatusBase
     deadline: datetime
     project_id: int
     user_id: int
 
-    @validator("status")
-    def check_status(cls, v):
-        if v not in [item.value for item in StatusBase]:
-            raise ValueError("This status doesn't exist. Please, try again")
-        return v
-
 
 class TaskCreate(TaskBase):
     pass 
@@ -35,15 +32,40 @@ class TaskResponse(TaskBase):
     task_id: int
     project: ProjectResponse
     responsible: UserResponse
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TaskUpdate(BaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+
     task_name: Optional[str] = None
     task_description: Optional[str] = None
-    status: Optional[str] = None
+    status: Optional[StatusBase] = None
     deadline: Optional[datetime] = None
     project_id: Optional[int] = None
     user_id: Optional[int] = None
+
+
+
+class TaskBulkUpdate(TaskUpdate):
+    task_id: int
+
+
+class TaskBulkResult(BaseModel):
+    index: int
+    task_id: Optional[int] = None
+    result: Literal["created", "updated", "unchanged", "deleted", "not_found"]
+
+
+class TaskChangesHead(BaseModel):
+    token: int
+
+
+class TaskChanges(BaseModel):
+    token: int
+    has_more: bool
+    upserted: List[TaskResponse]
+    deleted: List[int]
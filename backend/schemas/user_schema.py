@@ -1,4 +1,4 @@
-from pydantic import BaseModel, PositiveFloat, EmailStr, validator, Field
+from pydantic import BaseModel, ConfigDict, EmailStr
 from datetime import datetime
 from typing import Optional
 
@@ -14,8 +14,7 @@ class UserResponse(UserBase):
     user_id: int
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class UserUpdate(BaseModel):
     name: Optional[str] = None
@@ -0,0 +1,74 @@
+'''
+Full-text search over task names and descriptions (GET /api/task/search).
+
+The index is built by migration 0005 and depends on the database:
+- Postgres: a generated tsvector column task_table.search_vector (name weighted
+  above description) with a GIN index; queries use websearch_to_tsquery, so
+  "quoted phrases", OR and -exclusions work, and results are ranked by ts_rank_cd.
+- SQLite: an external-content FTS5 table task_search kept in sync by triggers;
+  every term must match and results are ranked by bm25.
+'''
+import re
+from typing import Optional
+from sqlalchemy import select, func, literal_column, column, table
+from backend.models.task_model import TaskModel
+
+
+# Text search configuration of the Postgres index: no stemming or stop words,
+# since task text mixes languages
+SEARCH_CONFIG = "simple"
+
+# Relative weight of a match in the task name over one in the description
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+task_search = table("task_search", column("rowid"))
+
+
+class SearchNotSupported(RuntimeError):
+    pass
+
+
+def fts5_query(q: str) -> Optional[str]:
+    '''
+    Turn free text into an FTS5 query matching every term, with each term quoted
+    so that characters meaningful to FTS5 (-, ", *, :) are searched literally
+    '''
+    terms = [term.replace('"', '""') for term in re.findall(r"\w+", q)]
+    if not terms:
+        return None
+    return " ".join(f'"{term}"' for term in terms)
+
+
+def search_statement(dialect_name: str, q: str):
+    '''
+    SELECT of (task_id, rank) for the tasks matching q, best matches first, or
+    None when q has nothing to search for. Filters can be added on TaskModel columns.
+    '''
+    if dialect_name == "postgresql":
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        search_vector = literal_column("task_table.search_vector")
+        # Weights of the {D, C, B, A} labels: names are A, descriptions B
+        weights = literal_column(f"ARRAY[0, 0, {DESCRIPTION_WEIGHT / NAME_WEIGHT}, 1]::float4[]")
+        rank = func.ts_rank_cd(weights, search_vector, query).label("rank")
+        return (
+            select(TaskModel.task_id, rank)
+            .where(search_vector.op("@@")(query))
+            .order_by(rank.desc(), TaskModel.task_id)
+        )
+
+    if dialect_name == "sqlite":
+        match = fts5_query(q)
+        if match is None:
+            return None
+        # bm25 is lower for better matches
+        rank = func.bm25(literal_column("task_search"), NAME_WEIGHT, DESCRIPTION_WEIGHT).label("rank")
+        return (
+            select(TaskModel.task_id, rank)
+            .select_from(task_search)
+            .join(TaskModel, TaskModel.task_id == task_search.c.rowid)
+            .where(literal_column("task_search").op("MATCH")(match))
+            .order_by(rank, TaskModel.task_id)
+        )
+
+    raise SearchNotSupported(f"Full-text search is not available on {dialect_name}")
@@ -0,0 +1,112 @@
+'''
+Fast serialization path of the list routes.
+
+Instead of loading ORM objects and validating each one through the route's
+response_model, the rows are selected as plain column tuples (nested objects
+joined in the same SELECT), shaped into the response dicts and encoded with
+orjson, or the standard json module when orjson isn't installed. The JSON is
+the same as the one the Pydantic path produces.
+
+On by default; FAST_SERIALIZATION=0 goes back to the response_model path.
+'''
+import json
+import os
+from datetime import date, datetime
+from typing import Iterable, List
+from fastapi import Response
+from sqlalchemy import select
+from backend.instrumentation import track_serialization
+from backend.models.user_model import UserModel
+from backend.models.project_model import ProjectModel
+from backend.models.task_model import TaskModel
+from backend.schemas.user_schema import UserResponse
+from backend.schemas.project_schema import ProjectResponse
+from backend.schemas.task_schema import TaskResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+FAST_SERIALIZATION = os.getenv("FAST_SERIALIZATION", "1").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _default(value):
+    # Same datetime format as Pydantic: ISO 8601, with "Z" for UTC
+    if isinstance(value, (datetime, date)):
+        formatted = value.isoformat()
+        return formatted[:-6] + "Z" if formatted.endswith("+00:00") else formatted
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def fast_json_response(content, response: Response) -> FastJSONResponse:
+    '''
+    Returning a Response skips the route's response_model; the headers set on the
+    injected response (ETag, X-Next-Cursor) are carried over by hand
+    '''
+    headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    with track_serialization():
+        return FastJSONResponse(content, headers=headers)
+
+
+class RowSerializer:
+    '''
+    Columns to select for a response schema and the reverse step, row tuple to
+    response dict. Nested schemas (e.g. TaskResponse.project) are read from the
+    relationship of the same name, joined in the SELECT.
+    '''
+
+    def __init__(self, schema, model):
+        self.columns = []
+        self.joins = []
+        self._layout = self._plan(schema, model, "")
+
+    def _plan(self, schema, model, prefix: str) -> list:
+        layout = []
+        table_columns = model.__table__.columns
+        for name, field in schema.model_fields.items():
+            if name in table_columns:
+                self.columns.append(getattr(model, name).label(prefix + name))
+                layout.append((name, None))
+            else:
+                relationship = getattr(model, name)
+                self.joins.append(relationship)
+                nested_model = relationship.property.mapper.class_
+                layout.append((name, self._plan(field.annotation, nested_model, f"{prefix}{name}__")))
+        return layout
+
+    def statement(self):
+        statement = select(*self.columns)
+        for relationship in self.joins:
+            statement = statement.join(relationship)
+        return statement
+
+    def to_dicts(self, rows: Iterable) -> List[dict]:
+        build = self._build
+        layout = self._layout
+        return [build(layout, iter(row)) for row in rows]
+
+    def _build(self, layout: list, values) -> dict:
+        return {
+            name: next(values) if nested is None else self._build(nested, values)
+            for name, nested in layout
+        }
+
+
+user_rows = RowSerializer(UserResponse, UserModel)
+project_rows = RowSerializer(ProjectResponse, ProjectModel)
+task_rows = RowSerializer(TaskResponse, TaskModel)
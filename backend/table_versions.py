@@ -0,0 +1,49 @@
+'''
+Per-table change counters (table_version). Write paths bump the counter of the
+table they modify in the same transaction; readers use the counters as a cheap
+fingerprint of a table's content.
+'''
+from typing import Dict, Iterable
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.models.table_version_model import TableVersionModel
+
+
+def _bump_statement(table_name: str):
+    return (
+        update(TableVersionModel)
+        .where(TableVersionModel.table_name == table_name)
+        .values(version=TableVersionModel.version + 1)
+        .returning(TableVersionModel.version)
+    )
+
+
+def _versions_statement(table_names: Iterable[str]):
+    return select(TableVersionModel.table_name, TableVersionModel.version).where(
+        TableVersionModel.table_name.in_(list(table_names))
+    )
+
+
+def bump_version(db: Session, table_name: str) -> int:
+    '''
+    Increment the table's counter and return the new value. The row stays locked
+    until commit, so concurrent writers get increasing values in commit order.
+
+    Lock order: a write bumps its table's counter before touching any other row
+    (the task, then task_counter_table), so two writers always queue on the
+    table_version row first instead of deadlocking on each other's counters.
+    '''
+    return db.execute(_bump_statement(table_name)).scalar_one()
+
+
+def get_versions(db: Session, table_names: Iterable[str]) -> Dict[str, int]:
+    return dict(db.execute(_versions_statement(table_names)).all())
+
+
+async def bump_version_async(db: AsyncSession, table_name: str) -> int:
+    return (await db.execute(_bump_statement(table_name))).scalar_one()
+
+
+async def get_versions_async(db: AsyncSession, table_names: Iterable[str]) -> Dict[str, int]:
+    return dict((await db.execute(_versions_statement(table_names))).all())
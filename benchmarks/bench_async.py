@@ -0,0 +1,97 @@
+'''
+Requests/sec of the CRUD routes under concurrent load, sync routers (DB_MODE=sync)
+against async routers (DB_MODE=async), both driven in-process through ASGI.
+
+    python -m benchmarks.bench_async --database-url sqlite:///bench.db --requests 5000 --concurrency 100
+
+Each mode runs in its own interpreter because the mode is read at import time.
+'''
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+
+def _run_worker(args) -> dict:
+    import httpx
+    from backend.main import app
+    from backend.database import async_engine
+
+    rng = random.Random(1)
+
+    async def one_request(client):
+        if rng.random() < 0.5:
+            response = await client.get(f"/api/task/{rng.randint(1, args.tasks)}")
+        else:
+            response = await client.get("/api/task/", params={"limit": 50, "after": rng.randint(0, args.tasks)})
+        response.raise_for_status()
+
+    async def drive():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def limited():
+                async with semaphore:
+                    await one_request(client)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(limited() for _ in range(args.requests)))
+            elapsed = time.perf_counter() - start
+
+        if async_engine is not None:
+            await async_engine.dispose()
+        return elapsed
+
+    elapsed = asyncio.run(drive())
+    return {
+        "mode": os.environ["DB_MODE"],
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(args.requests / elapsed, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///bench_async.db")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--no-seed", action="store_true", help="reuse the data already in the database")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_run_worker(args)))
+        return
+
+    env = dict(os.environ, DATABASE_URL=args.database_url)
+    if not args.no_seed:
+        os.environ["DATABASE_URL"] = args.database_url
+        from backend.database import create_sync_engine
+        from benchmarks.seed import seed, reset
+
+        engine = create_sync_engine()
+        reset(engine)
+        seed(engine, tasks=args.tasks)
+
+    results = []
+    for mode in ("sync", "async"):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_async", "--worker",
+             "--requests", str(args.requests), "--concurrency", str(args.concurrency), "--tasks", str(args.tasks)],
+            env=dict(env, DB_MODE=mode), check=True, capture_output=True, text=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
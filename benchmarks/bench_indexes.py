@@ -0,0 +1,114 @@
+'''
+Write throughput and filtered-read latency with the original one-index-per-column
+schema (migration 1) against the access-path indexes (migration 2).
+
+    python -m benchmarks.bench_indexes --database-url sqlite:///bench.db --tasks 200000
+'''
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, insert, select, update
+from backend.models.task_model import TaskModel
+from backend.migrate import upgrade
+from benchmarks.seed import seed, reset, STATUSES, WORDS
+
+
+def _time_reads(engine, runs: int, users: int, projects: int) -> dict:
+    rng = random.Random(7)
+    queries = {
+        "project_status_page": lambda: select(TaskModel.task_id).where(
+            TaskModel.project_id == rng.randint(1, projects), TaskModel.status == rng.choice(STATUSES)
+        ).order_by(TaskModel.task_id).limit(50),
+        "user_status_page": lambda: select(TaskModel.task_id).where(
+            TaskModel.user_id == rng.randint(1, users), TaskModel.status == rng.choice(STATUSES)
+        ).order_by(TaskModel.task_id).limit(50),
+        "status_page": lambda: select(TaskModel.task_id).where(
+            TaskModel.status == rng.choice(STATUSES)
+        ).order_by(TaskModel.task_id).limit(50),
+        "deadline_range": lambda: select(TaskModel.task_id).where(
+            TaskModel.deadline.between(datetime(2025, 3, 1), datetime(2025, 3, 2))
+        ).order_by(TaskModel.deadline, TaskModel.task_id).limit(50),
+    }
+    results = {}
+    with engine.connect() as connection:
+        for name, build_query in queries.items():
+            timings = []
+            for _ in range(runs):
+                query = build_query()
+                start = time.perf_counter()
+                connection.execute(query).all()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = {"p50_ms": round(statistics.median(timings), 3), "max_ms": round(max(timings), 3)}
+    return results
+
+
+def _time_writes(engine, rows: int, users: int, projects: int) -> dict:
+    rng = random.Random(11)
+
+    def free_text(words: int) -> str:
+        # Real names and descriptions don't arrive in sorted order
+        return " ".join(rng.choice(WORDS) for _ in range(words))
+
+    new_tasks = [
+        {
+            "task_name": free_text(3),
+            "task_description": free_text(30),
+            "status": rng.choice(STATUSES),
+            "deadline": datetime(2025, 1, 1) + timedelta(hours=i),
+            "project_id": rng.randint(1, projects),
+            "user_id": rng.randint(1, users),
+        }
+        for i in range(rows)
+    ]
+    with engine.begin() as connection:
+        start = time.perf_counter()
+        for row in new_tasks:
+            connection.execute(insert(TaskModel), row)
+        insert_seconds = time.perf_counter() - start
+
+    with engine.begin() as connection:
+        start = time.perf_counter()
+        for task_id in range(1, rows + 1):
+            connection.execute(
+                update(TaskModel).where(TaskModel.task_id == task_id).values(
+                    status=rng.choice(STATUSES), task_description=free_text(30)
+                )
+            )
+        update_seconds = time.perf_counter() - start
+
+    return {
+        "inserts_per_second": round(rows / insert_seconds, 1),
+        "updates_per_second": round(rows / update_seconds, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///bench_indexes.db")
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--writes", type=int, default=5000)
+    parser.add_argument("--reads", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    results = {}
+    for label, schema_version in (("before", 1), ("after", 2)):
+        reset(engine)
+        upgrade(engine, target=schema_version)
+        seed(engine, users=args.users, projects=args.projects, tasks=args.tasks, migrate=False)
+        results[label] = {
+            "schema_version": schema_version,
+            "reads": _time_reads(engine, args.reads, args.users, args.projects),
+            "writes": _time_writes(engine, args.writes, args.users, args.projects),
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+'''
+Cost of building one task list page: the response_model path (ORM objects with
+joined project/user, validated and dumped by FastAPI through List[TaskResponse],
+rendered by JSONResponse) against the fast path (column rows shaped into dicts,
+encoded by orjson, or the standard json module). Times are medians per 1000 rows,
+split into the query and the serialization; the fast path's row shaping is part
+of its query time.
+
+    python -m benchmarks.bench_serialization --database-url sqlite:///bench.db --tasks 50000
+'''
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import List
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from backend.crud import get_all_tasks, get_all_task_rows, MAX_PAGE_SIZE
+from backend.schemas.task_schema import TaskResponse
+from backend.serializers import FastJSONResponse, _default
+from benchmarks.seed import seed, reset
+
+
+RESPONSE_FIELD = create_model_field("Response", List[TaskResponse], mode="serialization")
+
+
+def _response_model_body(loop, tasks) -> bytes:
+    content = loop.run_until_complete(serialize_response(field=RESPONSE_FIELD, response_content=tasks))
+    return JSONResponse(content).body
+
+
+def _stdlib_json_body(rows) -> bytes:
+    return json.dumps(rows, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _measure(engine, runs: int, rows: int, fetch, serialize) -> dict:
+    query_ms, serialize_ms = [], []
+    body = b""
+    for run in range(runs):
+        with Session(engine) as db:
+            start = time.perf_counter()
+            page, _ = fetch(db, limit=rows, after=(run * rows) % 10000)
+            fetched = time.perf_counter()
+            body = serialize(page)
+            done = time.perf_counter()
+        query_ms.append((fetched - start) * 1000)
+        serialize_ms.append((done - fetched) * 1000)
+    per_1k = 1000 / rows
+    return {
+        "query_ms_per_1k": round(statistics.median(query_ms) * per_1k, 3),
+        "serialize_ms_per_1k": round(statistics.median(serialize_ms) * per_1k, 3),
+        "total_ms_per_1k": round((statistics.median(query_ms) + statistics.median(serialize_ms)) * per_1k, 3),
+        "body_bytes": len(body),
+        "_body": body,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///bench_serialization.db")
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--rows", type=int, default=MAX_PAGE_SIZE, help="rows per page")
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    reset(engine)
+    seed(engine, tasks=args.tasks)
+
+    loop = asyncio.new_event_loop()
+    results = {
+        "response_model": _measure(
+            engine, args.runs, args.rows, get_all_tasks, lambda tasks: _response_model_body(loop, tasks)
+        ),
+        "fast_orjson": _measure(
+            engine, args.runs, args.rows, get_all_task_rows, lambda rows: FastJSONResponse(rows).body
+        ),
+        "fast_stdlib_json": _measure(engine, args.runs, args.rows, get_all_task_rows, _stdlib_json_body),
+    }
+    loop.close()
+
+    # Same page, same JSON
+    reference = json.loads(results["response_model"].pop("_body"))
+    for name in ("fast_orjson", "fast_stdlib_json"):
+        results[name]["same_output"] = json.loads(results[name].pop("_body")) == reference
+
+    baseline = results["response_model"]["total_ms_per_1k"]
+    for name in ("fast_orjson", "fast_stdlib_json"):
+        results[name]["speedup"] = round(baseline / results[name]["total_ms_per_1k"], 2)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
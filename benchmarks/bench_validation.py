@@ -0,0 +1,160 @@
+'''
+Validation throughput of the task schemas: the previous v1-style definitions
+(class Config / orm_mode, a @validator rebuilding the list of statuses per call),
+reproduced here, against the current ones (ConfigDict, status as the StatusBase
+enum). Measures TaskCreate from request JSON and TaskResponse from ORM-like
+objects, dumped to JSON types as FastAPI does for a response_model.
+
+    python -m benchmarks.bench_validation --objects 20000
+'''
+import argparse
+import json
+import random
+import statistics
+import time
+import warnings
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Optional
+from pydantic import BaseModel, EmailStr
+from backend.schemas.task_schema import StatusBase, TaskCreate, TaskResponse
+from benchmarks.seed import STATUSES, WORDS
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from pydantic import validator
+
+    class LegacyUserResponse(BaseModel):
+        name: str
+        email: EmailStr
+        area: str
+        user_id: int
+        created_at: datetime
+
+        class Config:
+            orm_mode = True
+
+    class LegacyProjectResponse(BaseModel):
+        project_name: str
+        project_description: str
+        project_id: int
+        created_at: datetime
+
+        class Config:
+            orm_mode = True
+
+    class LegacyTaskBase(BaseModel):
+        task_name: str
+        task_description: str
+        status: str
+        deadline: datetime
+        project_id: int
+        user_id: int
+
+        @validator("status")
+        def check_status(cls, v):
+            if v not in [item.value for item in StatusBase]:
+                raise ValueError("This status doesn't exist. Please, try again")
+            return v
+
+    class LegacyTaskCreate(LegacyTaskBase):
+        pass
+
+    class LegacyTaskResponse(LegacyTaskBase):
+        task_id: int
+        project: LegacyProjectResponse
+        responsible: LegacyUserResponse
+        created_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None
+
+        class Config:
+            orm_mode = True
+
+
+def _payloads(count: int) -> list:
+    rng = random.Random(3)
+    return [
+        {
+            "task_name": " ".join(rng.choice(WORDS) for _ in range(3)),
+            "task_description": " ".join(rng.choice(WORDS) for _ in range(30)),
+            "status": rng.choice(STATUSES),
+            "deadline": (datetime(2025, 1, 1) + timedelta(hours=i)).isoformat() + "Z",
+            "project_id": rng.randint(1, 20),
+            "user_id": rng.randint(1, 100),
+        }
+        for i in range(count)
+    ]
+
+
+def _orm_objects(payloads: list) -> list:
+    now = datetime(2025, 1, 1)
+    return [
+        SimpleNamespace(
+            **{**payload, "deadline": now},
+            task_id=i,
+            created_at=now,
+            updated_at=now,
+            project=SimpleNamespace(
+                project_id=payload["project_id"], project_name="project", project_description="d", created_at=now
+            ),
+            responsible=SimpleNamespace(
+                user_id=payload["user_id"], name="user", email="user@example.com", area="ops", created_at=now
+            ),
+        )
+        for i, payload in enumerate(payloads, start=1)
+    ]
+
+
+def _rate(function, items: list, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(items)
+        timings.append(time.perf_counter() - start)
+    return round(len(items) / statistics.median(timings), 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = _payloads(args.objects)
+    objects = _orm_objects(payloads)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        legacy = {
+            "task_create_per_second": _rate(
+                lambda items: [LegacyTaskCreate(**item).dict() for item in items], payloads, args.repeats
+            ),
+            "task_response_per_second": _rate(
+                lambda items: [
+                    LegacyTaskResponse.model_validate(item, from_attributes=True).model_dump(mode="json")
+                    for item in items
+                ],
+                objects,
+                args.repeats,
+            ),
+        }
+    current = {
+        "task_create_per_second": _rate(
+            lambda items: [TaskCreate.model_validate(item).model_dump() for item in items], payloads, args.repeats
+        ),
+        "task_response_per_second": _rate(
+            lambda items: [TaskResponse.model_validate(item).model_dump(mode="json") for item in items],
+            objects,
+            args.repeats,
+        ),
+    }
+    results = {
+        "v1_style": legacy,
+        "v2_native": current,
+        "speedup": {key: round(current[key] / legacy[key], 2) for key in current},
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
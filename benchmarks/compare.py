@@ -0,0 +1,76 @@
+'''
+Compare two benchmarks.load reports endpoint by endpoint.
+
+    python -m benchmarks.compare before.json after.json
+    python -m benchmarks.compare before.json after.json --fail-above 10
+
+Latency and query count changes are relative to the first report; with
+--fail-above, exits with status 1 when any p95 grows by more than that percentage.
+'''
+import argparse
+import json
+import sys
+
+
+COLUMNS = ["requests_per_second", "p50_ms", "p95_ms", "p99_ms", "queries_per_request"]
+
+
+def _change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def compare(before: dict, after: dict) -> list:
+    '''
+    One row per endpoint present in either report: the "after" values and their change
+    '''
+    rows = []
+    endpoints = {"TOTAL": (before["total"], after["total"])}
+    for endpoint in sorted(set(before["endpoints"]) | set(after["endpoints"])):
+        endpoints[endpoint] = (before["endpoints"].get(endpoint), after["endpoints"].get(endpoint))
+    for endpoint, (old, new) in endpoints.items():
+        row = {"endpoint": endpoint}
+        for column in COLUMNS:
+            if old is None or new is None:
+                row[column] = "missing" if new is None else f"{new[column]} (new)"
+            else:
+                row[column] = f"{new[column]} ({_change(old[column], new[column])})"
+        row["p95_change"] = (new["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100 if old and new and old["p95_ms"] else 0
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--fail-above", type=float, help="p95 regression (in %%) that makes the comparison fail")
+    args = parser.parse_args()
+
+    with open(args.before) as file:
+        before = json.load(file)
+    with open(args.after) as file:
+        after = json.load(file)
+
+    for key in ("database", "mode", "tasks", "mix", "concurrency"):
+        if before["run"].get(key) != after["run"].get(key):
+            print(f"warning: {key} differs ({before['run'].get(key)} -> {after['run'].get(key)})", file=sys.stderr)
+
+    rows = compare(before, after)
+    headers = ["endpoint"] + COLUMNS
+    widths = [max(len(header), *(len(str(row[header])) for row in rows)) for header in headers]
+    print(f"{before['run']['commit']} -> {after['run']['commit']}")
+    print("  ".join(header.ljust(width) for header, width in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(row[header]).ljust(width) for header, width in zip(headers, widths)))
+
+    if args.fail_above is not None:
+        regressions = [row["endpoint"] for row in rows if row["p95_change"] > args.fail_above]
+        if regressions:
+            print(f"p95 regressed by more than {args.fail_above}%: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
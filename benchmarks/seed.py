@@ -0,0 +1,88 @@
+'''
+Synthetic data for the benchmarks: users, projects and tasks written with
+multi-row INSERTs, then the task counters rebuilt from the tasks.
+'''
+import random
+from datetime import datetime, timedelta
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+from backend.database import Base
+from backend.migrate import upgrade, version_metadata
+from backend.models.user_model import UserModel
+from backend.models.project_model import ProjectModel
+from backend.models.task_model import TaskModel
+from backend.models.task_counter_model import TaskCounterModel
+from backend.models.task_tombstone_model import TaskTombstoneModel
+from backend.models.table_version_model import TableVersionModel
+from backend.counters import rebuild_counters
+from backend.table_versions import bump_version
+
+
+STATUSES = ["To-do", "Doing", "Finished"]
+WORDS = ["deploy", "report", "pipeline", "review", "dashboard", "api", "migration", "backup", "invoice", "audit"]
+
+
+def _batched_insert(connection, model, rows, batch_size):
+    for start in range(0, len(rows), batch_size):
+        connection.execute(insert(model), rows[start:start + batch_size])
+
+
+def seed(
+    engine,
+    users: int = 100,
+    projects: int = 20,
+    tasks: int = 10000,
+    batch_size: int = 5000,
+    random_seed: int = 42,
+    migrate: bool = True,
+) -> None:
+    '''
+    Migrate the database (unless the caller prepared the schema) and insert
+    the requested number of rows
+    '''
+    rng = random.Random(random_seed)
+    if migrate:
+        upgrade(engine)
+    now = datetime(2025, 1, 1)
+
+    with engine.begin() as connection:
+        _batched_insert(connection, UserModel, [
+            {"name": f"User {i}", "email": f"user{i}@example.com", "area": rng.choice(["Data", "Ops", "Sales"])}
+            for i in range(users)
+        ], batch_size)
+        _batched_insert(connection, ProjectModel, [
+            {"project_name": f"Project {i}", "project_description": f"Synthetic project {i}"}
+            for i in range(projects)
+        ], batch_size)
+
+    with engine.begin() as connection:
+        # One change of task_table for the whole dataset, so the delta sync returns it
+        change_seq = bump_version(connection, "task_table")
+        for start in range(0, tasks, batch_size):
+            rows = []
+            for i in range(start, min(start + batch_size, tasks)):
+                words = rng.sample(WORDS, 3)
+                rows.append({
+                    "task_name": f"{words[0]} {words[1]} #{i}",
+                    "task_description": f"Synthetic task {i}: {' '.join(words)}",
+                    "status": rng.choice(STATUSES),
+                    "deadline": now + timedelta(hours=rng.randint(0, 24 * 365)),
+                    "project_id": rng.randint(1, projects),
+                    "user_id": rng.randint(1, users),
+                    "change_seq": change_seq,
+                })
+            connection.execute(insert(TaskModel), rows)
+
+    with Session(engine) as db:
+        rebuild_counters(db)
+
+
+def reset(engine) -> None:
+    '''
+    Drop every table, for benchmarks that need a fresh dataset
+    '''
+    with engine.begin() as connection:
+        # Created by migration 5 outside the ORM metadata
+        connection.execute(text("DROP TABLE IF EXISTS task_search"))
+    Base.metadata.drop_all(bind=engine)
+    version_metadata.drop_all(bind=engine)
@@ -0,0 +1,131 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+import requests
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_URL = os.getenv("API_URL", "http://backend:8000/api")
+
+# (connect, read) in seconds; a call that needs longer passes its own timeout
+TIMEOUT = (3.05, 30)
+
+# Connections kept alive to the backend, shared by every browser session
+POOL_SIZE = 20
+
+# Time a page waits for a set of concurrent calls (see gather)
+DEADLINE = 10
+
+# Connection errors and 502/503/504 are retried, after 0.3s, 0.6s, 1.2s... Only
+# idempotent methods are retried on a bad status: a POST that reached the backend
+# may have created the row.
+RETRIES = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+    raise_on_status=False,
+)
+
+
+@st.cache_resource
+def get_session():
+    '''
+    One requests.Session per Streamlit server process, so reruns and sessions
+    reuse keep-alive connections instead of opening one per call
+    '''
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=RETRIES)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # requests decodes gzip bodies; the backend compresses responses above 1 KB
+    session.headers["Accept-Encoding"] = "gzip"
+    return session
+
+
+def url(path):
+    return f"{API_URL}/{path.lstrip('/')}"
+
+
+def request(method, path, timeout=TIMEOUT, **kwargs):
+    return get_session().request(method, url(path), timeout=timeout, **kwargs)
+
+
+def get(path, params=None, **kwargs):
+    return request("GET", path, params=params, **kwargs)
+
+
+def post(path, json=None, **kwargs):
+    return request("POST", path, json=json, **kwargs)
+
+
+def put(path, json=None, **kwargs):
+    return request("PUT", path, json=json, **kwargs)
+
+
+def delete(path, **kwargs):
+    return request("DELETE", path, **kwargs)
+
+
+@st.cache_resource
+def get_executor():
+    return ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="api")
+
+
+def gather(calls, deadline=DEADLINE, panel=None):
+    '''
+    Run independent calls concurrently and wait for all of them, at most `deadline`
+    seconds in total. `calls` maps a name to a function taking no argument; returns
+    a dict of name to result, where a call that failed gets its exception instead
+    and a call still running at the deadline gets a TimeoutError (it is left to
+    finish in the background, filling its cache). In debug mode the timings are
+    shown in `panel`, the sidebar by default (fragments can only write to their body).
+    '''
+    # Lets the calls use Streamlit caches from the pool threads
+    ctx = get_script_run_ctx()
+    timings = {}
+
+    def timed(name, call):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        start = time.perf_counter()
+        try:
+            return call()
+        finally:
+            timings[name] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    executor = get_executor()
+    futures = {name: executor.submit(timed, name, call) for name, call in calls.items()}
+    done, _ = wait(futures.values(), timeout=deadline)
+    elapsed = time.perf_counter() - start
+
+    results = {}
+    for name, future in futures.items():
+        if future not in done:
+            results[name] = TimeoutError(f"{name}: no answer after {deadline}s")
+        else:
+            results[name] = future.exception() or future.result()
+    _show_timings(calls, results, timings, elapsed, panel or st.sidebar)
+    return results
+
+
+def debug_enabled():
+    return os.getenv("FRONTEND_DEBUG") == "1" or st.query_params.get("debug") == "1"
+
+
+def _show_timings(calls, results, timings, elapsed, panel):
+    # Debug panel (?debug=1 or FRONTEND_DEBUG=1), one table per gather
+    if get_script_run_ctx() is None or not debug_enabled():
+        return
+    rows = []
+    for name in calls:
+        outcome = results[name]
+        status = "timeout" if isinstance(outcome, TimeoutError) else "error" if isinstance(outcome, Exception) else "ok"
+        rows.append({"call": name, "ms": round(timings.get(name, elapsed) * 1000, 1), "status": status})
+    with panel.expander("⏱️ Backend calls", expanded=True):
+        sequential_ms = sum(row["ms"] for row in rows)
+        st.caption(f"Waited {elapsed * 1000:.1f} ms (one after the other: {sequential_ms:.1f} ms)")
+        st.dataframe(rows, hide_index=True, use_container_width=True)
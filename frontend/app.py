@@ -1,12 +1,9 @@
 import streamlit as st
-import requests
 from user_page import user_management_section
 from project_page import project_management_section
 from task_page import task_management_section
 from dashboard_page import dashboard_management_section
 
-API_URL = "http://backend:8000/" 
-
 st.set_page_config(
     page_title="Task Manager",
     layout="wide",
@@ -1,72 +1,64 @@
 import streamlit as st
 import pandas as pd
-import requests
+from functools import partial
 import plotly.express as px
 import altair as alt      
-
-API_BASE = "http://backend:8000/api"
+import api_client as api
+import entity_cache
+from search_select import search_select
 
 def dashboard_management_section():
     st.title("📊 Dashboard - Task Manager")
     
 
-    @st.cache_data(ttl=600) 
-    def load_data():
-        try:
-            tasks_response = requests.get(f"{API_BASE}/task/")
-            users_response = requests.get(f"{API_BASE}/user/")
-            projects_response = requests.get(f"{API_BASE}/project/")
-            
-
-            tasks_response.raise_for_status() 
-            users_response.raise_for_status() 
-            projects_response.raise_for_status()
-            
-            return users_response.json(), projects_response.json(), tasks_response.json()
-        except Exception as e:
-            st.error(f"Error loading API data: Check the backend. Details: {e}")
-            return [], [], []
-
-    users, projects, tasks = load_data()
-
-    df_users = pd.DataFrame(users)
-    df_tasks = pd.DataFrame(tasks)
-    
-    if df_tasks.empty:
-        st.warning("No tasks found. Unable to generate dashboard. 🚨")
-        st.stop()
+    def stat_calls(user_id=None, project_id=None):
+        # Aggregates are computed by the backend; only the small result sets travel
+        return {
+            name: partial(entity_cache.get_stats, name, user_id=user_id, project_id=project_id)
+            for name in ("overview", "status", "user-status")
+        }
 
-    df = df_tasks.copy()
-    df = df.merge(df_users, left_on="user_id", right_on="user_id", suffixes=("", "_user")) 
-    
-    
-    df_projects = pd.DataFrame(projects).rename(columns={'project_name': 'project_name_full'}) 
-    df = df.merge(df_projects, left_on="project_id", right_on="project_id", suffixes=("", "_project"))
+    def unpack(results, name, default):
+        if isinstance(results[name], Exception):
+            st.error(f"Error loading API data: Check the backend. Details: {results[name]}")
+            return default
+        return results[name]
 
-    st.sidebar.subheader("Filtros")
+    # Every call of a cold load is independent: one round trip instead of three
+    with st.spinner("Loading..."):
+        results = api.gather(stat_calls())
 
-    user_options = ["All"] + sorted(df["name"].unique().tolist())
-    project_options = ["All"] + sorted(df["project_name_full"].unique().tolist())
+    overview = unpack(results, "overview", None)
+    status_data = unpack(results, "status", [])
+    user_status_data = unpack(results, "user-status", [])
 
-    selected_user = st.sidebar.selectbox("User", user_options)
-    selected_project = st.sidebar.selectbox("Project", project_options)
+    if not overview or overview["total_tasks"] == 0:
+        st.warning("No tasks found. Unable to generate dashboard. 🚨")
+        st.stop()
+
+    # Filters search the users and projects by name instead of listing them all
+    with st.sidebar:
+        st.subheader("Filtros")
+        selected_user = search_select("user", "User", key="dashboard_user", empty_label="All")
+        selected_project = search_select("project", "Project", key="dashboard_project", empty_label="All")
 
-    filtered_df = df.copy()
-    if selected_user != "All":
-        filtered_df = filtered_df[filtered_df["name"] == selected_user]
-    if selected_project != "All":
-        filtered_df = filtered_df[filtered_df["project_name_full"] == selected_project]
+    if selected_user is not None or selected_project is not None:
+        results = api.gather(stat_calls(user_id=selected_user, project_id=selected_project))
+        overview = unpack(results, "overview", None)
+        status_data = unpack(results, "status", [])
+        user_status_data = unpack(results, "user-status", [])
 
-    if filtered_df.empty:
+    total_tarefas = overview["total_tasks"] if overview else 0
+
+    if total_tarefas == 0:
         st.warning("No tasks found with selected filters.")
     
 
     st.subheader("📌 Overview")
     col1, col2, col3 = st.columns(3)
     
-    total_tarefas = len(filtered_df)
-    perc_concluidas = (filtered_df['status'].eq('Finished').mean() * 100) if total_tarefas > 0 else 0
-    usuario_top = filtered_df["name"].mode()[0] if not filtered_df.empty else "—"
+    perc_concluidas = overview["finished_percentage"] if overview else 0
+    usuario_top = overview["top_user"]["name"] if overview and overview["top_user"] else "—"
 
     col1.metric("Total Tasks", total_tarefas, delta_color="off")
     col2.metric("% Finished", f"{perc_concluidas:.1f}%", delta_color="off")
@@ -79,7 +71,7 @@ def dashboard_management_section():
     with col_pie:
         st.markdown("#### 🎯 Tasks by Status")
         
-        status_counts = filtered_df["status"].value_counts().reset_index()
+        status_counts = pd.DataFrame(status_data, columns=["status", "count"])
         status_counts.columns = ['Status', 'Count']
         
         fig_pie = px.pie(
@@ -99,14 +91,17 @@ def dashboard_management_section():
     with col_bar:
         st.markdown("#### 👤 Tasks by User and Status")
         
-        fig_bar = px.histogram(
-            filtered_df, 
+        user_status_counts = pd.DataFrame(user_status_data, columns=["user_id", "name", "status", "count"])
+
+        fig_bar = px.bar(
+            user_status_counts, 
             x="name", 
+            y="count", 
             color="status", 
             title="Task Distribution by User",
             barmode='group', # Barras agrupadas
             height=350,
-            labels={'name': 'User', 'status': 'Status'}
+            labels={'name': 'User', 'status': 'Status', 'count': 'Tasks'}
         )
         
         fig_bar.update_layout(xaxis={'categoryorder':'total descending'}) 
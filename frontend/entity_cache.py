@@ -0,0 +1,153 @@
+import threading
+import time
+import streamlit as st
+import api_client as api
+
+# Writes made through this process drop the cached data they change; the age
+# limit only bounds how long changes made elsewhere (another frontend process,
+# the API) go unseen
+LIST_MAX_AGE = 60
+
+# Rows per page of the user and project lists, loaded one "Load more" at a time
+PAGE_SIZE = 50
+
+# Cached data that embeds or aggregates an entity, dropped when one is written:
+# tasks embed their user and project, and every write moves the dashboard stats
+DEPENDENTS = {
+    "user": ("task", "stats"),
+    "project": ("task", "stats"),
+    "task": ("stats",),
+}
+
+
+class EntityCache:
+    '''
+    Backend data kept per entity ("user", "project", "task", "stats"), one per
+    Streamlit server process. Keys are tuples starting with the entity, so that an
+    entity is invalidated without touching the others.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._generations = {}
+        self._loading = {}
+
+    def get(self, key, max_age, load):
+        '''
+        Cached value of key if younger than max_age seconds, otherwise load() it.
+        One thread loads a key at a time; the others wait for its result.
+        '''
+        entity = key[0]
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < max_age:
+            return entry[1]
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+        with key_lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < max_age:
+                return entry[1]
+            generation = self._generations.get(entity, 0)
+            fetched_at = time.monotonic()
+            value = load()
+            with self._lock:
+                # An invalidation or patch during the load makes its result stale
+                if self._generations.get(entity, 0) == generation:
+                    self._entries[key] = (fetched_at, value)
+            return value
+
+    def invalidate(self, entity):
+        with self._lock:
+            self._generations[entity] = self._generations.get(entity, 0) + 1
+            for key in [key for key in self._entries if key[0] == entity]:
+                del self._entries[key]
+
+
+@st.cache_resource
+def get_entity_cache():
+    return EntityCache()
+
+
+def get_page(entity, after=None, limit=PAGE_SIZE, max_age=LIST_MAX_AGE):
+    '''
+    One page of GET /<entity>/ in id order, and the cursor of the next page (None
+    on the last one)
+    '''
+    def load():
+        params = {"limit": limit}
+        if after is not None:
+            params["after"] = after
+        response = api.get(f"{entity}/", params=params)
+        response.raise_for_status()
+        return response.json(), response.headers.get("X-Next-Cursor")
+
+    return get_entity_cache().get((entity, "page", after, limit), max_age, load)
+
+
+def get_pages(entity, pages, limit=PAGE_SIZE):
+    '''
+    The rows of the first `pages` pages, and whether there are more
+    '''
+    items, after = [], None
+    for _ in range(pages):
+        page, after = get_page(entity, after=after, limit=limit)
+        items.extend(page)
+        if after is None:
+            break
+    return items, after is not None
+
+
+def get_item(entity, item_id, max_age=LIST_MAX_AGE):
+    def load():
+        response = api.get(f"{entity}/{item_id}")
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    return get_entity_cache().get((entity, "item", item_id), max_age, load)
+
+
+def lookup(entity, prefix, limit=20, max_age=LIST_MAX_AGE):
+    '''
+    (id, label) pairs of the entity whose name starts with prefix (GET /<entity>/lookup)
+    '''
+    def load():
+        response = api.get(f"{entity}/lookup", params={"prefix": prefix, "limit": limit})
+        response.raise_for_status()
+        return [(item["id"], item["label"]) for item in response.json()]
+
+    return get_entity_cache().get((entity, "lookup", prefix.lower(), limit), max_age, load)
+
+
+def get_stats(name, user_id=None, project_id=None, max_age=600):
+    def load():
+        response = api.get(f"stats/{name}", params={"user_id": user_id, "project_id": project_id})
+        response.raise_for_status()
+        return response.json()
+
+    return get_entity_cache().get(("stats", name, user_id, project_id), max_age, load)
+
+
+def saved(entity, item):
+    '''
+    Drop what a created or updated item changes: the entity's pages and lookups
+    (the item may move in or out of them) and the data embedding it
+    '''
+    _written(entity)
+
+
+def deleted(entity, item_id):
+    _written(entity)
+
+
+def _written(entity):
+    cache = get_entity_cache()
+    cache.invalidate(entity)
+    for dependent in DEPENDENTS[entity]:
+        cache.invalidate(dependent)
+
+
+def refresh(entity):
+    get_entity_cache().invalidate(entity)
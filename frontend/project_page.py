@@ -1,8 +1,8 @@
 import streamlit as st
 import requests
-
-
-API_URL = "http://backend:8000/api" 
+import api_client as api
+import entity_cache
+from search_select import search_select
 
 
 def project_management_section():
@@ -18,13 +18,14 @@ def project_management_section():
             submitted = st.form_submit_button("Create project")
             
             if submitted:
-                response = requests.post(
-                    f"{API_URL}/project/",
+                response = api.post(
+                    "project/",
                     json={"project_name": new_project_name, "project_description": new_project_description}
                 )
                 
                 if response.status_code == 200:
                     st.success("Sucess! You created a new project")
+                    entity_cache.saved("project", response.json())
                 elif response.status_code == 400:
                     st.error(f"Error: {response.json().get('detail')}")
                 else:
@@ -33,23 +34,28 @@ def project_management_section():
     with tab2:
         st.subheader("List all projects")
         
-        @st.cache_data(ttl=5)
+        def load_more_projects():
+            # Button callback: runs before the page is redrawn
+            st.session_state.project_list_pages += 1
+
         def get_all_projects():
             try:
-                response = requests.get(f"{API_URL}/project/")
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    st.error(f"Error loading projects: {response.status_code}")
-                    return []
-            except requests.exceptions.ConnectionError:
+                return entity_cache.get_pages("project", st.session_state.project_list_pages)
+            except requests.exceptions.HTTPError as e:
+                st.error(f"Error loading projects: {e.response.status_code}")
+                return [], False
+            except requests.exceptions.RequestException:
                 st.warning("⚠️ Connection error")
-                return []
+                return [], False
 
-        projects_data = get_all_projects()
+        # Pages of entity_cache.PAGE_SIZE rows shown, one more per "Load more"
+        st.session_state.setdefault("project_list_pages", 1)
+        projects_data, has_more = get_all_projects()
         
         if projects_data:
             st.dataframe(projects_data, use_container_width=True)
+            if has_more:
+                st.button("Load more", key="more_projects", on_click=load_more_projects)
         else:
             st.info("No registered user or connection error")
 
@@ -57,15 +63,10 @@ def project_management_section():
     with tab3:
         st.subheader("Update Existing Project")
         
-        latest_users = get_all_projects() 
-        project_map = {f"{u['project_id']} - {u['project_name']} ({u['project_description']})": u['project_id'] for u in latest_users}
-        
-        selected_project_label = st.selectbox("Select project to Update", list(project_map.keys()))
+        project_id_to_update = search_select("project", "Select project to Update", key="update_project_select")
         
-        if selected_project_label:
-            project_id_to_update = project_map[selected_project_label]
-            
-            current_project = next((u for u in latest_users if u['project_id'] == project_id_to_update), None)
+        if project_id_to_update is not None:
+            current_project = entity_cache.get_item("project", project_id_to_update)
 
             if current_project:
                 with st.form("update_project_form", clear_on_submit=False):
@@ -82,14 +83,14 @@ def project_management_section():
                             "project_description": upd_project_description
                         }
                         
-                        response = requests.put(
-                            f"{API_URL}/project/{project_id_to_update}",
+                        response = api.put(
+                            f"project/{project_id_to_update}",
                             json=update_data
                         )
                         
                         if response.status_code == 200:
                             st.success("Project updated successfully!")
-                            st.cache_data.clear() 
+                            entity_cache.saved("project", response.json())
                         elif response.status_code == 404:
                             st.error("Project not found.")
                         elif response.status_code == 400:
@@ -101,21 +102,17 @@ def project_management_section():
     with tab4:
         st.subheader("Delete project")
         
-        latest_projects = get_all_projects() 
-        delete_projects_map = {f"{u['project_id']} - {u['project_name']}": u['project_id'] for u in latest_users}
-        
-        selected_delete_label = st.selectbox("Select Project to Delete", list(delete_projects_map.keys()))
+        project_id_to_delete = search_select("project", "Select Project to Delete", key="delete_project_select")
         
-        if selected_delete_label:
-            project_id_to_delete = delete_projects_map[selected_delete_label]
+        if project_id_to_delete is not None:
             st.warning(f"Confirm deletion of project ID: **{project_id_to_delete}**")
             
             if st.button("Confirm Deletion"):
-                response = requests.delete(f"{API_URL}/project/{project_id_to_delete}")
+                response = api.delete(f"project/{project_id_to_delete}")
                 
                 if response.status_code == 200:
                     st.success("Project deleted!")
-                    st.cache_data.clear()
+                    entity_cache.deleted("project", project_id_to_delete)
                 elif response.status_code == 404:
                     st.error("Project not found.")
                 else:
@@ -0,0 +1,39 @@
+import requests
+import streamlit as st
+import entity_cache
+
+# Matches offered at a time; typing more narrows them down
+LOOKUP_LIMIT = 20
+
+
+def search_select(entity, label, key, current=None, empty_label=None):
+    '''
+    Search-as-you-type selector: a search box and a selectbox of the first
+    LOOKUP_LIMIT matches from GET /<entity>/lookup, instead of every row.
+    current is an (id, name) pair preselected even when it does not match the search.
+    empty_label, when given, names a first option standing for no choice.
+    Returns the chosen id, or None. Not usable inside st.form, whose widgets only
+    report their value on submit.
+    '''
+    prefix = st.text_input(
+        f"Search {label.lower()}", key=f"{key}_search", placeholder="Start of the name, or an id"
+    ).strip()
+    try:
+        options = dict(entity_cache.lookup(entity, prefix, limit=LOOKUP_LIMIT))
+    except requests.exceptions.RequestException:
+        st.warning("⚠️ Connection error")
+        options = {}
+    if current is not None and current[0] not in options:
+        options = {current[0]: current[1], **options}
+
+    ids = list(options)
+    if empty_label is not None:
+        ids.insert(0, None)
+    index = ids.index(current[0]) if current is not None else 0
+    return st.selectbox(
+        label,
+        ids,
+        index=index if ids else None,
+        format_func=lambda item_id: empty_label if item_id is None else f"{item_id} - {options[item_id]}",
+        key=key,
+    )
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+import requests
+import streamlit as st
+import api_client as api
+
+# The backend sends a heartbeat every 15s; a silent connection is considered dead after this
+READ_TIMEOUT = 45
+RECONNECT_DELAY_MAX = 30
+
+
+class TaskFeed:
+    '''
+    Signal of task changes, driven by the backend's event stream (GET /task/events):
+    version goes up whenever a task is written, and the pages reload what they show
+    from the API. Only the last change token is kept, never the tasks. One per
+    Streamlit server process, shared by every browser session, so open Kanban
+    boards don't poll the task list.
+    '''
+
+    def __init__(self):
+        # Taken here, in the script thread: st.cache_resource needs a script run context
+        self._session = api.get_session()
+        self.connected = False
+        self.version = 0
+        self._token = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="task-feed", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        delay = 1
+        while True:
+            try:
+                self._listen()
+                delay = 1
+            except (requests.exceptions.RequestException, ValueError):
+                self.connected = False
+                time.sleep(delay)
+                delay = min(delay * 2, RECONNECT_DELAY_MAX)
+
+    def _listen(self):
+        with self._session.get(api.url("task/events"), stream=True, timeout=(5, READ_TIMEOUT)) as response:
+            response.raise_for_status()
+            event_type, data = None, None
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("retry:"):
+                    # Subscribed: note what changed while disconnected
+                    self._sync()
+                    self.connected = True
+                elif line.startswith("event:"):
+                    event_type = line[len("event:"):].strip()
+                elif line.startswith("data:"):
+                    data = json.loads(line[len("data:"):])
+                elif line == "" and event_type:
+                    self._apply(event_type, data)
+                    event_type, data = None, None
+        self.connected = False
+
+    def _sync(self):
+        '''
+        Move to the backend's current token, signalling a change if it moved
+        '''
+        response = self._session.get(api.url("task/changes/head"), timeout=api.TIMEOUT)
+        response.raise_for_status()
+        token = response.json()["token"]
+        with self._lock:
+            if token != self._token:
+                self._token = token
+                self.version += 1
+
+    def _apply(self, event_type, data):
+        if event_type in ("changes", "resync"):
+            # Bulk write or lost events: the head token covers them
+            self._sync()
+            return
+        with self._lock:
+            # Writes publish after their commit, from the thread that made them, so
+            # events can overtake each other. Nothing is applied from them: a change
+            # N+1 is committed after N, so the reload it triggers shows both, and N
+            # arriving later is rightly ignored.
+            if data["change_seq"] <= self._token:
+                return
+            self._token = data["change_seq"]
+            self.version += 1
+
+
+@st.cache_resource
+def get_task_feed():
+    return TaskFeed()
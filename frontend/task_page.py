@@ -2,37 +2,120 @@ import streamlit as st
 import requests
 from datetime import datetime, date, time
 import pandas as pd 
+from functools import partial
+from task_feed import get_task_feed
+import api_client as api
+import entity_cache
+from search_select import search_select
 
-API_URL = "http://backend:8000/api" 
 
+def format_datetime_for_api(selected_date: date, selected_time: time):
+    combined_dt = datetime.combine(selected_date, selected_time)
+    return combined_dt.isoformat() + 'Z'
+
+
+
+# Cards loaded per column at first, and by each "Load more"
+KANBAN_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 1000
+
+
+def load_column(status, limit, after=None):
+    # One page of a column, in task_id order, with the cursor of the next one
+    params = {"status": status, "limit": limit}
+    if after is not None:
+        params["after"] = after
+    response = api.get("task/", params=params)
+    response.raise_for_status()
+    return response.json(), response.headers.get("X-Next-Cursor")
+
+
+def load_status_counts():
+    response = api.get("stats/status")
+    response.raise_for_status()
+    return {row["status"]: row["count"] for row in response.json()}
 
 
-@st.cache_data(ttl=5)
-def get_reference_data(endpoint):
+def load_board(status_choices, board, version):
+    '''
+    Reload the cards shown in each column (as many as were loaded, so "Load more"
+    pages survive a refresh) and the column counts, all at once
+    '''
+    calls = {"counts": load_status_counts}
+    for status in status_choices:
+        loaded = len(board["columns"][status]["tasks"]) if board else 0
+        limit = min(max(loaded, KANBAN_PAGE_SIZE), MAX_PAGE_SIZE)
+        calls[status] = partial(load_column, status, limit)
+    results = api.gather(calls, panel=st)
+
+    failed = [result for result in results.values() if isinstance(result, Exception)]
+    if failed:
+        st.error(f"Error loading the board: {failed[0]}")
+        return board
+    columns = {status: {"tasks": results[status][0], "cursor": results[status][1]} for status in status_choices}
+    return {"version": version, "counts": results["counts"], "columns": columns}
+
+
+def load_more(column, status):
+    # Button callback: runs before the fragment is redrawn
     try:
-        response = requests.get(f"{API_URL}/{endpoint}/")
-        if response.status_code == 200:
-            return response.json()
-        return []
-    except requests.exceptions.ConnectionError:
-        return []
+        tasks, cursor = load_column(status, KANBAN_PAGE_SIZE, column["cursor"])
+    except requests.exceptions.RequestException as e:
+        st.error(f"Error loading tasks: {e}")
+        return
+    column["tasks"] = column["tasks"] + tasks
+    column["cursor"] = cursor
 
-def format_datetime_for_api(selected_date: date, selected_time: time):
-    combined_dt = datetime.combine(selected_date, selected_time)
-    return combined_dt.isoformat() + 'Z'
 
+def task_card(task):
+    deadline_str = task.get('deadline', 'N/A')
+    try:
+        friendly_deadline = datetime.fromisoformat(deadline_str.replace('Z', '+00:00')).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
+        friendly_deadline = deadline_str
+    # One element per card: widgets, not tasks, are what makes a big board slow
+    st.info(
+        f"**#{task['task_id']} - {task['task_name']}**  \n"
+        f"Responsible: {task['user_id']} | Project: {task['project_id']}  \n"
+        f"🕑 Deadline: {friendly_deadline}  \n"
+        f"{task['task_description'][:50]}..."
+    )
+
+
+@st.fragment(run_every=1)
+def kanban_board(feed, status_choices):
+    # The live task feed says when something changed; only then are the visible
+    # pages and the counts requested again
+    if not feed.connected:
+        st.caption("⚠️ Live updates disconnected, reconnecting...")
+
+    board = st.session_state.get("kanban_board")
+    if board is None or board["version"] != feed.version:
+        board = load_board(status_choices, board, feed.version)
+        st.session_state.kanban_board = board
+    if board is None:
+        return
+
+    if not any(board["counts"].values()):
+        st.info("No tasks registered.")
+        return
+
+    cols = st.columns(len(status_choices))
+    for col, status in zip(cols, status_choices):
+        column = board["columns"][status]
+        with col:
+            st.markdown(f"**{status} ({board['counts'].get(status, 0)})**")
+            st.divider()
+            for task in column["tasks"]:
+                task_card(task)
+            if column["cursor"]:
+                st.button("Load more", key=f"kanban_more_{status}", on_click=load_more, args=(column, status), use_container_width=True)
 
 
 def task_management_section():
     st.header("📋 Task Management")
     
 
-    users = get_reference_data('user')
-    projects = get_reference_data('project')
-    
-    user_options = {f"{u['user_id']} - {u['name']}": u['user_id'] for u in users}
-    project_options = {f"{p['project_id']} - {p['project_name']}": p['project_id'] for p in projects}
-    
     STATUS_CHOICES = ["To-do", "Doing", "Finished"]
     
     # --- Abas CRUD ---
@@ -41,8 +124,11 @@ def task_management_section():
     # --- TAB 1: CREATE ---
     with tab1:
         st.subheader("Add New Task")
-        if not user_options or not project_options:
-            st.warning("⚠️ Please create at least one **User** and one **Project** before creating tasks.")
+        # Outside the form: the search boxes must update the choices as they are typed
+        user_id = search_select("user", "Responsible", key="task_user_select")
+        project_id = search_select("project", "Project", key="task_project_select")
+        if user_id is None or project_id is None:
+            st.warning("⚠️ Pick a **User** and a **Project** (create them first if there are none) before creating tasks.")
         else:
             with st.form("create_task_form", clear_on_submit=True):
                 # Campos de Input
@@ -53,18 +139,13 @@ def task_management_section():
                 new_deadline_date = st.date_input("Deadline Date", value=date.today(), key="create_date")
                 new_deadline_time = st.time_input("Deadline Time", value=time(23, 59), key="create_time")
                 
-                selected_user = st.selectbox("Responsible", list(user_options.keys()), key="task_user_select")
-                selected_project = st.selectbox("Project", list(project_options.keys()), key="task_project_select")
-
                 submitted = st.form_submit_button("Create Task")
                 
                 if submitted:
                     deadline_iso = format_datetime_for_api(new_deadline_date, new_deadline_time)
-                    user_id = user_options[selected_user]
-                    project_id = project_options[selected_project]
                     
-                    response = requests.post(
-                        f"{API_URL}/task/",
+                    response = api.post(
+                        "task/",
                         json={
                             "task_name": new_title, 
                             "task_description": new_description, 
@@ -77,67 +158,40 @@ def task_management_section():
                     
                     if response.status_code == 200:
                         st.success("Task created successfully!")
-                        st.cache_data.clear() # Limpa o cache após sucesso
+                        # The board itself is updated by the live task feed
+                        entity_cache.saved("task", response.json())
                     elif response.status_code == 400:
                         st.error(f"Validation Error: {response.json().get('detail')}")
                     else:
                         st.error(f"Error creating task: {response.json()}")
 
 
+    feed = get_task_feed()
+
     with tab2:
         st.subheader("Kanban View")
-        
-        if st.button("🔄 Refresh Task List", key="refresh_tasks"):
-            st.cache_data.clear()
-            st.rerun() 
-            
-        @st.cache_data(ttl=2) 
-        def get_all_tasks():
-            try:
-                response = requests.get(f"{API_URL}/task/")
-                return response.json() if response.status_code == 200 else []
-            except requests.exceptions.ConnectionError:
-                return []
-
-        tasks_data = get_all_tasks()
-        
-        if tasks_data:
-            cols = st.columns(len(STATUS_CHOICES))
-            
-            for i, status in enumerate(STATUS_CHOICES):
-                with cols[i]:
-                    st.markdown(f"**{status} ({len([t for t in tasks_data if t['status'] == status])})**")
-                    st.divider()
-                    
-                    for task in [t for t in tasks_data if t['status'] == status]:
-                        deadline_str = task.get('deadline', 'N/A')
-                        try:
-                            friendly_deadline = datetime.fromisoformat(deadline_str.replace('Z', '+00:00')).strftime("%Y-%m-%d %H:%M")
-                        except ValueError:
-                            friendly_deadline = deadline_str
-                        
-                        st.info(f"**#{task['task_id']} - {task['task_name']}**") 
-                        st.caption(f"Responsible: {task['user_id']} | Project: {task['project_id']}")
-                        st.error(f"Deadline: {friendly_deadline}")
-                        st.write(task['task_description'][:50] + "...")
-                        st.markdown("---")
-        else:
-            st.info("No tasks registered.")
+        kanban_board(feed, STATUS_CHOICES)
 
 
     with tab3:
         st.subheader("Update Existing Task")
         
-        latest_tasks = get_all_tasks()
-        task_map = {f"{t['task_id']} - {t['task_name']}": t['task_id'] for t in latest_tasks}
+        task_id_to_update = search_select("task", "Select Task to Update", key="update_task_select")
         
-        selected_task_label = st.selectbox("Select Task to Update", list(task_map.keys()), key="update_task_select")
-        
-        if selected_task_label:
-            task_id_to_update = task_map[selected_task_label]
-            current_task = next((t for t in latest_tasks if t['task_id'] == task_id_to_update), None)
+        if task_id_to_update is not None:
+            current_task = entity_cache.get_item("task", task_id_to_update)
 
             if current_task:
+                # Keyed by task, so that each task opens with its own user and project selected
+                upd_user_id = search_select(
+                    "user", "Responsible", key=f"upd_user_{task_id_to_update}",
+                    current=(current_task['user_id'], current_task['responsible']['name'])
+                )
+                upd_project_id = search_select(
+                    "project", "Project", key=f"upd_project_{task_id_to_update}",
+                    current=(current_task['project_id'], current_task['project']['project_name'])
+                )
+
                 deadline_dt = datetime.fromisoformat(current_task.get('deadline', datetime.now().isoformat()).replace('Z', '+00:00'))
                 current_date = deadline_dt.date()
                 current_time = deadline_dt.time()
@@ -150,12 +204,6 @@ def task_management_section():
                     upd_deadline_time = st.time_input("Deadline Time", value=current_time, key="update_time")
                     
                     upd_status = st.selectbox("Status", STATUS_CHOICES, index=STATUS_CHOICES.index(current_task.get('status')), key="upd_status")
-                    
-                    default_user_key = f"{current_task.get('user_id')} - {next((u['name'] for u in users if u['user_id'] == current_task.get('user_id')), 'Unknown')}"
-                    default_project_key = f"{current_task.get('project_id')} - {next((p['project_name'] for p in projects if p['project_id'] == current_task.get('project_id')), 'Unknown')}"
-                    
-                    upd_user = st.selectbox("Responsible", list(user_options.keys()), index=list(user_options.keys()).index(default_user_key), key="upd_user")
-                    upd_project = st.selectbox("Project", list(project_options.keys()), index=list(project_options.keys()).index(default_project_key), key="upd_project")
 
                     update_submitted = st.form_submit_button("Update Task")
                     
@@ -168,18 +216,18 @@ def task_management_section():
                             "task_description": upd_description, 
                             "status": upd_status,
                             "deadline": deadline_iso,
-                            "user_id": user_options[upd_user],
-                            "project_id": project_options[upd_project]
+                            "user_id": upd_user_id,
+                            "project_id": upd_project_id
                         }
                         
-                        response = requests.put(
-                            f"{API_URL}/task/{task_id_to_update}",
+                        response = api.put(
+                            f"task/{task_id_to_update}",
                             json=update_data
                         )
                         
                         if response.status_code == 200:
                             st.success("Task updated successfully!")
-                            st.cache_data.clear()
+                            entity_cache.saved("task", response.json())
                         else:
                             st.error(f"Error updating task: {response.json()}")
 
@@ -187,27 +235,22 @@ def task_management_section():
     with tab4:
         st.subheader("Delete Task")
         
-        latest_tasks = get_all_tasks() 
-        
-        delete_task_map = {f"{t['task_id']} - {t['task_name']}": t['task_id'] for t in latest_tasks}
-        
-        selected_delete_label = st.selectbox("Select Task to Delete", list(delete_task_map.keys()), key="delete_task_select")
+        task_id_to_delete = search_select("task", "Select Task to Delete", key="delete_task_select")
         
-        if selected_delete_label:
-            task_id_to_delete = delete_task_map[selected_delete_label]
+        if task_id_to_delete is not None:
             st.warning(f"Confirm deletion of Task ID: **{task_id_to_delete}**")
             
             if st.button("Confirm Deletion"):
-                response = requests.delete(f"{API_URL}/task/{task_id_to_delete}")
+                response = api.delete(f"task/{task_id_to_delete}")
                 
                 if response.status_code == 200:
+                    entity_cache.deleted("task", task_id_to_delete)
                     try:
                         success_data = response.json()
                         deleted_id = success_data.get("deleted_id", task_id_to_delete)
                         message = success_data.get("message", f"Task ID {deleted_id} deleted successfully!")
                         
                         st.success(message)
-                        st.cache_data.clear() 
                     except Exception:
                          st.success(f"Task ID {task_id_to_delete} deleted successfully! (Backend did not return full JSON)")
 
@@ -1,8 +1,8 @@
 import streamlit as st
 import requests
-
-# URL base do seu backend FastAPI
-API_URL = "http://backend:8000/api" 
+import api_client as api
+import entity_cache
+from search_select import search_select
 
 
 def user_management_section():
@@ -20,13 +20,14 @@ def user_management_section():
             submitted = st.form_submit_button("Create user")
             
             if submitted:
-                response = requests.post(
-                    f"{API_URL}/user/",
+                response = api.post(
+                    "user/",
                     json={"name": new_name, "email": new_email, "area": new_area}
                 )
                 
                 if response.status_code == 200:
                     st.success("Sucess! You created a new user")
+                    entity_cache.saved("user", response.json())
                 elif response.status_code == 400:
                     st.error(f"Error: {response.json().get('detail')}")
                 else:
@@ -37,26 +38,32 @@ def user_management_section():
         st.subheader("List all users")
             
         if st.button("🔄 Refresh", key="refresh_users"):
-            st.cache_data.clear()
+            entity_cache.refresh("user")
+            st.session_state.user_list_pages = 1
             st.rerun() 
         
-        @st.cache_data(ttl=5)
+        def load_more_users():
+            # Button callback: runs before the page is redrawn
+            st.session_state.user_list_pages += 1
+
         def get_all_users():
             try:
-                response = requests.get(f"{API_URL}/user/")
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    st.error(f"Error loading users: {response.status_code}")
-                    return []
-            except requests.exceptions.ConnectionError:
+                return entity_cache.get_pages("user", st.session_state.user_list_pages)
+            except requests.exceptions.HTTPError as e:
+                st.error(f"Error loading users: {e.response.status_code}")
+                return [], False
+            except requests.exceptions.RequestException:
                 st.warning("⚠️ Connection error")
-                return []
+                return [], False
 
-        users_data = get_all_users()
+        # Pages of entity_cache.PAGE_SIZE rows shown, one more per "Load more"
+        st.session_state.setdefault("user_list_pages", 1)
+        users_data, has_more = get_all_users()
         
         if users_data:
             st.dataframe(users_data, use_container_width=True)
+            if has_more:
+                st.button("Load more", key="more_users", on_click=load_more_users)
         else:
             st.info("No registered user or connection error")
 
@@ -65,15 +72,10 @@ def user_management_section():
     with tab3:
         st.subheader("Update Existing User")
         
-        latest_users = get_all_users() 
-        user_map = {f"{u['user_id']} - {u['name']} ({u['email']})": u['user_id'] for u in latest_users}
+        user_id_to_update = search_select("user", "Select user to Update", key="update_user_select")
         
-        selected_user_label = st.selectbox("Select user to Update", list(user_map.keys()))
-        
-        if selected_user_label:
-            user_id_to_update = user_map[selected_user_label]
-            
-            current_user = next((u for u in latest_users if u['user_id'] == user_id_to_update), None)
+        if user_id_to_update is not None:
+            current_user = entity_cache.get_item("user", user_id_to_update)
 
             if current_user:
                 with st.form("update_user_form", clear_on_submit=False):
@@ -92,14 +94,14 @@ def user_management_section():
                             "area": upd_area
                         }
                         
-                        response = requests.put(
-                            f"{API_URL}/user/{user_id_to_update}",
+                        response = api.put(
+                            f"user/{user_id_to_update}",
                             json=update_data
                         )
                         
                         if response.status_code == 200:
                             st.success("User updated successfully!")
-                            st.cache_data.clear() # Limpa o cache para forçar a atualização da lista
+                            entity_cache.saved("user", response.json())
                         elif response.status_code == 404:
                             st.error("User not found.")
                         elif response.status_code == 400:
@@ -112,22 +114,17 @@ def user_management_section():
     with tab4:
         st.subheader("Delete user")
         
-        latest_users = get_all_users() 
-        delete_user_map = {f"{u['user_id']} - {u['name']}": u['user_id'] for u in latest_users}
-        
-
-        selected_delete_label = st.selectbox("Select User to Delete", list(delete_user_map.keys()))
+        user_id_to_delete = search_select("user", "Select User to Delete", key="delete_user_select")
         
-        if selected_delete_label:
-            user_id_to_delete = delete_user_map[selected_delete_label]
+        if user_id_to_delete is not None:
             st.warning(f"Confirm deletion of user ID: **{user_id_to_delete}**")
             
             if st.button("Confirm Deletion"):
-                response = requests.delete(f"{API_URL}/user/{user_id_to_delete}")
+                response = api.delete(f"user/{user_id_to_delete}")
                 
                 if response.status_code == 200:
                     st.success("User deleted successfully!")
-                    st.cache_data.clear() # Limpa o cache
+                    entity_cache.deleted("user", user_id_to_delete)
                 elif response.status_code == 404:
                     st.error("User not found!")
                 else:
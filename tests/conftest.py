@@ -0,0 +1,68 @@
+'''
+The tests run the sync API against a throwaway SQLite file, migrated from
+scratch for each test, with foreign keys enforced as on Postgres.
+'''
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='task-manager-tests-')}/test.db"
+os.environ["DB_MODE"] = "sync"
+
+import pytest
+from sqlalchemy import event
+from fastapi.testclient import TestClient
+from backend.database import engine, SessionLocal
+from backend.migrate import upgrade
+from backend.cache import invalidate
+from backend.main import app
+from benchmarks.seed import reset
+
+
+@event.listens_for(engine, "connect")
+def _enforce_foreign_keys(dbapi_connection, connection_record):
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
+@pytest.fixture(autouse=True)
+def database():
+    reset(engine)
+    upgrade(engine)
+    for namespace in ("user", "project", "task"):
+        invalidate(namespace)
+    yield engine
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def count_queries():
+    '''
+    count_queries(fn) -> (number of SQL statements fn executed, fn's result)
+    '''
+    def run(fn):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = fn()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        return len(statements), result
+
+    return run
@@ -0,0 +1,87 @@
+'''
+Conditional GETs: list and detail routes send an ETag, answer 304 to a matching
+If-None-Match while the tables behind them are unchanged, and a new ETag after
+a write to any of them.
+'''
+import pytest
+
+
+TASK = {
+    "task_name": "Write docs",
+    "task_description": "d",
+    "status": "Doing",
+    "deadline": "2025-01-01T00:00:00Z",
+    "user_id": 1,
+    "project_id": 1,
+}
+
+
+@pytest.fixture
+def task_id(client):
+    client.post("/api/user/", json={"name": "Alice", "email": "alice@example.com", "area": "a"})
+    client.post("/api/project/", json={"project_name": "Apollo", "project_description": "d"})
+    return client.post("/api/task/", json=TASK).json()["task_id"]
+
+
+PATHS = ["/api/user/", "/api/user/1", "/api/project/", "/api/project/1", "/api/task/", "/api/task/1"]
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_unchanged_resource_answers_304(client, task_id, path):
+    first = client.get(path)
+    etag = first.headers["etag"]
+
+    second = client.get(path, headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_write_changes_the_etag(client, task_id, path):
+    etag = client.get(path).headers["etag"]
+
+    # Every task response embeds the user, so renaming it changes them all
+    assert client.put("/api/user/1", json={"name": "Bob"}).status_code == 200
+    assert client.put("/api/project/1", json={"project_name": "Zeus"}).status_code == 200
+
+    again = client.get(path, headers={"If-None-Match": etag})
+    assert again.status_code == 200
+    assert again.headers["etag"] != etag
+
+
+def test_write_to_another_table_keeps_the_etag(client, task_id):
+    etag = client.get("/api/user/").headers["etag"]
+
+    assert client.put(f"/api/task/{task_id}", json={"status": "Finished"}).status_code == 200
+
+    assert client.get("/api/user/", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_etag_differs_per_page_and_filter(client, task_id):
+    etags = {
+        client.get("/api/task/").headers["etag"],
+        client.get("/api/task/", params={"limit": 1}).headers["etag"],
+        client.get("/api/task/", params={"status": "Doing"}).headers["etag"],
+    }
+    assert len(etags) == 3
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "{strong}",
+    '"other", {etag}',
+    "*",
+])
+def test_if_none_match_forms(client, task_id, if_none_match):
+    etag = client.get("/api/task/1").headers["etag"]
+    header = if_none_match.format(etag=etag, strong=etag.removeprefix("W/"))
+
+    assert client.get("/api/task/1", headers={"If-None-Match": header}).status_code == 304
+
+
+def test_other_etag_gets_the_body(client, task_id):
+    response = client.get("/api/task/1", headers={"If-None-Match": 'W/"other"'})
+    assert response.status_code == 200
+    assert response.json()["task_name"] == "Write docs"
@@ -0,0 +1,96 @@
+'''
+Task counters follow the task writes, and a user or project whose tasks all
+moved elsewhere can still be deleted (no empty counter bucket references it).
+Upgrading fills the counters of the tasks already in the database.
+'''
+import subprocess
+import sys
+import pytest
+from sqlalchemy import text
+from backend.counters import verify_counters
+from backend.migrate import upgrade
+from backend.models.task_counter_model import TaskCounterModel
+from benchmarks.seed import reset
+
+
+TASK = {
+    "task_name": "Write docs",
+    "task_description": "d",
+    "status": "Doing",
+    "deadline": "2025-01-01T00:00:00Z",
+}
+
+
+def _create_users_and_projects(client):
+    for name in ("Alice", "Bob"):
+        assert client.post("/api/user/", json={"name": name, "email": f"{name}@example.com", "area": "a"}).status_code == 200
+    for name in ("Apollo", "Zeus"):
+        assert client.post("/api/project/", json={"project_name": name, "project_description": "d"}).status_code == 200
+
+
+def _move_with_update(client, task_id):
+    return client.put(f"/api/task/{task_id}", json={"user_id": 2, "project_id": 2})
+
+
+def _move_with_bulk_update(client, task_id):
+    return client.patch("/api/task/bulk", json=[{"task_id": task_id, "user_id": 2, "project_id": 2}])
+
+
+@pytest.mark.parametrize("move", [_move_with_update, _move_with_bulk_update])
+def test_user_and_project_deletable_after_their_tasks_move(client, db, move):
+    _create_users_and_projects(client)
+    task_id = client.post("/api/task/", json={**TASK, "user_id": 1, "project_id": 1}).json()["task_id"]
+
+    assert move(client, task_id).status_code == 200
+
+    buckets = {(row.user_id, row.project_id, row.status): row.task_count for row in db.query(TaskCounterModel)}
+    assert buckets == {(2, 2, "Doing"): 1}
+    assert client.delete("/api/user/1").status_code == 200
+    assert client.delete("/api/project/1").status_code == 200
+    assert verify_counters(db) == {}
+
+
+def test_deleting_the_last_task_drops_its_bucket(client, db):
+    _create_users_and_projects(client)
+    task_id = client.post("/api/task/", json={**TASK, "user_id": 1, "project_id": 1}).json()["task_id"]
+
+    assert client.delete(f"/api/task/{task_id}").status_code == 200
+
+    assert db.query(TaskCounterModel).count() == 0
+    assert client.delete("/api/user/1").status_code == 200
+    assert client.delete("/api/project/1").status_code == 200
+
+
+def test_upgrade_fills_the_counters_of_existing_tasks(database, client, db):
+    reset(database)
+    upgrade(database, target=8)
+    with database.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO user_table (user_id, name, email, area, created_at) "
+            "VALUES (1, 'Alice', 'a@example.com', 'a', '2025-01-01 00:00:00')"
+        ))
+        connection.execute(text(
+            "INSERT INTO project_table (project_id, project_name, project_description, created_at) "
+            "VALUES (1, 'Apollo', 'd', '2025-01-01 00:00:00')"
+        ))
+        for task_id, status in enumerate(["Doing", "Doing", "Finished"], start=1):
+            connection.execute(text(
+                "INSERT INTO task_table (task_id, task_name, task_description, status, deadline, project_id, user_id) "
+                f"VALUES ({task_id}, 'Task', 'd', '{status}', '2025-01-01 00:00:00', 1, 1)"
+            ))
+    upgrade(database)
+
+    assert client.get("/api/stats/status").json() == [{"status": "Doing", "count": 2}, {"status": "Finished", "count": 1}]
+    assert verify_counters(db) == {}
+
+
+@pytest.mark.parametrize("command, output", [("verify", "Task counters are in sync"), ("rebuild", "Rebuilt task counters (1 buckets)")])
+def test_command_line(client, command, output):
+    _create_users_and_projects(client)
+    client.post("/api/task/", json={**TASK, "user_id": 1, "project_id": 1})
+
+    # A fresh interpreter, with only the models the command imports itself
+    result = subprocess.run([sys.executable, "-m", "backend.counters", command], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == output
@@ -0,0 +1,93 @@
+'''
+DB_MODE=async serves every route on the async engine alone: each mode creates
+one engine, registers each route once and answers like the other. The mode is
+read at import time, so each one runs in its own interpreter.
+'''
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+
+SCRIPT = '''
+import json
+from fastapi.testclient import TestClient
+from backend.database import engine, async_engine, create_sync_engine
+from backend.migrate import upgrade
+
+upgrade(create_sync_engine())
+from backend.main import app
+
+TASK = {"task_name": "Write docs", "task_description": "release notes", "status": "Doing",
+        "deadline": "2025-01-01T00:00:00Z", "user_id": 1, "project_id": 1}
+
+
+def strip_timestamps(value):
+    if isinstance(value, dict):
+        return {k: strip_timestamps(v) for k, v in value.items() if k not in ("created_at", "updated_at")}
+    if isinstance(value, list):
+        return [strip_timestamps(v) for v in value]
+    return value
+
+
+routes = [(route.path, method) for route in app.routes for method in getattr(route, "methods", ())]
+report = {
+    "engines": [engine is not None, async_engine is not None],
+    "duplicate_routes": len(routes) - len(set(routes)),
+    "responses": [],
+}
+with TestClient(app) as client:
+    calls = [
+        ("post", "/api/user/", {"json": {"name": "Alice", "email": "alice@example.com", "area": "a"}}),
+        ("post", "/api/project/", {"json": {"project_name": "Apollo", "project_description": "d"}}),
+        ("post", "/api/task/", {"json": TASK}),
+        ("post", "/api/task/bulk", {"json": [TASK, {**TASK, "task_name": "Review docs"}]}),
+        ("patch", "/api/task/bulk", {"json": [{"task_id": 2, "status": "Finished"}, {"task_id": 9}]}),
+        ("delete", "/api/task/bulk", {"json": [3, 9]}),
+        ("put", "/api/task/1", {"json": {"task_name": "Write the docs"}}),
+        ("get", "/api/task/1", {}),
+        ("get", "/api/task/", {}),
+        ("get", "/api/user/lookup", {"params": {"prefix": "al"}}),
+        ("get", "/api/project/lookup", {"params": {"prefix": "1"}}),
+        ("get", "/api/task/lookup", {"params": {"prefix": "write"}}),
+        ("get", "/api/task/search", {"params": {"q": "docs"}}),
+        ("get", "/api/task/changes", {"params": {"since": 0}}),
+        ("get", "/api/task/changes/head", {}),
+        ("get", "/api/task/export", {"params": {"format": "csv"}}),
+        ("get", "/api/stats/overview", {}),
+        ("get", "/api/stats/status", {}),
+        ("get", "/api/stats/user-status", {}),
+        ("delete", "/api/task/1", {}),
+    ]
+    for method, path, kwargs in calls:
+        response = client.request(method.upper(), path, **kwargs)
+        is_json = response.headers.get("content-type", "").startswith("application/json")
+        body = strip_timestamps(response.json()) if is_json else response.text
+        report["responses"].append([method, path, response.status_code, body])
+    report["pool"] = client.get("/api/system/pool").json()["pool"]["pool_class"]
+print(json.dumps(report))
+'''
+
+
+def _run(mode, tmp_path):
+    env = dict(os.environ, DB_MODE=mode, DATABASE_URL=f"sqlite:///{tmp_path / mode}.db")
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT], env=env, check=True, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_async_mode_matches_sync_mode(tmp_path):
+    pytest.importorskip("aiosqlite")
+    sync_report = _run("sync", tmp_path)
+    async_report = _run("async", tmp_path)
+
+    assert sync_report["engines"] == [True, False]
+    assert async_report["engines"] == [False, True]
+    assert sync_report["duplicate_routes"] == async_report["duplicate_routes"] == 0
+    assert sync_report["pool"] == "TimedQueuePool"
+    assert async_report["pool"] == "TimedAsyncQueuePool"
+    assert all(status < 400 for _, _, status, _ in sync_report["responses"])
+    assert async_report["responses"] == sync_report["responses"]
@@ -0,0 +1,108 @@
+'''
+The entity cache behind GET /api/<entity>/{id} never serves a body older than
+the ETag sent with it, nor one older than a write made through another worker.
+Writes drop the entries they change, including the tasks embedding a user or project.
+'''
+import pytest
+from backend.cache import cache_backend, configure_cache, LRUTTLCache, MISSING
+
+
+TASK = {
+    "task_name": "Write docs",
+    "task_description": "d",
+    "status": "Doing",
+    "deadline": "2025-01-01T00:00:00Z",
+    "user_id": 1,
+    "project_id": 1,
+}
+
+
+def _create_task(client):
+    client.post("/api/user/", json={"name": "Alice", "email": "alice@example.com", "area": "a"})
+    client.post("/api/project/", json={"project_name": "Apollo", "project_description": "d"})
+    return client.post("/api/task/", json=TASK).json()["task_id"]
+
+
+def test_fill_racing_a_write_is_not_served_under_the_new_etag(client):
+    task_id = _create_task(client)
+    first = client.get(f"/api/task/{task_id}")
+    stale_entry = cache_backend().get("task", task_id)
+
+    assert client.put(f"/api/task/{task_id}", json={"task_name": "Renamed"}).status_code == 200
+    # A read that loaded the task before the write stores it after the write's invalidation
+    cache_backend().set("task", task_id, stale_entry)
+
+    second = client.get(f"/api/task/{task_id}", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert second.json()["task_name"] == "Renamed"
+    assert second.headers["etag"] != first.headers["etag"]
+    assert client.get(f"/api/task/{task_id}", headers={"If-None-Match": second.headers["etag"]}).status_code == 304
+
+
+@pytest.fixture
+def two_workers():
+    '''
+    Two in-process caches, as two uvicorn workers would have. configure_cache
+    switches which one the app uses.
+    '''
+    previous = cache_backend()
+    workers = [LRUTTLCache(), LRUTTLCache()]
+    yield workers
+    configure_cache(previous)
+
+
+@pytest.mark.parametrize("path, change", [
+    ("/api/user/1", ("/api/user/1", {"name": "Bob"})),
+    ("/api/project/1", ("/api/project/1", {"project_name": "Zeus"})),
+    # The task embeds its responsible user
+    ("/api/task/1", ("/api/user/1", {"name": "Bob"})),
+])
+def test_write_through_another_worker_is_seen_on_the_next_read(client, two_workers, path, change):
+    first_worker, second_worker = two_workers
+    _create_task(client)
+    configure_cache(first_worker)
+    before = client.get(path).json()
+
+    configure_cache(second_worker)
+    assert client.put(change[0], json=change[1]).status_code == 200
+
+    configure_cache(first_worker)
+    assert client.get(path).json() != before
+
+
+def test_cached_entry_is_served_while_the_tables_are_unchanged(client):
+    task_id = _create_task(client)
+    client.get(f"/api/task/{task_id}")
+    hits = cache_backend().stats()["hits"]
+
+    assert client.get(f"/api/task/{task_id}").json()["task_name"] == "Write docs"
+    assert cache_backend().stats()["hits"] == hits + 1
+
+
+@pytest.mark.parametrize("path, change", [
+    ("/api/user/1", ("put", "/api/user/1", {"name": "Bob"})),
+    ("/api/project/1", ("put", "/api/project/1", {"project_name": "Zeus"})),
+    ("/api/task/1", ("put", "/api/task/1", {"status": "Finished"})),
+    # The task embeds its project
+    ("/api/task/1", ("put", "/api/project/1", {"project_name": "Zeus"})),
+])
+def test_write_drops_the_cached_entry(client, path, change):
+    _create_task(client)
+    before = client.get(path).json()
+    invalidations = cache_backend().stats()["invalidations"]
+
+    method, change_path, body = change
+    assert client.request(method.upper(), change_path, json=body).status_code == 200
+
+    assert cache_backend().stats()["invalidations"] > invalidations
+    assert client.get(path).json() != before
+
+
+def test_deleted_entity_is_not_served_from_the_cache(client):
+    task_id = _create_task(client)
+    assert client.get(f"/api/task/{task_id}").status_code == 200
+
+    assert client.delete(f"/api/task/{task_id}").status_code == 200
+
+    assert cache_backend().get("task", task_id) is MISSING
+    assert client.get(f"/api/task/{task_id}").status_code == 404
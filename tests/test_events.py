@@ -0,0 +1,23 @@
+'''
+A subscriber that falls behind has its backlog replaced by a resync event and
+the end of its stream, whatever the configured queue size.
+'''
+import asyncio
+import pytest
+from backend.events import EventBroker, RESYNC_EVENT
+
+
+@pytest.mark.parametrize("queue_size", [1, 2, 5])
+def test_slow_subscriber_gets_resync_then_end(queue_size):
+    broker = EventBroker(queue_size=queue_size)
+
+    async def fall_behind():
+        async with broker.subscribe() as queue:
+            for task_id in range(10):
+                broker.publish("deleted", {"task_id": task_id}, task_id)
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    messages = asyncio.run(fall_behind())
+
+    assert messages == [RESYNC_EVENT, None]
+    assert broker.subscriber_count == 0 and broker.dropped == 1
@@ -0,0 +1,86 @@
+'''
+Request instrumentation: a Server-Timing header on every response, the
+Prometheus counters at /metrics, and slow statements logged to "backend.sql".
+The counters are process-wide, so the tests compare before and after.
+'''
+import logging
+import re
+import pytest
+from backend import instrumentation
+
+
+SERVER_TIMING = re.compile(r'^db;dur=[\d.]+;desc="(\d+) queries", serialize;dur=[\d.]+, total;dur=[\d.]+$')
+
+
+def _metrics(client):
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = {}
+    for line in response.text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+@pytest.fixture
+def user_id(client):
+    return client.post("/api/user/", json={"name": "Alice", "email": "alice@example.com", "area": "a"}).json()["user_id"]
+
+
+def test_server_timing_counts_the_queries(client, user_id, count_queries):
+    queries, response = count_queries(lambda: client.get(f"/api/user/{user_id}"))
+
+    match = SERVER_TIMING.match(response.headers["server-timing"])
+    assert match
+    assert int(match.group(1)) == queries > 0
+
+
+def test_server_timing_on_errors(client):
+    response = client.get("/api/user/999")
+
+    assert response.status_code == 404
+    assert SERVER_TIMING.match(response.headers["server-timing"])
+
+
+def test_requests_are_counted_by_route_template(client, user_id):
+    ok = 'http_requests_total{method="GET",route="/api/user/{user_id}",status="200"}'
+    not_found = 'http_requests_total{method="GET",route="/api/user/{user_id}",status="404"}'
+    queries = 'db_queries_total{method="GET",route="/api/user/{user_id}"}'
+    duration = 'http_request_duration_seconds_count{method="GET",route="/api/user/{user_id}"}'
+    before = _metrics(client)
+
+    client.get(f"/api/user/{user_id}")
+    client.get(f"/api/user/{user_id}")
+    client.get("/api/user/999")
+
+    after = _metrics(client)
+    assert after[ok] - before.get(ok, 0) == 2
+    assert after[not_found] - before.get(not_found, 0) == 1
+    assert after[duration] - before.get(duration, 0) == 3
+    assert after[queries] > before.get(queries, 0)
+    inf_bucket = 'http_request_duration_seconds_bucket{method="GET",route="/api/user/{user_id}",le="+Inf"}'
+    assert after[inf_bucket] == after[duration]
+
+
+def test_pool_and_slow_query_series_are_exported(client):
+    samples = _metrics(client)
+
+    for name in ("db_slow_queries_total", "db_pool_checkout_timeouts_total", "db_pool_checkout_wait_seconds_total"):
+        assert name in samples
+
+
+def test_slow_queries_are_logged_and_counted(client, user_id, monkeypatch, caplog):
+    before = _metrics(client)["db_slow_queries_total"]
+    monkeypatch.setattr(instrumentation, "SLOW_QUERY_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="backend.sql"):
+        client.get(f"/api/user/{user_id}")
+
+    monkeypatch.setattr(instrumentation, "SLOW_QUERY_MS", float("inf"))
+    assert _metrics(client)["db_slow_queries_total"] > before
+    messages = [record.getMessage() for record in caplog.records if record.name == "backend.sql"]
+    assert messages
+    assert all("/api/user/{user_id}" in message for message in messages)
+    assert all("alice@example.com" not in message for message in messages)
@@ -0,0 +1,73 @@
+'''
+GET /api/<entity>/lookup: ids and names starting with what was typed, any case,
+with the row whose id was typed listed first.
+'''
+import pytest
+
+
+def _create_users(client, *names):
+    for name in names:
+        email = f"{name.split()[0].lower()}@example.com"
+        assert client.post("/api/user/", json={"name": name, "email": email, "area": "a"}).status_code == 200
+
+
+def _lookup(client, prefix, **params):
+    response = client.get("/api/user/lookup", params={"prefix": prefix, **params})
+    assert response.status_code == 200
+    return [(item["id"], item["label"]) for item in response.json()]
+
+
+def test_prefix_matches_any_case_in_name_order(client):
+    _create_users(client, "Bob", "alice", "Alan")
+
+    assert _lookup(client, "al") == [(3, "Alan"), (2, "alice")]
+    assert _lookup(client, "AL") == [(3, "Alan"), (2, "alice")]
+    assert _lookup(client, "al", limit=1) == [(3, "Alan")]
+    assert _lookup(client, "") == [(3, "Alan"), (2, "alice"), (1, "Bob")]
+
+
+def test_digits_match_the_id_first(client):
+    _create_users(client, "Bob", "Carol", "2nd shift")
+
+    assert _lookup(client, "2") == [(2, "Carol"), (3, "2nd shift")]
+    assert _lookup(client, "3") == [(3, "2nd shift")]
+    assert _lookup(client, "1234567890") == []
+
+
+@pytest.mark.parametrize("prefix", ["²", "١", "0x1", chr(0x10FFFF), "a" + chr(0x10FFFF)])
+def test_any_prefix_is_answered(client, prefix):
+    _create_users(client, "Bob")
+
+    assert _lookup(client, prefix) == []
+
+
+@pytest.mark.parametrize("limit", [0, 101])
+def test_limit_is_bounded(client, limit):
+    assert client.get("/api/user/lookup", params={"limit": limit}).status_code == 422
+
+
+@pytest.mark.parametrize("entity, body", [
+    ("project", {"project_name": "Apollo", "project_description": "d"}),
+    ("task", {"task_name": "Apollo launch", "task_description": "d", "status": "Doing",
+              "deadline": "2025-01-01T00:00:00Z", "user_id": 1, "project_id": 1}),
+])
+def test_projects_and_tasks(client, entity, body):
+    _create_users(client, "Bob")
+    client.post("/api/project/", json={"project_name": "Apollo", "project_description": "d"})
+    if entity == "task":
+        client.post("/api/task/", json=body)
+
+    assert client.get(f"/api/{entity}/lookup", params={"prefix": "apo"}).json() == [{"id": 1, "label": body.get("project_name", body.get("task_name"))}]
+
+
+def test_unchanged_table_answers_304(client):
+    _create_users(client, "Bob")
+    first = client.get("/api/user/lookup", params={"prefix": "b"})
+
+    etag = {"If-None-Match": first.headers["etag"]}
+    assert client.get("/api/user/lookup", params={"prefix": "b"}, headers=etag).status_code == 304
+
+    _create_users(client, "Barbara")
+    again = client.get("/api/user/lookup", params={"prefix": "b"}, headers=etag)
+    assert again.status_code == 200
+    assert [item["label"] for item in again.json()] == ["Barbara", "Bob"]
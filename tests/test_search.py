@@ -0,0 +1,96 @@
+'''
+GET /api/task/search: tasks matching every word, name matches ranked above
+description matches, with the list filters and a cursor over the ranked results.
+'''
+import pytest
+from backend.routers import task_router
+
+
+TASKS = [
+    # (name, description, status, user_id, project_id)
+    ("Plan the release", "Checklist for the launch", "Doing", 1, 1),
+    ("Launch party", "Book the venue", "To-do", 2, 1),
+    ("Write docs", "Describe the launch of the API", "Finished", 1, 2),
+    ("Fix login", "Users cannot sign in", "Doing", 2, 2),
+    ("Launch the launch rocket", "launch launch", "Doing", 1, 2),
+]
+
+
+@pytest.fixture
+def tasks(client):
+    for name in ("Alice", "Bob"):
+        client.post("/api/user/", json={"name": name, "email": f"{name.lower()}@example.com", "area": "a"})
+    for name in ("Apollo", "Zeus"):
+        client.post("/api/project/", json={"project_name": name, "project_description": "d"})
+    for name, description, status, user_id, project_id in TASKS:
+        client.post("/api/task/", json={
+            "task_name": name, "task_description": description, "status": status,
+            "deadline": "2025-01-01T00:00:00Z", "user_id": user_id, "project_id": project_id,
+        })
+
+
+def _search(client, q, **params):
+    response = client.get("/api/task/search", params={"q": q, **params})
+    assert response.status_code == 200
+    return [task["task_id"] for task in response.json()], response.headers.get("x-next-cursor")
+
+
+@pytest.mark.parametrize("fast_serialization", [True, False])
+def test_name_matches_rank_above_description_matches(client, tasks, monkeypatch, fast_serialization):
+    monkeypatch.setattr(task_router, "FAST_SERIALIZATION", fast_serialization)
+
+    task_ids, _ = _search(client, "launch")
+
+    assert sorted(task_ids[:2]) == [2, 5]
+    assert sorted(task_ids[2:]) == [1, 3]
+
+
+def test_every_word_must_match_in_any_case(client, tasks):
+    assert _search(client, "LAUNCH api")[0] == [3]
+    assert _search(client, "sign users")[0] == [4]
+    assert _search(client, "launch nothing")[0] == []
+
+
+@pytest.mark.parametrize("q", ['"launch', "launch*", "-launch", "launch:name", "NEAR(", "'"])
+def test_search_syntax_is_taken_literally(client, tasks, q):
+    response = client.get("/api/task/search", params={"q": q})
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("filters, expected", [
+    ({"status": "Doing"}, [1, 5]),
+    ({"user_id": 2}, [2]),
+    ({"project_id": 2}, [3, 5]),
+    ({"user_id": 1, "project_id": 1}, [1]),
+])
+def test_filters(client, tasks, filters, expected):
+    assert sorted(_search(client, "launch", **filters)[0]) == expected
+
+
+def test_cursor_walks_the_ranked_results(client, tasks):
+    ranked, _ = _search(client, "launch")
+
+    first, cursor = _search(client, "launch", limit=3)
+    rest, last_cursor = _search(client, "launch", limit=3, after=cursor)
+
+    assert first + rest == ranked
+    assert last_cursor is None
+
+
+def test_search_follows_writes(client, tasks):
+    client.put("/api/task/4", json={"task_name": "Launch login"})
+    client.delete("/api/task/2")
+
+    assert sorted(_search(client, "launch")[0]) == [1, 3, 4, 5]
+    assert _search(client, "fix")[0] == []
+
+
+def test_unchanged_results_answer_304(client, tasks):
+    etag = client.get("/api/task/search", params={"q": "launch"}).headers["etag"]
+
+    assert client.get("/api/task/search", params={"q": "launch"}, headers={"If-None-Match": etag}).status_code == 304
+
+
+@pytest.mark.parametrize("params", [{}, {"q": ""}, {"q": "x" * 201}, {"q": "launch", "after": -1}])
+def test_bad_parameters_are_rejected(client, params):
+    assert client.get("/api/task/search", params=params).status_code == 422
@@ -0,0 +1,115 @@
+'''
+Bulk task writes (POST/PATCH/DELETE /api/task/bulk): one result per item in
+request order across batch boundaries, missing ids reported, all or nothing.
+'''
+from backend.counters import verify_counters
+
+
+TASK = {
+    "task_name": "Write docs",
+    "task_description": "d",
+    "status": "Doing",
+    "deadline": "2025-01-01T00:00:00",
+    "user_id": 1,
+    "project_id": 1,
+}
+
+
+def _create_users_and_projects(client):
+    for name in ("Alice", "Bob"):
+        client.post("/api/user/", json={"name": name, "email": f"{name}@example.com", "area": "a"})
+    for name in ("Apollo", "Zeus"):
+        client.post("/api/project/", json={"project_name": name, "project_description": "d"})
+
+
+def _bulk_create(client, count, batch_size=2):
+    tasks = [{**TASK, "task_name": f"Task {i}"} for i in range(count)]
+    response = client.post("/api/task/bulk", params={"batch_size": batch_size}, json=tasks)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _head(client):
+    return client.get("/api/task/changes/head").json()["token"]
+
+
+def test_bulk_create_across_batches(client, db):
+    _create_users_and_projects(client)
+
+    results = _bulk_create(client, 5)
+
+    assert [(r["index"], r["result"]) for r in results] == [(i, "created") for i in range(5)]
+    task_ids = [r["task_id"] for r in results]
+    assert [client.get(f"/api/task/{task_id}").json()["task_name"] for task_id in task_ids] == [f"Task {i}" for i in range(5)]
+    assert verify_counters(db) == {}
+
+
+def test_bulk_create_with_a_missing_user_saves_nothing(client):
+    _create_users_and_projects(client)
+    tasks = [TASK, TASK, {**TASK, "user_id": 99}]
+
+    response = client.post("/api/task/bulk", params={"batch_size": 2}, json=tasks)
+
+    assert response.status_code == 400
+    assert client.get("/api/task/").json() == []
+
+
+def test_bulk_update_reports_each_item(client, db):
+    _create_users_and_projects(client)
+    ids = [r["task_id"] for r in _bulk_create(client, 3)]
+    token = _head(client)
+
+    results = client.patch("/api/task/bulk", params={"batch_size": 2}, json=[
+        {"task_id": ids[0], "status": "Finished"},
+        {"task_id": 999, "status": "Finished"},
+        # Same values as stored
+        {"task_id": ids[1], "status": "Doing", "user_id": 1, "deadline": "2025-01-01T00:00:00Z"},
+        {"task_id": ids[2], "user_id": 2, "project_id": 2},
+        {"task_id": ids[2]},
+    ]).json()
+
+    assert [(r["index"], r["task_id"], r["result"]) for r in results] == [
+        (0, ids[0], "updated"),
+        (1, 999, "not_found"),
+        (2, ids[1], "unchanged"),
+        (3, ids[2], "updated"),
+        (4, ids[2], "unchanged"),
+    ]
+    assert client.get(f"/api/task/{ids[0]}").json()["status"] == "Finished"
+    assert client.get(f"/api/task/{ids[2]}").json()["responsible"]["name"] == "Bob"
+    # One change for the whole request, listing only the updated tasks
+    assert _head(client) == token + 1
+    changes = client.get("/api/task/changes", params={"since": token}).json()
+    assert sorted(task["task_id"] for task in changes["upserted"]) == [ids[0], ids[2]]
+    assert verify_counters(db) == {}
+
+
+def test_bulk_update_changing_nothing_is_not_a_change(client):
+    _create_users_and_projects(client)
+    ids = [r["task_id"] for r in _bulk_create(client, 2)]
+    token = _head(client)
+
+    results = client.patch("/api/task/bulk", json=[
+        {"task_id": ids[0], "task_name": "Task 0"},
+        {"task_id": ids[1], "status": "Doing"},
+    ]).json()
+
+    assert [r["result"] for r in results] == ["unchanged", "unchanged"]
+    assert _head(client) == token
+
+
+def test_bulk_delete_across_batches(client, db):
+    _create_users_and_projects(client)
+    ids = [r["task_id"] for r in _bulk_create(client, 3)]
+    token = _head(client)
+
+    results = client.request("DELETE", "/api/task/bulk", params={"batch_size": 2}, json=[ids[0], 999, ids[2]]).json()
+
+    assert [(r["index"], r["task_id"], r["result"]) for r in results] == [
+        (0, ids[0], "deleted"),
+        (1, 999, "not_found"),
+        (2, ids[2], "deleted"),
+    ]
+    assert [task["task_id"] for task in client.get("/api/task/").json()] == [ids[1]]
+    assert sorted(client.get("/api/task/changes", params={"since": token}).json()["deleted"]) == [ids[0], ids[2]]
+    assert verify_counters(db) == {}
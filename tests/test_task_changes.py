@@ -0,0 +1,68 @@
+'''
+A full delta sync (GET /api/task/changes?since=0) returns every task, including
+the tasks written before change tracking existed and the benchmark seed.
+'''
+from sqlalchemy import text
+from backend.migrate import upgrade
+from benchmarks.seed import reset, seed
+
+
+def _insert_task(connection):
+    connection.execute(text(
+        "INSERT INTO user_table (user_id, name, email, area, created_at) "
+        "VALUES (1, 'Alice', 'a@example.com', 'a', '2025-01-01 00:00:00')"
+    ))
+    connection.execute(text(
+        "INSERT INTO project_table (project_id, project_name, project_description, created_at) "
+        "VALUES (1, 'Apollo', 'd', '2025-01-01 00:00:00')"
+    ))
+    connection.execute(text(
+        "INSERT INTO task_table (task_id, task_name, task_description, status, deadline, project_id, user_id) "
+        "VALUES (1, 'Write docs', 'd', 'Doing', '2025-01-01 00:00:00', 1, 1)"
+    ))
+
+
+def _synced_task_ids(client):
+    response = client.get("/api/task/changes", params={"since": 0})
+    assert response.status_code == 200
+    return [task["task_id"] for task in response.json()["upserted"]]
+
+
+def test_tasks_created_before_change_tracking_are_synced(database, client):
+    reset(database)
+    upgrade(database, target=3)
+    with database.begin() as connection:
+        _insert_task(connection)
+    upgrade(database)
+
+    assert _synced_task_ids(client) == [1]
+
+
+def test_tasks_left_unstamped_by_an_earlier_upgrade_are_synced(database, client):
+    reset(database)
+    upgrade(database, target=4)
+    with database.begin() as connection:
+        _insert_task(connection)
+        # What version 4 left behind before it stamped the existing tasks
+        connection.execute(text("UPDATE task_table SET change_seq = 0"))
+    upgrade(database)
+
+    assert _synced_task_ids(client) == [1]
+
+
+def test_seeded_tasks_are_synced(database, client):
+    seed(database, users=3, projects=2, tasks=20, migrate=False)
+
+    assert sorted(_synced_task_ids(client)) == list(range(1, 21))
+
+
+def test_head_token_skips_the_existing_changes(database, client):
+    seed(database, users=3, projects=2, tasks=20, migrate=False)
+    token = client.get("/api/task/changes/head").json()["token"]
+
+    changes = client.get("/api/task/changes", params={"since": token}).json()
+    assert changes["upserted"] == [] and changes["deleted"] == []
+
+    client.delete("/api/task/1")
+    assert client.get("/api/task/changes/head").json()["token"] == token + 1
+    assert client.get("/api/task/changes", params={"since": token}).json()["deleted"] == [1]
@@ -0,0 +1,73 @@
+'''
+Listing tasks must not issue one query per task for its project and responsible
+user: the statement count is the same for 10 and 1,000 tasks.
+'''
+from datetime import datetime
+import pytest
+from sqlalchemy import insert, func, select
+from backend import crud
+from backend.routers import task_router
+from backend.models.user_model import UserModel
+from backend.models.project_model import ProjectModel
+from backend.models.task_model import TaskModel
+from backend.schemas.task_schema import TaskResponse
+
+SIZES = [10, 1000]
+
+
+def _grow_to(engine, tasks):
+    '''
+    Add tasks until there are "tasks" of them, each with a user and a project of
+    its own, so that lazy loading would show up once per task
+    '''
+    with engine.begin() as connection:
+        seeded = connection.execute(select(func.count()).select_from(TaskModel)).scalar_one()
+        new_ids = range(seeded + 1, tasks + 1)
+        connection.execute(insert(UserModel), [
+            {"user_id": i, "name": f"User {i}", "email": f"user{i}@example.com", "area": "Data", "created_at": datetime(2025, 1, 1)}
+            for i in new_ids
+        ])
+        connection.execute(insert(ProjectModel), [
+            {"project_id": i, "project_name": f"Project {i}", "project_description": "d", "created_at": datetime(2025, 1, 1)}
+            for i in new_ids
+        ])
+        connection.execute(insert(TaskModel), [
+            {"task_id": i, "task_name": f"Task {i}", "task_description": "d", "status": "Doing",
+             "deadline": datetime(2025, 1, 1), "project_id": i, "user_id": i}
+            for i in new_ids
+        ])
+
+
+@pytest.mark.parametrize("reader", [crud.get_all_tasks, crud.get_all_task_rows])
+def test_get_all_tasks_query_count_is_constant(database, db, count_queries, reader):
+    counts = []
+    for tasks in SIZES:
+        _grow_to(database, tasks)
+        db.expire_all()
+
+        def list_and_serialize():
+            page, _ = reader(db, limit=crud.MAX_PAGE_SIZE)
+            return [TaskResponse.model_validate(task, from_attributes=True).model_dump() for task in page]
+
+        count, listed = count_queries(list_and_serialize)
+        assert len(listed) == tasks
+        counts.append(count)
+
+    assert counts[0] == counts[1]
+    assert counts[1] == 1
+
+
+@pytest.mark.parametrize("fast_serialization", [True, False])
+def test_list_route_query_count_is_constant(database, client, count_queries, monkeypatch, fast_serialization):
+    monkeypatch.setattr(task_router, "FAST_SERIALIZATION", fast_serialization)
+    counts = []
+    for tasks in SIZES:
+        _grow_to(database, tasks)
+
+        count, response = count_queries(lambda: client.get("/api/task/", params={"limit": crud.MAX_PAGE_SIZE}))
+        assert response.status_code == 200
+        assert len(response.json()) == tasks
+        counts.append(count)
+
+    assert counts[0] == counts[1]
+    assert counts[1] <= 2